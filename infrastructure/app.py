@@ -1,84 +1,149 @@
 #!/usr/bin/env python3
 
 import sys
+from dataclasses import replace
 
 import aws_cdk as cdk
 
-from config.config import DEV_ACCOUNTS_PARAMS
-from src.auth.stacks.auth_stack import AuthStack
-from src.integration.stacks.integration_stack import IntegrationStack
-from src.members.stacks.members_stack import MembersStack
-from src.parkings.stacks.parkings_stack import ParkingsStack
-from src.payments.stacks.payments_stack import PaymentsStack
-
-app = cdk.App()
-
-# コマンドライン引数（コンテキスト）から環境を取得
-phase = app.node.try_get_context("phase")
-env_name = app.node.try_get_context("env_name")
-account = app.node.try_get_context("account")
-
-# コンテキスト値の検証
-try:
-    # 必須パラメータの存在チェック
-    if not phase:
-        raise ValueError(
-            "Missing required context parameter: phase (e.g. -c phase=DEV)"
+from config import config
+from src.common.aspects.template_budget_aspect import TemplateBudgetAspect
+from src.common.constructs.network_construct import VPC_MAX_AZS
+from src.common.network.cidr_allocator import validate_cidr_plan
+from src.common.synth.app_context import get_bool_context, get_worker_count_context
+from src.common.synth.incremental_synth import incremental_synth
+from src.common.synth.lookup_cache import load_lookup_cache, verify_offline_lookups
+from src.common.synth.profiler import SynthProfiler
+from src.common.synth.stack_registry import STACK_DEFINITIONS, build_stack, parse_stack_selection
+
+
+def main() -> None:
+    # コミット済みのルックアップキャッシュをコンテキストとして読み込む
+    try:
+        lookup_cache = load_lookup_cache()
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+    app = cdk.App(context=lookup_cache)
+
+    # コマンドライン引数（コンテキスト）から環境を取得
+    phase = app.node.try_get_context("phase")
+    # 作成対象のスタック (例: -c stacks=parkings,auth)。未指定の場合は全スタック
+    stacks = app.node.try_get_context("stacks")
+    # ルックアップキャッシュのみで synth する (キャッシュミスはエラー) 場合は -c lookup_offline=true
+    lookup_offline = get_bool_context(app, "lookup_offline")
+    # Construct ごとの synth 所要時間を計測する場合は -c profile=true
+    profile = get_bool_context(app, "profile")
+    # 入力が前回から変わっていないスタックも含め、全スタックを synth し直す場合は -c full_synth=true
+    full_synth = get_bool_context(app, "full_synth")
+    # テンプレート予算の超過時の動作 (warn or fail)。未指定の場合は config の設定値
+    template_budget_action = app.node.try_get_context("template_budget_action")
+
+    # コンテキスト値の検証
+    try:
+        # 必須パラメータの存在チェック
+        if not phase:
+            raise ValueError(
+                "Missing required context parameter: phase (e.g. -c phase=DEV)"
+            )
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+    # 環境ごとのパラメータを読み込む
+    try:
+        if phase not in ["DEV", "STG", "PROD"]:
+            raise ValueError(f"Unsupported phase: {phase}")
+        props = getattr(config, f"{phase}_ACCOUNTS_PARAMS", {})
+        if not props:
+            raise ValueError(f"No configuration found for {phase}")
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+    # 全基盤・全フェーズの VPC・サブネットの CIDR が重複しないことを検証する
+    # (移行前の CIDR を維持している VPC が関わる重複は、config で意図的に維持しているため件数のみ表示する)
+    legacy_vpc_cidrs = config.legacy_vpc_cidrs()
+    try:
+        cidr_warnings = validate_cidr_plan(az_count=VPC_MAX_AZS, legacy_vpc_cidrs=legacy_vpc_cidrs)
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    if cidr_warnings:
+        legacy_vpcs = ", ".join(f"{legacy_env_name}/{legacy_phase}" for legacy_env_name, legacy_phase in sorted(legacy_vpc_cidrs))
+        print(
+            f"Warning: [CidrPlan] {len(cidr_warnings)} CIDR overlaps involve VPCs on legacy_vpc_cidr ({legacy_vpcs}); "
+            "see README \"既存の VPC の移行手順\"",
+            file=sys.stderr,
+        )
+
+    # 作成対象スタックの選択と、対象基盤のパラメータ生成（対象外の基盤の環境変数は不要）
+    try:
+        target_env_names = parse_stack_selection(stacks)
+        target_props = props.resolve(target_env_names)
+        # スタックを並列に synth するワーカープロセス数 (例: -c synth_workers=auto で CPU コア数)
+        synth_workers = get_worker_count_context(app, "synth_workers")
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+    # テンプレートのサイズ・リソース数を予算と比較する
+    template_budget = config.TEMPLATE_BUDGET
+    if template_budget_action:
+        if template_budget_action not in ("warn", "fail"):
+            print(f"Error: Unsupported template_budget_action: {template_budget_action} (warn or fail)")
+            sys.exit(1)
+        template_budget = replace(template_budget, action=template_budget_action)
+
+    if profile:
+        # プロファイリング時は、対象スタックのモジュールをインポートした上で、1つの App で Construct の生成を計測する
+        for target_env_name in target_env_names:
+            STACK_DEFINITIONS[target_env_name].load_class()
+        profiler = SynthProfiler()
+        profiler.install()
+
+        # スタック作成（選択された基盤のモジュールのみインポートする）
+        for target_env_name in target_env_names:
+            build_stack(app, target_env_name, target_props[target_env_name])
+
+        template_budget_aspect = TemplateBudgetAspect(template_budget)
+        cdk.Aspects.of(app).add(template_budget_aspect)
+
+        with profiler.measure("synth"):
+            app.synth()
+        profiler.report(app.outdir)
+        budget_violations = template_budget_aspect.write_report(app.outdir)
+    else:
+        # 入力のフィンガープリントが前回と一致するスタックは .cdk.local/synth-cache の synth 結果を再利用し、
+        # 変更のあったスタックのみを synth して cdk.out にマージする（full_synth の場合は全スタックを synth し直す）
+        # synth_workers が2以上の場合は、スタックごとに別プロセスで並列に synth する
+        result = incremental_synth(
+            phase,
+            target_env_names,
+            target_props,
+            outdir=app.outdir,
+            context=app.node.get_all_context(),
+            template_budget=template_budget,
+            force=full_synth,
+            workers=synth_workers,
         )
-except ValueError as e:
-    print(f"Error: {e}")
-    sys.exit(1)
-
-# 環境ごとのパラメータを読み込む
-try:
-    if phase not in ["DEV", "STG", "PROD"]:
-        raise ValueError(f"Unsupported phase: {phase}")
-    props = globals().get(f"{phase}_ACCOUNTS_PARAMS", {})
-    if not props:
-        raise ValueError(f"No configuration found for {phase}")
-except ValueError as e:
-    print(f"Error: {e}")
-    sys.exit(1)
-
-# スタック作成
-members_props = props.get("members")
-MembersStack(
-    app,
-    "MembersStack",
-    props=members_props,
-    env={"account": members_props.account_id, "region": members_props.region},
-)
-
-parkings_props = props.get("parkings")
-ParkingsStack(
-    app,
-    "ParkingsStack",
-    props=parkings_props,
-    env={"account": parkings_props.account_id, "region": parkings_props.region},
-)
-
-payments_props = props.get("payments")
-PaymentsStack(
-    app,
-    "PaymentsStack",
-    props=payments_props,
-    env={"account": payments_props.account_id, "region": payments_props.region},
-)
-
-auth_props = props.get("auth")
-AuthStack(
-    app,
-    "AuthStack",
-    props=auth_props,
-    env={"account": auth_props.account_id, "region": auth_props.region},
-)
-
-integration_props = props.get("integration")
-IntegrationStack(
-    app,
-    "IntegrationStack",
-    props=integration_props,
-    env={"account": integration_props.account_id, "region": integration_props.region},
-)
-
-app.synth()
+        budget_violations = result.budget_violations
+
+    # 予算の使用状況は cdk.out/template-budget-report.json に出力し、超過があれば警告（fail の場合はエラー）
+    for violation in budget_violations:
+        print(f"Warning: [TemplateBudget] {violation}", file=sys.stderr)
+    if budget_violations and template_budget.action == "fail":
+        sys.exit(1)
+
+    # オフラインモードではキャッシュミスしたルックアップ（ダミー値で synth されたもの）をエラーとする
+    if lookup_offline:
+        try:
+            verify_offline_lookups(app.outdir)
+        except ValueError as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+
+
+# 並列 synth のワーカープロセス (spawn) が本モジュールを再度 import するため、直接実行時のみ synth する
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,229 @@
+"""全スタックの synth 所要時間を計測するベンチマーク.
+
+スタブのアカウントIDとルックアップキャッシュのみを使用するため、AWS 認証情報・ネットワークなしで実行できる。
+テンプレートサイズ・リソース数 (決定的な値) は JSON に保存してコミットし、レビュー時に差分で変化を確認する。
+所要時間はマシンの負荷で変動するため、コミットせずローカル (.cdk.local) に保存し、前回の計測と比較する。
+
+    python3 -m benchmarks.synth_benchmark --phase DEV --iterations 3
+    python3 -m benchmarks.synth_benchmark --baseline benchmarks/results/synth_benchmark.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter
+from typing import Callable, Dict, List, Optional, Tuple
+
+import aws_cdk as cdk
+
+from config import config
+from src.common.synth.app_context import load_cdk_json_context
+from src.common.synth.lookup_cache import DEFAULT_LOOKUP_CACHE_PATH, load_lookup_cache, verify_offline_lookups
+from src.common.synth.stack_registry import STACK_DEFINITIONS, build_stack, parse_stack_selection
+
+RESULT_VERSION = 2
+DEFAULT_OUTPUT_PATH = os.path.join("benchmarks", "results", "synth_benchmark.json")
+DEFAULT_TIMINGS_PATH = os.path.join(".cdk.local", "benchmarks", "synth_timings.json")
+STUB_LOOKUP_CACHE_PATH = os.path.join("benchmarks", "lookup_cache.stub.json")
+
+# ベンチマーク用のスタブアカウントID
+STUB_ACCOUNT_IDS = {
+    "members": "100000000001",
+    "parkings": "100000000002",
+    "payments": "100000000003",
+    "auth": "100000000004",
+    "integration": "100000000005",
+}
+
+# 計測するフェーズ
+TIMING_KEYS = ("config_load_ms", "construct_ms", "synth_ms", "total_ms")
+# テンプレートから集計する決定的な値 (コミットする結果に含める)
+TEMPLATE_KEYS = ("template_bytes", "resource_count", "parameter_count", "output_count", "resources_by_type")
+
+
+#########################
+#      ヘルパー関数       #
+#########################
+def use_stub_accounts(phase: str) -> None:
+    """アカウントIDの環境変数をスタブの値に設定する."""
+    for env_name, account_id in STUB_ACCOUNT_IDS.items():
+        os.environ[f"NPC_{env_name.upper()}_{phase.upper()}_ACCOUNT"] = account_id
+
+
+def timed(func: Callable) -> Tuple[object, float]:
+    """関数を実行し、戻り値と経過時間 (ミリ秒) を返す."""
+    start = time.perf_counter()
+    result = func()
+    return result, (time.perf_counter() - start) * 1000
+
+
+def measure_runtime_startup_ms() -> float:
+    """新しいインタプリタで aws_cdk のインポートと jsii カーネルの起動にかかる時間を計測する."""
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-c", "import aws_cdk; aws_cdk.App()"], check=True, capture_output=True)
+    return (time.perf_counter() - start) * 1000
+
+
+def summarize_template(template_path: str) -> Dict[str, object]:
+    """テンプレートのサイズとリソース数を集計する."""
+    with open(template_path, encoding="utf-8") as f:
+        body = f.read()
+    template = json.loads(body)
+    resource_types = Counter(resource["Type"] for resource in template.get("Resources", {}).values())
+    return {
+        "template_bytes": len(body.encode("utf-8")),
+        "resource_count": sum(resource_types.values()),
+        "parameter_count": len(template.get("Parameters", {})),
+        "output_count": len(template.get("Outputs", {})),
+        "resources_by_type": dict(sorted(resource_types.items())),
+    }
+
+
+def run_once(env_name: str, phase: str, context: Dict[str, object], workdir: str) -> Dict[str, object]:
+    """1スタック分の config 読み込み・Construct 生成・synth を計測する."""
+    definition = STACK_DEFINITIONS[env_name]
+
+    # 毎回新しいレジストリを生成し、キャッシュされていない状態の読み込み時間を計測する
+    props, config_load_ms = timed(lambda: config.build_accounts_params(phase.lower())[env_name])
+
+    app = cdk.App(outdir=tempfile.mkdtemp(dir=workdir), context=context)
+    _, construct_ms = timed(lambda: build_stack(app, env_name, props))
+    assembly, synth_ms = timed(app.synth)
+    verify_offline_lookups(assembly.directory)
+
+    return {
+        "config_load_ms": config_load_ms,
+        "construct_ms": construct_ms,
+        "synth_ms": synth_ms,
+        "total_ms": config_load_ms + construct_ms + synth_ms,
+        **summarize_template(os.path.join(assembly.directory, f"{definition.stack_id}.template.json")),
+    }
+
+
+def benchmark_stack(
+    env_name: str, phase: str, context: Dict[str, object], iterations: int, workdir: str
+) -> Tuple[Dict[str, object], Dict[str, object]]:
+    """1スタック分のベンチマークを指定回数実行し、テンプレートの集計値と所要時間の中央値・最小値を返す."""
+    # モジュールの初回インポート時間は 1 回目のみ発生するため、別項目として計測する
+    _, import_ms = timed(STACK_DEFINITIONS[env_name].load_class)
+
+    runs = [run_once(env_name, phase, context, workdir) for _ in range(iterations)]
+
+    timings: Dict[str, object] = {"import_ms": round(import_ms, 1)}
+    for key in TIMING_KEYS:
+        values = [run[key] for run in runs]
+        timings[key] = {"median": round(statistics.median(values), 1), "min": round(min(values), 1)}
+    return {key: runs[-1][key] for key in TEMPLATE_KEYS}, timings
+
+
+def compare_with_baseline(current: Dict[str, object], baseline: Dict[str, object]) -> None:
+    """コミット済みの結果と比較し、テンプレートサイズ・リソース数の差分を表示する."""
+    print(f"{'stack':<12} {'template_bytes':>24} {'resources':>14}")
+    for env_name, stats in current["stacks"].items():
+        base = baseline.get("stacks", {}).get(env_name)
+        if not base:
+            print(f"{env_name:<12} (no baseline)")
+            continue
+        print(
+            f"{env_name:<12} {base['template_bytes']:>10} -> {stats['template_bytes']:>9}"
+            f" {base['resource_count']:>5} -> {stats['resource_count']:>4}"
+        )
+
+
+def compare_timings(current: Dict[str, object], baseline: Dict[str, object], threshold: float) -> List[str]:
+    """前回の所要時間と比較し、差分を表示して閾値を超えて遅くなったスタックを返す."""
+    regressions = []
+    print(f"{'stack':<12} {'total_ms':>20}")
+    for env_name, stats in current["stacks"].items():
+        base = baseline.get("stacks", {}).get(env_name)
+        if not base:
+            print(f"{env_name:<12} (no baseline)")
+            continue
+        now_ms, base_ms = stats["total_ms"]["median"], base["total_ms"]["median"]
+        ratio = (now_ms - base_ms) / base_ms if base_ms else 0.0
+        print(f"{env_name:<12} {base_ms:>8.0f} -> {now_ms:>6.0f} ({ratio:+.0%})")
+        if ratio > threshold:
+            regressions.append(env_name)
+    return regressions
+
+
+def load_json(path: Optional[str]) -> Optional[Dict[str, object]]:
+    """JSON を読み込む. ファイルが無い場合は None を返す."""
+    if not path or not os.path.exists(path):
+        return None
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def write_json(path: str, data: Dict[str, object]) -> None:
+    """JSON を差分が安定するよう整形して書き込む."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+#########################
+#        CLI            #
+#########################
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="全スタックの synth 所要時間ベンチマーク")
+    parser.add_argument("--phase", default="DEV", help="計測するフェーズ (DEV, STG, PROD)")
+    parser.add_argument("--stacks", default=None, help="計測対象の基盤名 (カンマ区切り、未指定の場合は全スタック)")
+    parser.add_argument("--iterations", type=int, default=3, help="スタックごとの計測回数")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT_PATH, help="テンプレートの集計値を保存する JSON のパス (コミット対象)")
+    parser.add_argument("--timings-output", default=DEFAULT_TIMINGS_PATH, help="所要時間を保存する JSON のパス (コミット対象外)")
+    parser.add_argument("--baseline", default=None, help="比較対象の結果 JSON のパス")
+    parser.add_argument("--baseline-timings", default=None, help="比較対象の所要時間 JSON のパス (前回の計測結果)")
+    parser.add_argument("--threshold", type=float, default=0.2, help="回帰とみなす total_ms の増加率")
+    args = parser.parse_args(argv)
+
+    use_stub_accounts(args.phase)
+    context = {
+        **load_cdk_json_context(),
+        **load_lookup_cache(DEFAULT_LOOKUP_CACHE_PATH),
+        **load_lookup_cache(STUB_LOOKUP_CACHE_PATH),
+        "phase": args.phase,
+    }
+    # 出力先と同じパスを比較対象に指定できるよう、計測前に読み込む
+    baseline = load_json(args.baseline)
+    baseline_timings = load_json(args.baseline_timings)
+
+    result = {"version": RESULT_VERSION, "phase": args.phase, "stacks": {}}
+    timings = {
+        "version": RESULT_VERSION,
+        "phase": args.phase,
+        "iterations": args.iterations,
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+        },
+        "runtime_startup_ms": round(measure_runtime_startup_ms(), 1),
+        "stacks": {},
+    }
+    with tempfile.TemporaryDirectory() as workdir:
+        for env_name in parse_stack_selection(args.stacks):
+            result["stacks"][env_name], timings["stacks"][env_name] = benchmark_stack(
+                env_name, args.phase, context, args.iterations, workdir
+            )
+            print(f"{env_name}: {timings['stacks'][env_name]['total_ms']['median']} ms", file=sys.stderr)
+
+    write_json(args.output, result)
+    write_json(args.timings_output, timings)
+    print(f"Results written to {args.output} (timings: {args.timings_output})", file=sys.stderr)
+
+    if baseline:
+        compare_with_baseline(result, baseline)
+    if baseline_timings and compare_timings(timings, baseline_timings, args.threshold):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,6 +1,8 @@
 import os
-from dataclasses import asdict, dataclass
-from typing import Type, TypeVar
+import re
+from collections.abc import Mapping
+from dataclasses import asdict, dataclass, field
+from typing import Callable, Dict, Iterable, Iterator, Optional, Tuple, Type, TypeVar
 
 #########################
 # 　 全環境共通の型定義    #
@@ -20,12 +22,353 @@ class AppParameter:
     domain_name: str
 
 
+@dataclass(frozen=True)
+class VpcEndpointParameter:
+    """VPC エンドポイントの作成有無 (インターフェイス型は AZ・時間ごとに課金されるため、基盤ごとに必要なもののみ有効にする)."""
+
+    # インターフェイス型 (プライベート DNS を有効にし、プライベートサブネットから NAT を経由せずに AWS API を呼び出す)
+    secrets_manager: bool = False
+    ecr: bool = False
+    ecr_docker: bool = False
+    logs: bool = False
+    sts: bool = False
+    ssm: bool = False
+    kms: bool = False
+    sqs: bool = False
+    # ゲートウェイ型 (無料)
+    dynamodb: bool = False
+
+
+# プライベートサブネットからインターネットへの経路
+# ("none": なし, "single_nat": NAT ゲートウェイ1台 (AZ を跨ぐ経路あり),
+#  "nat_per_az": AZ ごとの NAT ゲートウェイ, "nat_instance": AZ ごとの Graviton の NAT インスタンス)
+EGRESS_NONE = "none"
+EGRESS_SINGLE_NAT = "single_nat"
+EGRESS_NAT_PER_AZ = "nat_per_az"
+EGRESS_NAT_INSTANCE = "nat_instance"
+EGRESS_MODES = (EGRESS_NONE, EGRESS_SINGLE_NAT, EGRESS_NAT_PER_AZ, EGRESS_NAT_INSTANCE)
+
+
+@dataclass(frozen=True)
+class CidrMigrationParameter:
+    """legacy_vpc_cidr から基盤・フェーズごとの CIDR への VPC の移行 (README「VPC の CIDR」) のパラメータ.
+
+    VPC とともに置き換わるリソース (セキュリティグループ・DB サブネットグループ・Aurora・RDS Proxy 等) の物理名に
+    接尾辞を付与し、CloudFormation が新旧のリソースを並行して作成できるようにする。
+    移行後に接尾辞・スナップショットを変更するとリソースが再度置き換わるため、移行後も維持する。
+    """
+
+    # 物理名に付与する接尾辞 (例: "-v2")
+    name_suffix: str
+    # 新しい Aurora クラスターの復元元の手動スナップショット。None の場合は空のクラスターを作成する
+    db_snapshot_identifier: Optional[str] = None
+
+    def __post_init__(self) -> None:
+        if not re.match(r"^-[a-z0-9]{1,8}$", self.name_suffix):
+            raise ValueError(f"name_suffix はハイフンと英小文字・数字 (8文字以内) で指定してください: {self.name_suffix}")
+
+
+# VPC フローログの対象トラフィック
+FLOW_LOG_TRAFFIC_TYPES = ("ALL", "ACCEPT", "REJECT")
+
+
+@dataclass(frozen=True)
+class FlowLogParameter:
+    """VPC フローログ (S3 に Parquet・時間単位の Hive 形式のパーティションで出力し、Glue テーブルから Athena で分析する) のパラメータ."""
+
+    traffic_type: str = "ALL"
+    # 集約間隔 (秒)。60 は AZ 間・エンドポイントを経由しない通信の調査向け、600 はレコード数 (コスト) を抑える
+    max_aggregation_interval_seconds: int = 600
+    # S3 のオブジェクトの保持期間 (日)
+    retention_days: int = 30
+
+    def __post_init__(self) -> None:
+        if self.traffic_type not in FLOW_LOG_TRAFFIC_TYPES:
+            raise ValueError(f"traffic_type は {', '.join(FLOW_LOG_TRAFFIC_TYPES)} から指定してください: {self.traffic_type}")
+        if self.max_aggregation_interval_seconds not in (60, 600):
+            raise ValueError(f"max_aggregation_interval_seconds は 60 または 600 を指定してください: {self.max_aggregation_interval_seconds}")
+        if self.retention_days < 1:
+            raise ValueError(f"retention_days は1以上を指定してください: {self.retention_days}")
+
+
+# VPC Lattice のサービスネットワーク・サービスの認証タイプ
+LATTICE_AUTH_TYPES = ("AWS_IAM", "NONE")
+
+
+@dataclass(frozen=True)
+class ServiceNetworkParameter:
+    """基盤間のプライベートな通信に使用する VPC Lattice のサービスネットワーク (ServiceNetworkConstruct) のパラメータ.
+
+    サービスネットワークは中央アカウント (Parkings) で作成し、RAM で他の基盤のアカウントに共有する。
+    """
+
+    # 中央アカウントのサービスネットワークの ID (sn-xxxx)。中央アカウント以外の基盤で、Parkings のデプロイ後に設定する
+    service_network_id: Optional[str] = None
+    # AWS_IAM の場合、呼び出し元は SigV4 で署名し、認証ポリシーで許可したアカウントのみ呼び出し可能とする
+    auth_type: str = "AWS_IAM"
+    # アカウントが同じ AWS Organizations に属さない場合は True (共有先のアカウントで RAM の招待の承諾が必要)
+    allow_external_principals: bool = False
+
+    def __post_init__(self) -> None:
+        if self.auth_type not in LATTICE_AUTH_TYPES:
+            raise ValueError(f"auth_type は {', '.join(LATTICE_AUTH_TYPES)} から指定してください: {self.auth_type}")
+        if self.service_network_id is not None and not re.match(r"^sn-[0-9a-z]{17}$", self.service_network_id):
+            raise ValueError(f"service_network_id の形式が不正です: {self.service_network_id}")
+
+
+@dataclass(frozen=True)
+class NetworkParameter:
+    """VPC (NetworkConstruct) のパラメータ."""
+
+    vpc_endpoints: VpcEndpointParameter = VpcEndpointParameter()
+    # インターネットへの経路 (EGRESS_MODES)。本番は AZ を跨がない nat_per_az / nat_instance とする
+    egress_mode: str = EGRESS_NONE
+    # nat_instance の場合のインスタンスタイプ (Graviton)
+    nat_instance_type: str = "t4g.nano"
+    # VPC Lattice のサービスネットワークへの参加 (None の場合は参加しない)
+    service_network: Optional[ServiceNetworkParameter] = None
+    # VPC フローログ (None の場合は出力しない)
+    flow_logs: Optional[FlowLogParameter] = None
+    # 移行前の VPC の CIDR (/16)。基盤・フェーズごとの CIDR への移行 (README「VPC の CIDR」) が完了するまで既存の範囲を維持する
+    legacy_vpc_cidr: Optional[str] = None
+    # 移行時のリソースの物理名の変更・Aurora の復元 (legacy_vpc_cidr を削除するデプロイで設定する)
+    cidr_migration: Optional[CidrMigrationParameter] = None
+
+    def __post_init__(self) -> None:
+        if self.egress_mode not in EGRESS_MODES:
+            raise ValueError(f"egress_mode は {', '.join(EGRESS_MODES)} から指定してください: {self.egress_mode}")
+        if not re.match(r"^[a-z]+\d+g[a-z]*\.", self.nat_instance_type):
+            raise ValueError(f"nat_instance_type は Graviton のインスタンスタイプを指定してください: {self.nat_instance_type}")
+        if self.legacy_vpc_cidr is not None and not re.match(r"^10\.\d{1,3}\.0\.0/16$", self.legacy_vpc_cidr):
+            raise ValueError(f"legacy_vpc_cidr は 10.x.0.0/16 の形式で指定してください: {self.legacy_vpc_cidr}")
+        if self.legacy_vpc_cidr is not None and self.cidr_migration is not None:
+            raise ValueError("cidr_migration は legacy_vpc_cidr を削除して移行する際に指定してください")
+
+
 @dataclass(frozen=True)
 class ServiceParameter(AppParameter):
     """全基盤で共通の、アカウントに紐づくパラメータ."""
 
     env_name: str
     account_id: str
+    # 各基盤のサービスパラメータの後に指定できるよう、キーワード専用とする
+    network: NetworkParameter = field(default=NetworkParameter(), kw_only=True)
+
+
+#############################
+# 　  リソース別の型定義       #
+#############################
+# Aurora のキャパシティモード
+DB_CAPACITY_PROVISIONED = "provisioned"
+DB_CAPACITY_SERVERLESS_V2 = "serverless_v2"
+# Aurora のストレージタイプ ("aurora": I/O 従量課金, "aurora-iopt1": I/O-Optimized)
+DB_STORAGE_STANDARD = "aurora"
+DB_STORAGE_IO_OPTIMIZED = "aurora-iopt1"
+# provisioned モードで使用可能なインスタンスファミリー (t4g, r6g, r7g, r8g は Graviton)
+DB_INSTANCE_FAMILIES = ("t3", "t4g", "r5", "r6g", "r6i", "r7g", "r7i", "r8g")
+# CloudWatch Logs のロググループに指定可能な保持期間 (日)
+LOG_RETENTION_DAYS = (1, 7, 14, 30, 60, 90, 180, 365)
+
+
+@dataclass(frozen=True)
+class SlowQueryLogParameter:
+    """スロークエリログ (postgresql ログ) の CloudWatch Logs への出力と、S3 への収集・集計のパラメータ."""
+
+    # ログに出力する SQL の実行時間の閾値 (ミリ秒, log_min_duration_statement)
+    min_duration_ms: int = 1000
+    # postgresql ログのロググループの保持期間 (日)
+    log_retention_days: int = 30
+    # S3 に保存した構造化レコードの保持期間 (日)
+    record_retention_days: int = 90
+    # 日次レポートに出力するクエリの件数 (合計実行時間の上位)
+    report_top_n: int = 20
+
+    def __post_init__(self) -> None:
+        if self.log_retention_days not in LOG_RETENTION_DAYS:
+            raise ValueError(f"log_retention_days は {LOG_RETENTION_DAYS} のいずれかを指定してください: {self.log_retention_days}")
+        if self.min_duration_ms < 0:
+            raise ValueError(f"min_duration_ms は0以上で指定してください: {self.min_duration_ms}")
+
+
+@dataclass(frozen=True)
+class ReaderAutoScalingParameter:
+    """Aurora reader (レプリカ) のオートスケーリング (Application Auto Scaling) のパラメータ."""
+
+    # オートスケーリングで追加・削除する reader 数の範囲 (固定の reader は含まない)
+    min_readers: int = 0
+    max_readers: int = 2
+    # reader の平均 CPU 使用率 (%) の目標値
+    target_cpu_utilization: float = 60
+    # reader あたりの平均接続数の目標値。None の場合は接続数によるスケーリングを行わない
+    target_connections: Optional[float] = None
+    # スケールイン・スケールアウト後の待機時間 (秒)
+    scale_in_cooldown_seconds: int = 600
+    scale_out_cooldown_seconds: int = 120
+
+    def __post_init__(self) -> None:
+        if not 0 <= self.min_readers <= self.max_readers <= 15:
+            raise ValueError(f"reader 数の範囲が不正です (0〜15): min_readers={self.min_readers}, max_readers={self.max_readers}")
+
+
+@dataclass(frozen=True)
+class DatabaseProxyParameter:
+    """RDS Proxy の接続プールのパラメータ."""
+
+    # DB の max_connections に対する、プロキシが使用する接続数の上限 (%)
+    max_connections_percent: int = 100
+    # プロキシが保持するアイドル接続数の上限 (%)。max_connections_percent 以下
+    max_idle_connections_percent: int = 50
+    # 接続プールが上限に達した場合に、空きを待つ時間 (秒)
+    borrow_timeout_seconds: int = 120
+    # クライアント接続のアイドルタイムアウト (秒)
+    idle_client_timeout_seconds: int = 1800
+    # SQL 文を含む詳細ログの出力 (オーバーヘッドがあるため dev フェーズのみ有効)
+    debug_logging: bool = False
+
+    def __post_init__(self) -> None:
+        if not 1 <= self.max_connections_percent <= 100:
+            raise ValueError(f"max_connections_percent は 1〜100 で指定してください: {self.max_connections_percent}")
+        if not 0 <= self.max_idle_connections_percent <= self.max_connections_percent:
+            raise ValueError(
+                f"max_idle_connections_percent は 0〜max_connections_percent で指定してください: {self.max_idle_connections_percent}"
+            )
+
+
+# フェーズごとの RDS Proxy の既定値
+DATABASE_PROXY_PARAMS = {
+    # Lambda のバースト時は接続待ちで Lambda がタイムアウトする前に失敗させ、アイドル接続は少なく保つ
+    "dev": DatabaseProxyParameter(
+        max_connections_percent=90,
+        max_idle_connections_percent=10,
+        borrow_timeout_seconds=30,
+        debug_logging=True,
+    ),
+    "stg": DatabaseProxyParameter(
+        max_connections_percent=90,
+        max_idle_connections_percent=30,
+        borrow_timeout_seconds=30,
+    ),
+    # 本番はバースト時に接続を確立し直さないよう、アイドル接続を多めに保持する
+    "prod": DatabaseProxyParameter(
+        max_connections_percent=90,
+        max_idle_connections_percent=50,
+        borrow_timeout_seconds=30,
+    ),
+}
+
+
+# pyarrow を含む AWS SDK for pandas の Lambda レイヤー (Parquet の出力に使用する)
+AWS_SDK_PANDAS_LAYER_ARN = "arn:aws:lambda:ap-northeast-1:336392948345:layer:AWSSDKPandas-Python313:1"
+
+
+@dataclass(frozen=True)
+class PerformanceInsightsParameter:
+    """Performance Insights の保持期間と、日次のスナップショットの収集のパラメータ."""
+
+    # 保持期間 (月)。0 の場合は無料の7日間、24 の場合は長期保持 (731日)
+    retention_months: int = 0
+    # 待機イベント別の DB 負荷・上位の SQL を日次で S3 (Parquet) に保存する
+    collect_snapshots: bool = True
+    # インスタンスごとに保存する SQL の件数
+    top_sql_limit: int = 25
+    # Parquet の出力に使用する Lambda レイヤー
+    parquet_layer_arn: str = AWS_SDK_PANDAS_LAYER_ARN
+
+    def __post_init__(self) -> None:
+        if not 0 <= self.retention_months <= 24:
+            raise ValueError(f"retention_months は 0〜24 で指定してください: {self.retention_months}")
+        if not 1 <= self.top_sql_limit <= 25:
+            raise ValueError(f"top_sql_limit は 1〜25 で指定してください: {self.top_sql_limit}")
+
+
+# フェーズごとの Performance Insights の既定値 (リリース間の推移は S3 のスナップショットで比較する)
+PERFORMANCE_INSIGHTS_PARAMS = {
+    "dev": PerformanceInsightsParameter(retention_months=0),
+    "stg": PerformanceInsightsParameter(retention_months=1),
+    "prod": PerformanceInsightsParameter(retention_months=3),
+}
+
+
+@dataclass(frozen=True)
+class AuroraCloneParameter:
+    """負荷・回帰試験用の Aurora クローン (copy-on-write) のパラメータ."""
+
+    # クローンの有効期限 (時間)。期限切れのクローンはスタックごと削除する
+    default_ttl_hours: int = 8
+    max_ttl_hours: int = 72
+    # クローンのインスタンスタイプ。None の場合は Serverless v2 (min_capacity〜max_capacity ACU)
+    instance_type: Optional[str] = None
+    min_capacity: float = 0.5
+    max_capacity: float = 16
+    # 期限切れのクローンを削除する間隔 (分)
+    reaper_interval_minutes: int = 60
+
+    def __post_init__(self) -> None:
+        if not 1 <= self.default_ttl_hours <= self.max_ttl_hours:
+            raise ValueError(f"TTL の範囲が不正です: default_ttl_hours={self.default_ttl_hours}, max_ttl_hours={self.max_ttl_hours}")
+        if self.instance_type and self.instance_type.split(".")[0] not in DB_INSTANCE_FAMILIES:
+            raise ValueError(f"instance_type のファミリーは {', '.join(DB_INSTANCE_FAMILIES)} から指定してください: {self.instance_type}")
+        if not 0.5 <= self.min_capacity <= self.max_capacity <= 256:
+            raise ValueError(f"ACU の範囲が不正です: min_capacity={self.min_capacity}, max_capacity={self.max_capacity}")
+
+
+@dataclass(frozen=True)
+class DatabaseParameter:
+    """Aurora クラスター (DatabaseConstruct) のパラメータ."""
+
+    # キャパシティモード ("provisioned": インスタンスクラスを指定, "serverless_v2": ACU の範囲を指定)
+    capacity_mode: str = DB_CAPACITY_PROVISIONED
+    # provisioned モードのインスタンスタイプ (例: "t3.large", Graviton の場合は "t4g.large", "r7g.large", "r8g.large")
+    instance_type: str = "t3.large"
+    # ストレージタイプ。書き込みの多いテーブルで I/O コストが全体の 1/4 を超える場合は I/O-Optimized が有利
+    storage_type: str = DB_STORAGE_STANDARD
+    # reader インスタンス数
+    reader_count: int = 1
+    # serverless_v2 モードの最小・最大 ACU (0.5 単位)。最小を 0 にするとアイドル時に自動一時停止する
+    min_capacity: float = 0.5
+    max_capacity: float = 4
+    # 自動一時停止までのアイドル時間 (秒)。min_capacity が 0 の場合のみ有効
+    seconds_until_auto_pause: int = 300
+    # reader のオートスケーリング。None の場合は reader_count の固定台数のみ
+    reader_autoscaling: Optional[ReaderAutoScalingParameter] = None
+    # レポート・分析用の reader 数 (フェイルオーバー対象外)。1以上の場合、OLTP 用と分析用のカスタムエンドポイントを作成する
+    analytics_reader_count: int = 0
+    # RDS Proxy の接続プール
+    proxy: DatabaseProxyParameter = DatabaseProxyParameter()
+    # 実行計画をログに出力する SQL の実行時間の閾値 (ミリ秒, auto_explain)
+    auto_explain_min_duration_ms: int = 1000
+    # スロークエリログの出力・収集。None の場合は postgresql ログを出力しない
+    slow_query_log: Optional[SlowQueryLogParameter] = SlowQueryLogParameter()
+    # Performance Insights。None の場合は無効
+    performance_insights: Optional[PerformanceInsightsParameter] = PerformanceInsightsParameter()
+    # 試験用のクローンの作成を許可する (クローン元の情報の公開と、期限切れのクローンの削除)。None の場合は作成不可
+    clone: Optional[AuroraCloneParameter] = None
+    # RDS Data API (HTTP エンドポイント) を有効にする (VPC 外の Lambda から接続プールを使用せずに SQL を実行する)
+    data_api: bool = False
+    # Data API を使用する他の基盤名 (例: ("auth", "integration"))。基盤のアカウントから引き受け可能なロールを作成する
+    data_api_consumers: Tuple[str, ...] = ()
+    # インスタンスタイプから算出したパラメータグループの値を上書きする値 (フェーズごとの調整用)
+    cluster_parameter_overrides: Dict[str, str] = field(default_factory=dict)
+    instance_parameter_overrides: Dict[str, str] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        if self.capacity_mode not in (DB_CAPACITY_PROVISIONED, DB_CAPACITY_SERVERLESS_V2):
+            raise ValueError(f"capacity_mode は {DB_CAPACITY_PROVISIONED} または {DB_CAPACITY_SERVERLESS_V2} を指定してください: {self.capacity_mode}")
+        if self.instance_type.split(".")[0] not in DB_INSTANCE_FAMILIES:
+            raise ValueError(f"instance_type のファミリーは {', '.join(DB_INSTANCE_FAMILIES)} から指定してください: {self.instance_type}")
+        if self.storage_type not in (DB_STORAGE_STANDARD, DB_STORAGE_IO_OPTIMIZED):
+            raise ValueError(f"storage_type は {DB_STORAGE_STANDARD} または {DB_STORAGE_IO_OPTIMIZED} を指定してください: {self.storage_type}")
+        if not (0 <= self.min_capacity <= self.max_capacity <= 256) or self.max_capacity < 1:
+            raise ValueError(f"ACU の範囲が不正です: min_capacity={self.min_capacity}, max_capacity={self.max_capacity}")
+        if self.min_capacity * 2 % 1 or self.max_capacity * 2 % 1:
+            raise ValueError(f"ACU は 0.5 単位で指定してください: min_capacity={self.min_capacity}, max_capacity={self.max_capacity}")
+        if not 300 <= self.seconds_until_auto_pause <= 86400:
+            raise ValueError(f"seconds_until_auto_pause は 300〜86400 秒で指定してください: {self.seconds_until_auto_pause}")
+        # Aurora のオートスケーリングは、reader が1台以上存在するクラスターのみ対象となる
+        if self.reader_autoscaling and self.reader_count < 1:
+            raise ValueError("reader_autoscaling を指定する場合は reader_count を1以上にしてください")
+        if self.data_api_consumers and not self.data_api:
+            raise ValueError("data_api_consumers を指定する場合は data_api を有効にしてください")
 
 
 #############################
@@ -38,6 +381,7 @@ class MembersServiceParameter(ServiceParameter):
     central_account_id: str
     ami_id: str
     instance_type: str
+    database: DatabaseParameter
     # user_pool_id: str
 
 
@@ -53,6 +397,7 @@ class ParkingsServiceParameter(ServiceParameter):
     sub_domain_nameservers: dict
     ami_id: str
     instance_type: str
+    database: DatabaseParameter
     # dynamodb_table_name: str
 
 
@@ -80,14 +425,31 @@ class IntegrationServiceParameter(ServiceParameter):
     # dynamodb_table_name: str
 
 
+@dataclass(frozen=True)
+class TemplateBudgetParameter:
+    """CloudFormation テンプレートのサイズ・リソース数の予算 (上限: リソース500, 1MB, パラメータ200, 出力200)."""
+
+    max_resources: int = 450
+    max_template_bytes: int = 900_000
+    max_parameters: int = 180
+    max_outputs: int = 180
+    # 予算超過時の動作 ("warn": 警告のみ, "fail": synth をエラーにする)
+    action: str = "warn"
+    # 超過時に表示する、リソースの多い Construct の数
+    top_contributors: int = 5
+
+
 #############################
 # 　  共通パラメータ定義       #
 #############################
 BASE_PARAMS = {
     "dev": AppParameter(project="npc", phase="dev", region="ap-northeast-1", domain_name="npc24dev.click"),
-    # stg, prdも同様
+    # stg, prodも同様
 }
 
+# テンプレートの予算 (-c template_budget_action=fail で超過時にエラーとする)
+TEMPLATE_BUDGET = TemplateBudgetParameter()
+
 
 #########################
 #      ヘルパー関数       #
@@ -151,76 +513,245 @@ def get_env_var(name: str) -> str:
 # 　 基盤固有パラメータ定義     #
 #############################
 
-DEV_ACCOUNTS_PARAMS = {
-    "members": create_param(
-        param_class=MembersServiceParameter,
-        base_params=BASE_PARAMS["dev"],
-        env_name="members",
-        account_id=get_env_var("NPC_MEMBERS_DEV_ACCOUNT"),
-        **{
-            "central_account_id": get_env_var("NPC_PARKINGS_DEV_ACCOUNT"),
+# フェーズごとの、中央アカウント以外の基盤が参加する VPC Lattice のサービスネットワーク
+# (Parkings のデプロイ後に出力される ServiceNetworkId を設定し、各基盤を再度デプロイする)
+SERVICE_NETWORK_PARAMS = {
+    "dev": ServiceNetworkParameter(service_network_id=None),
+}
+
+# アカウントID以外の、フェーズ・基盤ごとの固有パラメータ
+ACCOUNT_SPECIFIC_PARAMS = {
+    "dev": {
+        "members": {
             "ami_id": "ami-03598bf9d15814511",
             "instance_type": "t2.micro",
+            "network": NetworkParameter(
+                vpc_endpoints=VpcEndpointParameter(secrets_manager=True, logs=True, ssm=True, dynamodb=True),
+                # 移行前の CIDR (Aurora の削除保護のため、README の手順で移行するまで維持する)
+                legacy_vpc_cidr="10.0.0.0/16",
+                service_network=SERVICE_NETWORK_PARAMS["dev"],
+            ),
+            # 夜間はアイドルのため、0 ACU まで自動一時停止させる
+            "database": DatabaseParameter(
+                capacity_mode=DB_CAPACITY_SERVERLESS_V2,
+                min_capacity=0,
+                max_capacity=4,
+                seconds_until_auto_pause=1800,
+                proxy=DATABASE_PROXY_PARAMS["dev"],
+                performance_insights=PERFORMANCE_INSIGHTS_PARAMS["dev"],
+            ),
         },
-    ),
-    "parkings": create_param(
-        param_class=ParkingsServiceParameter,
-        base_params=BASE_PARAMS["dev"],
-        env_name="parkings",
-        account_id=get_env_var("NPC_PARKINGS_DEV_ACCOUNT"),
-        **{
-            "central_account_id": get_env_var("NPC_PARKINGS_DEV_ACCOUNT"),
-            "other_account_ids": {
-                "members": get_env_var("NPC_MEMBERS_DEV_ACCOUNT"),
-                "payments": get_env_var("NPC_PAYMENTS_DEV_ACCOUNT"),
-                "auth": get_env_var("NPC_AUTH_DEV_ACCOUNT"),
-                "integration": get_env_var("NPC_INTEGRATION_DEV_ACCOUNT"),
-            },
-            "hosted_zone_id": "Z0880119245A91RB6NNGO", 
-            "sub_domains": ["auth","members","payments"],
+        "parkings": {
+            "hosted_zone_id": "Z0880119245A91RB6NNGO",
+            "sub_domains": ["auth", "members", "payments"],
             "sub_domain_nameservers": {
                 "auth": [
                     "ns-484.awsdns-60.com.",
                     "ns-1042.awsdns-02.org.",
                     "ns-1962.awsdns-53.co.uk.",
-                    "ns-989.awsdns-59.net."
+                    "ns-989.awsdns-59.net.",
                 ],
-                "members":[
+                "members": [
                     "ns-333.awsdns-41.com.",
                     "ns-1519.awsdns-61.org.",
                     "ns-1801.awsdns-33.co.uk.",
-                    "ns-1010.awsdns-62.net."
+                    "ns-1010.awsdns-62.net.",
                 ],
-                "payments":[
+                "payments": [
                     "ns-252.awsdns-31.com.",
                     "ns-1733.awsdns-24.co.uk.",
                     "ns-898.awsdns-48.net.",
-                    "ns-1138.awsdns-14.org."
-                ]
+                    "ns-1138.awsdns-14.org.",
+                ],
             },
             "ami_id": "ami-03598bf9d15814511",
             "instance_type": "t2.micro",
+            # Lambda・コンテナのコールドスタート時に、インターネットへの経路に依存せず AWS API を呼び出す
+            "network": NetworkParameter(
+                vpc_endpoints=VpcEndpointParameter(
+                    secrets_manager=True,
+                    ecr=True,
+                    ecr_docker=True,
+                    logs=True,
+                    sts=True,
+                    ssm=True,
+                    kms=True,
+                    sqs=True,
+                    dynamodb=True,
+                ),
+                # 中央アカウントとしてサービスネットワークを作成し、他の基盤と共有する
+                # (他の基盤は、デプロイ後のサービスネットワークの ID を ServiceNetworkParameter.service_network_id に設定して参加する)
+                service_network=ServiceNetworkParameter(),
+                # 入庫ピーク時のスループットの調査 (AZ 間の通信・VPC エンドポイントを経由しない通信) のため 1 分間隔で集約する
+                flow_logs=FlowLogParameter(max_aggregation_interval_seconds=60, retention_days=14),
+            ),
+            # 入庫ピーク時にバースト可能インスタンスの CPU クレジットが枯渇するため、ACU でスケールさせる
+            "database": DatabaseParameter(
+                capacity_mode=DB_CAPACITY_SERVERLESS_V2,
+                min_capacity=0,
+                max_capacity=8,
+                seconds_until_auto_pause=1800,
+                proxy=DATABASE_PROXY_PARAMS["dev"],
+                performance_insights=PERFORMANCE_INSIGHTS_PARAMS["dev"],
+                reader_autoscaling=ReaderAutoScalingParameter(min_readers=0, max_readers=2, target_cpu_utilization=60),
+                # 入庫ピークの負荷試験用
+                clone=AuroraCloneParameter(max_capacity=8),
+                # Auth・Integration の Lambda の少量・低頻度のクエリは、VPC・RDS Proxy を経由せず Data API で実行する
+                data_api=True,
+                data_api_consumers=("auth", "integration"),
+            ),
         },
-    ),
-    "payments": create_param(
-        param_class=PaymentsServiceParameter,
-        base_params=BASE_PARAMS["dev"],
-        env_name="payments",
-        account_id=get_env_var("NPC_PAYMENTS_DEV_ACCOUNT"),
-        **{"central_account_id": get_env_var("NPC_PARKINGS_DEV_ACCOUNT")},
-    ),
-    "auth": create_param(
-        param_class=AuthServiceParameter,
-        base_params=BASE_PARAMS["dev"],
-        env_name="auth",
-        account_id=get_env_var("NPC_AUTH_DEV_ACCOUNT"),
-        **{"central_account_id": get_env_var("NPC_PARKINGS_DEV_ACCOUNT")},
-    ),
-    "integration": create_param(
-        param_class=IntegrationServiceParameter,
-        base_params=BASE_PARAMS["dev"],
-        env_name="integration",
-        account_id=get_env_var("NPC_INTEGRATION_DEV_ACCOUNT"),
-        **{"central_account_id": get_env_var("NPC_PARKINGS_DEV_ACCOUNT")},
-    ),
+        "payments": {
+            # 移行前の CIDR (README の手順で移行するまで維持する)
+            "network": NetworkParameter(legacy_vpc_cidr="10.0.0.0/16", service_network=SERVICE_NETWORK_PARAMS["dev"]),
+        },
+        "auth": {
+            # 移行前の CIDR (README の手順で移行するまで維持する)
+            "network": NetworkParameter(legacy_vpc_cidr="10.0.0.0/16", service_network=SERVICE_NETWORK_PARAMS["dev"]),
+        },
+        "integration": {
+            # 移行前の CIDR (README の手順で移行するまで維持する)
+            "network": NetworkParameter(legacy_vpc_cidr="10.0.0.0/16", service_network=SERVICE_NETWORK_PARAMS["dev"]),
+        },
+    },
+    # stg, prodも同様
 }
+
+
+def legacy_vpc_cidrs() -> Dict[Tuple[str, str], str]:
+    """移行前の CIDR を維持している VPC の、(基盤名, フェーズ) ごとの CIDR を返す (アカウントIDの環境変数は不要)."""
+    return {
+        (env_name, phase): params["network"].legacy_vpc_cidr
+        for phase, phase_params in ACCOUNT_SPECIFIC_PARAMS.items()
+        for env_name, params in phase_params.items()
+        if "network" in params and params["network"].legacy_vpc_cidr
+    }
+
+
+class LazyParameterRegistry(Mapping):
+    """基盤名をキーに、サービスパラメータを初回参照時に生成・キャッシュするレジストリ.
+
+    参照されない基盤のパラメータは生成されないため、作成対象外の基盤の環境変数は不要となる。
+    """
+
+    def __init__(self, phase: str, factories: Dict[str, Callable[[], ServiceParameter]]) -> None:
+        self.phase = phase
+        self._factories = factories
+        self._cache: Dict[str, ServiceParameter] = {}
+
+    def __getitem__(self, env_name: str) -> ServiceParameter:
+        if env_name not in self._cache:
+            self._cache[env_name] = self._factories[env_name]()
+        return self._cache[env_name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._factories)
+
+    def __len__(self) -> int:
+        return len(self._factories)
+
+    def resolve(self, env_names: Iterable[str]) -> Dict[str, ServiceParameter]:
+        """指定された基盤のパラメータをまとめて生成する.
+
+        Args:
+            env_names: 基盤名のリスト
+
+        Returns:
+            基盤名をキーとしたパラメータの辞書
+
+        Raises:
+            ValueError: いずれかの基盤のパラメータが生成できない場合（エラー内容をまとめて通知）
+
+        """
+        resolved = {}
+        errors = []
+        for env_name in env_names:
+            try:
+                resolved[env_name] = self[env_name]
+            except ValueError as e:
+                errors.append(f"{env_name}: {e}")
+        if errors:
+            raise ValueError("\n".join(errors))
+        return resolved
+
+
+def build_accounts_params(phase: str) -> LazyParameterRegistry:
+    """指定フェーズの基盤固有パラメータのレジストリを生成する.
+
+    アカウントIDは環境変数 `NPC_<基盤名>_<フェーズ>_ACCOUNT` から取得する。
+
+    Args:
+        phase: フェーズ名 (dev, stg, prod)
+
+    Returns:
+        基盤名をキーとした LazyParameterRegistry
+
+    """
+
+    def base_params() -> AppParameter:
+        if phase not in BASE_PARAMS:
+            raise ValueError(f"フェーズ {phase} の共通パラメータが定義されていません")
+        return BASE_PARAMS[phase]
+
+    def specific_params(env_name: str) -> dict:
+        if env_name not in ACCOUNT_SPECIFIC_PARAMS.get(phase, {}):
+            raise ValueError(f"フェーズ {phase} の {env_name} 固有パラメータが定義されていません")
+        return ACCOUNT_SPECIFIC_PARAMS[phase][env_name]
+
+    def account_id(env_name: str) -> str:
+        return get_env_var(f"NPC_{env_name.upper()}_{phase.upper()}_ACCOUNT")
+
+    factories = {
+        "members": lambda: create_param(
+            param_class=MembersServiceParameter,
+            base_params=base_params(),
+            env_name="members",
+            account_id=account_id("members"),
+            central_account_id=account_id("parkings"),
+            **specific_params("members"),
+        ),
+        "parkings": lambda: create_param(
+            param_class=ParkingsServiceParameter,
+            base_params=base_params(),
+            env_name="parkings",
+            account_id=account_id("parkings"),
+            central_account_id=account_id("parkings"),
+            other_account_ids={
+                "members": account_id("members"),
+                "payments": account_id("payments"),
+                "auth": account_id("auth"),
+                "integration": account_id("integration"),
+            },
+            **specific_params("parkings"),
+        ),
+        "payments": lambda: create_param(
+            param_class=PaymentsServiceParameter,
+            base_params=base_params(),
+            env_name="payments",
+            account_id=account_id("payments"),
+            central_account_id=account_id("parkings"),
+            **specific_params("payments"),
+        ),
+        "auth": lambda: create_param(
+            param_class=AuthServiceParameter,
+            base_params=base_params(),
+            env_name="auth",
+            account_id=account_id("auth"),
+            central_account_id=account_id("parkings"),
+            **specific_params("auth"),
+        ),
+        "integration": lambda: create_param(
+            param_class=IntegrationServiceParameter,
+            base_params=base_params(),
+            env_name="integration",
+            account_id=account_id("integration"),
+            central_account_id=account_id("parkings"),
+            **specific_params("integration"),
+        ),
+    }
+    return LazyParameterRegistry(phase=phase, factories=factories)
+
+
+DEV_ACCOUNTS_PARAMS = build_accounts_params("dev")
+STG_ACCOUNTS_PARAMS = build_accounts_params("stg")
+PROD_ACCOUNTS_PARAMS = build_accounts_params("prod")
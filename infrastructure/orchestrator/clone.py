@@ -0,0 +1,159 @@
+"""負荷・回帰試験用の Aurora クローン (copy-on-write) のスタックを作成・一覧表示・削除する CLI.
+
+クローンは基盤の Aurora クラスターとストレージを共有するため、スナップショットの復元と異なり数分で作成でき、
+追加のストレージは変更されたページ分のみとなる。有効期限を過ぎたクローンは基盤のスタックの Lambda が削除する。
+
+    python3 -m orchestrator.clone create parkings loadtest --ttl-hours 8 --profile <PARKINGS ACCOUNT PROFILE>
+    python3 -m orchestrator.clone list --profile <PARKINGS ACCOUNT PROFILE>
+    python3 -m orchestrator.clone delete parkings loadtest --profile <PARKINGS ACCOUNT PROFILE>
+"""
+
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional
+
+import aws_cdk as cdk
+
+from config import config
+from src.common.constructs.aurora_clone_construct import CLONE_TAG_EXPIRES_AT, CLONE_TAG_SOURCE, clone_stack_name
+from src.common.stacks.aurora_clone_stack import AuroraCloneStack
+
+CLONE_NAME_PATTERN = re.compile(r"^[a-z][a-z0-9-]{0,19}$")
+# クローンのスタックの synth 結果の出力先
+CLONE_OUTDIR = ".cdk.local/clone"
+
+
+#########################
+#      ヘルパー関数       #
+#########################
+def _aws(args: List[str], profile: Optional[str]) -> str:
+    """AWS CLI を実行し、標準出力を返す."""
+    command = ["aws", *args, "--output", "json"]
+    if profile:
+        command.extend(["--profile", profile])
+    return subprocess.run(command, check=True, capture_output=True, text=True).stdout
+
+
+def load_clone_props(phase: str, env_name: str):
+    """クローン元の基盤のパラメータを返す.
+
+    Raises:
+        ValueError: フェーズ・基盤が未定義の場合や、基盤でクローンが許可されていない場合
+
+    """
+    registry = getattr(config, f"{phase.upper()}_ACCOUNTS_PARAMS", None)
+    if registry is None:
+        raise ValueError(f"Unsupported phase: {phase}")
+    if env_name not in registry:
+        raise ValueError(f"Unknown env_name: {env_name}")
+    props = registry[env_name]
+    database = getattr(props, "database", None)
+    if database is None or database.clone is None:
+        raise ValueError(f"{env_name} ({phase}) does not allow Aurora clones (set DatabaseParameter.clone)")
+    return props
+
+
+def synth_clone_stack(props, clone_name: str, ttl_hours: int) -> str:
+    """クローンのスタックを synth し、クラウドアセンブリのディレクトリを返す."""
+    stack_name = clone_stack_name(props.env_name, props.phase, clone_name)
+    outdir = os.path.join(CLONE_OUTDIR, stack_name)
+    app = cdk.App(outdir=outdir)
+    AuroraCloneStack(
+        app,
+        stack_name,
+        props=props,
+        clone_name=clone_name,
+        expires_at=datetime.now(timezone.utc) + timedelta(hours=ttl_hours),
+        env={"account": props.account_id, "region": props.region},
+    )
+    app.synth()
+    return outdir
+
+
+#########################
+#        CLI            #
+#########################
+def create(args: argparse.Namespace) -> int:
+    props = load_clone_props(args.phase, args.env_name)
+    clone_param = props.database.clone
+    ttl_hours = args.ttl_hours or clone_param.default_ttl_hours
+    if not 1 <= ttl_hours <= clone_param.max_ttl_hours:
+        raise ValueError(f"--ttl-hours must be between 1 and {clone_param.max_ttl_hours}: {ttl_hours}")
+
+    outdir = synth_clone_stack(props, args.clone_name, ttl_hours)
+    if args.synth_only:
+        print(outdir)
+        return 0
+
+    command = [
+        "cdk",
+        "deploy",
+        clone_stack_name(props.env_name, props.phase, args.clone_name),
+        "--app",
+        outdir,
+        "--require-approval",
+        "never",
+    ]
+    if args.profile:
+        command.extend(["--profile", args.profile])
+    return subprocess.run(command).returncode
+
+
+def list_clones(args: argparse.Namespace) -> int:
+    stacks = json.loads(_aws(["cloudformation", "describe-stacks"], args.profile))["Stacks"]
+    print(f"{'Stack':<40} {'Status':<24} {'Source':<30} {'Expires at':<25}")
+    for stack in stacks:
+        tags = {tag["Key"]: tag["Value"] for tag in stack.get("Tags", [])}
+        if CLONE_TAG_EXPIRES_AT not in tags:
+            continue
+        print(f"{stack['StackName']:<40} {stack['StackStatus']:<24} {tags.get(CLONE_TAG_SOURCE, ''):<30} {tags[CLONE_TAG_EXPIRES_AT]:<25}")
+    return 0
+
+
+def delete(args: argparse.Namespace) -> int:
+    props = load_clone_props(args.phase, args.env_name)
+    stack_name = clone_stack_name(props.env_name, props.phase, args.clone_name)
+    _aws(["cloudformation", "delete-stack", "--stack-name", stack_name], args.profile)
+    print(f"Deleting {stack_name}")
+    return 0
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="試験用の Aurora クローンの作成・一覧表示・削除")
+    parser.add_argument("--phase", default="DEV", help="フェーズ (DEV, STG, PROD)")
+    parser.add_argument("--profile", default=None, help="AWS CLI のプロファイル (クローン元の基盤のアカウント)")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    create_parser = subparsers.add_parser("create", help="クローンのスタックを作成する")
+    create_parser.add_argument("env_name", help="クローン元の基盤名 (例: parkings)")
+    create_parser.add_argument("clone_name", help="クローン名 (英小文字・数字・ハイフン、20文字以内)")
+    create_parser.add_argument("--ttl-hours", type=int, default=None, help="有効期限 (時間)。未指定の場合は config の default_ttl_hours")
+    create_parser.add_argument("--synth-only", action="store_true", help="synth のみ行い、クラウドアセンブリのディレクトリを表示する")
+    create_parser.set_defaults(handler=create)
+
+    list_parser = subparsers.add_parser("list", help="クローンのスタックと有効期限を表示する")
+    list_parser.set_defaults(handler=list_clones)
+
+    delete_parser = subparsers.add_parser("delete", help="有効期限前にクローンのスタックを削除する")
+    delete_parser.add_argument("env_name", help="クローン元の基盤名 (例: parkings)")
+    delete_parser.add_argument("clone_name", help="クローン名")
+    delete_parser.set_defaults(handler=delete)
+
+    args = parser.parse_args(argv)
+    if getattr(args, "clone_name", None) and not CLONE_NAME_PATTERN.match(args.clone_name):
+        print(f"Error: Invalid clone name: {args.clone_name} (lowercase letters, digits and hyphens, up to 20 characters)")
+        return 1
+    try:
+        return args.handler(args)
+    except (ValueError, subprocess.CalledProcessError) as e:
+        print(f"Error: {e}")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,178 @@
+"""スタック間の依存関係に従い、独立したスタックを並列にデプロイするオーケストレータ.
+
+synth 済みのクラウドアセンブリ (cdk.out) からデプロイ順序の DAG を作成し、依存先のデプロイが完了した
+スタックから順に、並列数の上限まで同時にデプロイする。
+
+    python3 -m orchestrator.deploy --max-parallel 3 --profile <PARKINGS ACCOUNT PROFILE>
+    python3 -m orchestrator.deploy --executor stub   # AWS を使用せずに実行順序を確認
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import asdict, dataclass
+from typing import Dict, List, Optional
+
+from orchestrator.executors import CdkCliExecutor, StackExecutor, StubExecutor
+from orchestrator.graph import DeployGraph, load_deploy_graph
+
+REPORT_FILE_NAME = "deploy-report.json"
+
+# デプロイ結果のステータス
+STATUS_SUCCEEDED = "succeeded"
+STATUS_FAILED = "failed"
+# 依存先のデプロイに失敗したため、デプロイしなかったスタック
+STATUS_SKIPPED = "skipped"
+
+
+@dataclass
+class StackDeployResult:
+    """スタックごとのデプロイ結果."""
+
+    stack_id: str
+    account: str
+    region: str
+    status: str
+    # オーケストレータの開始からの経過時間 (秒)
+    started_at: float = 0.0
+    elapsed_seconds: float = 0.0
+    error: Optional[str] = None
+
+
+class DeployOrchestrator:
+    """DAG に従ってスタックを並列にデプロイする."""
+
+    def __init__(self, graph: DeployGraph, executor: StackExecutor, max_parallel: int = 1) -> None:
+        """
+        :param graph: デプロイ順序の DAG
+        :param executor: スタックのデプロイを実行する Executor
+        :param max_parallel: 同時にデプロイするスタック数の上限
+        """
+        if max_parallel < 1:
+            raise ValueError(f"max_parallel must be positive: {max_parallel}")
+        self.graph = graph
+        self.executor = executor
+        self.max_parallel = max_parallel
+
+    def run(self) -> List[StackDeployResult]:
+        """全スタックをデプロイし、スタックごとの結果を返す.
+
+        デプロイに失敗したスタックに依存するスタックはデプロイせず、それ以外のスタックのデプロイは継続する。
+        """
+        start = time.perf_counter()
+        results: Dict[str, StackDeployResult] = {}
+        remaining = {stack_id: set(node.depends_on) for stack_id, node in self.graph.nodes.items()}
+        running: Dict[Future, str] = {}
+
+        def deploy(stack_id: str) -> StackDeployResult:
+            node = self.graph.nodes[stack_id]
+            started_at = time.perf_counter() - start
+            print(f"[{started_at:7.1f}s] start   {stack_id} ({node.account}/{node.region})", file=sys.stderr)
+            result = StackDeployResult(stack_id=stack_id, account=node.account, region=node.region, status=STATUS_SUCCEEDED, started_at=started_at)
+            try:
+                self.executor.deploy(node)
+            except Exception as e:
+                result.status = STATUS_FAILED
+                result.error = str(e)
+            result.elapsed_seconds = time.perf_counter() - start - started_at
+            print(f"[{started_at + result.elapsed_seconds:7.1f}s] {result.status:<9} {stack_id} ({result.elapsed_seconds:.1f}s)", file=sys.stderr)
+            return result
+
+        with ThreadPoolExecutor(max_workers=self.max_parallel) as pool:
+            while remaining or running:
+                # 依存先が全て完了したスタックを、並列数の上限まで開始する
+                ready = sorted(stack_id for stack_id, depends_on in remaining.items() if not depends_on)
+                for stack_id in ready[: self.max_parallel - len(running)]:
+                    del remaining[stack_id]
+                    running[pool.submit(deploy, stack_id)] = stack_id
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    result = future.result()
+                    del running[future]
+                    results[result.stack_id] = result
+                    if result.status == STATUS_SUCCEEDED:
+                        for depends_on in remaining.values():
+                            depends_on.discard(result.stack_id)
+                        continue
+                    for stack_id in self.graph.dependents(result.stack_id):
+                        if stack_id in remaining:
+                            del remaining[stack_id]
+                            node = self.graph.nodes[stack_id]
+                            results[stack_id] = StackDeployResult(
+                                stack_id=stack_id,
+                                account=node.account,
+                                region=node.region,
+                                status=STATUS_SKIPPED,
+                                error=f"dependency {result.stack_id} failed",
+                            )
+
+        return [results[stack_id] for wave in self.graph.waves() for stack_id in wave]
+
+
+#########################
+#      ヘルパー関数       #
+#########################
+def format_report(results: List[StackDeployResult]) -> str:
+    """スタックごとの所要時間を表形式の文字列で返す."""
+    lines = [f"{'Stack':<20} {'Account':<14} {'Status':<10} {'Start(s)':>9} {'Elapsed(s)':>11}"]
+    for result in results:
+        lines.append(
+            f"{result.stack_id:<20} {result.account:<14} {result.status:<10} {result.started_at:>9.1f} {result.elapsed_seconds:>11.1f}"
+        )
+    return "\n".join(lines)
+
+
+def write_report(results: List[StackDeployResult], path: str) -> None:
+    """デプロイ結果を JSON で保存する."""
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump([asdict(result) for result in results], f, indent=2)
+        f.write("\n")
+
+
+#########################
+#        CLI            #
+#########################
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="スタック間の依存関係に従った並列デプロイ")
+    parser.add_argument("--app", default="cdk.out", help="synth 済みのクラウドアセンブリ")
+    parser.add_argument("--stacks", default=None, help="対象のスタック ID (カンマ区切り、未指定の場合は全スタック)")
+    parser.add_argument("--max-parallel", type=int, default=3, help="同時にデプロイするスタック数の上限")
+    parser.add_argument("--executor", choices=["cdk", "stub"], default="cdk", help="デプロイの実行方法 (stub は AWS を使用しない)")
+    parser.add_argument("--profile", default=None, help="AWS CLI のプロファイル (cdk executor のみ)")
+    parser.add_argument("--log-dir", default=None, help="スタックごとの cdk deploy の出力の保存先 (cdk executor のみ)")
+    parser.add_argument("--dry-run", action="store_true", help="デプロイ順序を表示して終了する")
+    args = parser.parse_args(argv)
+
+    if args.max_parallel < 1:
+        print(f"Error: --max-parallel must be positive: {args.max_parallel}")
+        return 1
+    try:
+        graph = load_deploy_graph(args.app, args.stacks.split(",") if args.stacks else None)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}")
+        return 1
+
+    if args.dry_run:
+        for index, wave in enumerate(graph.waves(), start=1):
+            print(f"{index}: {', '.join(wave)}")
+        return 0
+
+    if args.executor == "stub":
+        executor: StackExecutor = StubExecutor()
+    else:
+        if args.log_dir:
+            os.makedirs(args.log_dir, exist_ok=True)
+        executor = CdkCliExecutor(args.app, profile=args.profile, log_dir=args.log_dir)
+
+    results = DeployOrchestrator(graph, executor, max_parallel=args.max_parallel).run()
+    print(format_report(results))
+    write_report(results, os.path.join(args.app, REPORT_FILE_NAME))
+    return 0 if all(result.status == STATUS_SUCCEEDED for result in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,108 @@
+"""スタックのデプロイを実行する Executor.
+
+オーケストレータは Executor の `deploy` を呼び出すのみのため、AWS を使用せずに並列実行・失敗時の動作を
+確認する場合は StubExecutor を使用する。
+"""
+
+import os
+import subprocess
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional, Sequence
+
+from orchestrator.graph import StackNode
+
+
+class DeployError(Exception):
+    """スタックのデプロイに失敗した場合の例外."""
+
+
+class StackExecutor(ABC):
+    """スタックのデプロイを実行する Executor の基底クラス."""
+
+    @abstractmethod
+    def deploy(self, node: StackNode) -> None:
+        """スタックをデプロイする. 失敗した場合は DeployError を送出する."""
+
+
+class CdkCliExecutor(StackExecutor):
+    """CDK CLI (`cdk deploy --app <cdk.out> --exclusively`) でスタックをデプロイする Executor."""
+
+    def __init__(
+        self,
+        assembly_dir: str = "cdk.out",
+        profile: Optional[str] = None,
+        extra_args: Sequence[str] = (),
+        log_dir: Optional[str] = None,
+    ) -> None:
+        """
+        :param assembly_dir: synth 済みのクラウドアセンブリ (並列実行時に synth が競合しないよう再 synth しない)
+        :param profile: AWS CLI のプロファイル (クロスアカウントのデプロイ元となる PARKINGS アカウント)
+        :param extra_args: cdk deploy に渡す追加の引数
+        :param log_dir: スタックごとの出力の保存先。None の場合は標準出力・標準エラー出力にそのまま出力する
+        """
+        self.assembly_dir = assembly_dir
+        self.profile = profile
+        self.extra_args = list(extra_args)
+        self.log_dir = log_dir
+
+    def command(self, node: StackNode) -> List[str]:
+        """スタックをデプロイする CDK CLI のコマンドを返す."""
+        command = [
+            "cdk",
+            "deploy",
+            node.stack_id,
+            "--app",
+            self.assembly_dir,
+            "--exclusively",
+            "--require-approval",
+            "never",
+            "--progress",
+            "events",
+        ]
+        if self.profile:
+            command.extend(["--profile", self.profile])
+        return command + self.extra_args
+
+    def deploy(self, node: StackNode) -> None:
+        if self.log_dir:
+            with open(os.path.join(self.log_dir, f"{node.stack_id}.log"), "w", encoding="utf-8") as log:
+                returncode = subprocess.run(self.command(node), stdout=log, stderr=subprocess.STDOUT).returncode
+        else:
+            returncode = subprocess.run(self.command(node)).returncode
+        if returncode != 0:
+            raise DeployError(f"cdk deploy {node.stack_id} exited with {returncode}")
+
+
+class StubExecutor(StackExecutor):
+    """AWS にデプロイせず、指定した時間だけ待機する Executor (オーケストレータの動作確認用)."""
+
+    def __init__(self, durations: Optional[Dict[str, float]] = None, default_duration: float = 0.1, failures: Sequence[str] = ()) -> None:
+        """
+        :param durations: スタック ID ごとの所要時間 (秒)
+        :param default_duration: durations に無いスタックの所要時間 (秒)
+        :param failures: デプロイを失敗させるスタック ID
+        """
+        self.durations = durations or {}
+        self.default_duration = default_duration
+        self.failures = set(failures)
+        # 呼び出し順の記録と、同時実行数の最大値 (並列数の上限の確認用)
+        self.deployed: List[str] = []
+        self.max_concurrency = 0
+        self._running = 0
+        self._lock = threading.Lock()
+
+    def deploy(self, node: StackNode) -> None:
+        with self._lock:
+            self._running += 1
+            self.max_concurrency = max(self.max_concurrency, self._running)
+        try:
+            time.sleep(self.durations.get(node.stack_id, self.default_duration))
+            if node.stack_id in self.failures:
+                raise DeployError(f"stub failure: {node.stack_id}")
+            with self._lock:
+                self.deployed.append(node.stack_id)
+        finally:
+            with self._lock:
+                self._running -= 1
@@ -0,0 +1,117 @@
+"""クラウドアセンブリ (cdk.out) から、スタックとアカウントのデプロイ順序の DAG を作成するモジュール."""
+
+import json
+import os
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Set
+
+from src.common.synth.stack_registry import STACK_DEFINITIONS
+
+STACK_ARTIFACT_TYPE = "aws:cloudformation:stack"
+
+
+@dataclass
+class StackNode:
+    """デプロイ対象のスタック."""
+
+    stack_id: str
+    account: str
+    region: str
+    # 先にデプロイが必要なスタックの ID
+    depends_on: Set[str] = field(default_factory=set)
+
+
+class DeployGraph:
+    """スタックのデプロイ順序を表す DAG."""
+
+    def __init__(self, nodes: Dict[str, StackNode]) -> None:
+        self.nodes = nodes
+        self._validate()
+
+    def _validate(self) -> None:
+        for node in self.nodes.values():
+            unknown = node.depends_on - set(self.nodes)
+            if unknown:
+                raise ValueError(f"{node.stack_id} depends on unknown stacks: {', '.join(sorted(unknown))}")
+        # 循環参照の検出を兼ねて、一度並べ替える
+        self.waves()
+
+    def dependents(self, stack_id: str) -> List[str]:
+        """指定したスタックに直接・間接的に依存するスタックの ID を返す."""
+        result: List[str] = []
+        pending = [stack_id]
+        while pending:
+            current = pending.pop()
+            for node in self.nodes.values():
+                if current in node.depends_on and node.stack_id not in result:
+                    result.append(node.stack_id)
+                    pending.append(node.stack_id)
+        return result
+
+    def waves(self) -> List[List[str]]:
+        """同時にデプロイ可能なスタックのグループを、デプロイ順に返す.
+
+        Raises:
+            ValueError: 依存関係が循環している場合
+
+        """
+        remaining = {stack_id: set(node.depends_on) for stack_id, node in self.nodes.items()}
+        waves = []
+        while remaining:
+            ready = sorted(stack_id for stack_id, depends_on in remaining.items() if not depends_on)
+            if not ready:
+                raise ValueError(f"Circular stack dependencies: {', '.join(sorted(remaining))}")
+            waves.append(ready)
+            for stack_id in ready:
+                del remaining[stack_id]
+            for depends_on in remaining.values():
+                depends_on.difference_update(ready)
+        return waves
+
+
+#########################
+#      ヘルパー関数       #
+#########################
+def _parse_environment(environment: str) -> List[str]:
+    """"aws://<account>/<region>" をアカウントとリージョンに分割する."""
+    return environment.replace("aws://", "", 1).split("/", 1)
+
+
+def load_deploy_graph(assembly_dir: str = "cdk.out", stack_ids: Optional[List[str]] = None) -> DeployGraph:
+    """クラウドアセンブリのスタックと依存関係から、デプロイ順序の DAG を作成する.
+
+    CDK の依存関係 (manifest.json の dependencies) に加え、アカウントを跨ぐため CDK では表現できない
+    依存関係 (スタック定義の depends_on) を追加する。
+
+    Args:
+        assembly_dir: クラウドアセンブリのディレクトリ
+        stack_ids: 対象のスタック ID。None の場合はクラウドアセンブリ内の全スタック
+
+    Returns:
+        DeployGraph
+
+    Raises:
+        ValueError: クラウドアセンブリに存在しないスタックが指定された場合
+
+    """
+    with open(os.path.join(assembly_dir, "manifest.json"), encoding="utf-8") as f:
+        artifacts = json.load(f).get("artifacts", {})
+
+    stacks = {artifact_id: artifact for artifact_id, artifact in artifacts.items() if artifact.get("type") == STACK_ARTIFACT_TYPE}
+    if stack_ids:
+        unknown = sorted(set(stack_ids) - set(stacks))
+        if unknown:
+            raise ValueError(f"Stacks not found in {assembly_dir}: {', '.join(unknown)}")
+        stacks = {stack_id: stacks[stack_id] for stack_id in stack_ids}
+
+    env_name_by_stack_id = {definition.stack_id: definition.env_name for definition in STACK_DEFINITIONS.values()}
+    nodes = {}
+    for stack_id, artifact in stacks.items():
+        account, region = _parse_environment(artifact["environment"])
+        depends_on = set(artifact.get("dependencies", []))
+        env_name = env_name_by_stack_id.get(stack_id)
+        if env_name:
+            depends_on.update(STACK_DEFINITIONS[name].stack_id for name in STACK_DEFINITIONS[env_name].depends_on)
+        # アセット等のスタック以外のアーティファクトと、対象外のスタックへの依存は除外する
+        nodes[stack_id] = StackNode(stack_id=stack_id, account=account, region=region, depends_on=depends_on & set(stacks))
+    return DeployGraph(nodes)
@@ -376,3 +376,4 @@ class AuthConstruct(Construct):
         self.user_pool_client = user_pool_client
         self.identity_pool = identity_pool
         self.user_pool_domain = domain
+        self.auth_token_validator_function_obj = auth_token_validator_function
@@ -4,6 +4,7 @@ from constructs import Construct
 from src.auth.constructs.auth_construct import AuthConstruct
 from src.common.constructs.iam_construct import IamConstruct
 from src.common.constructs.network_construct import NetworkConstruct
+from src.common.constructs.service_network_construct import ServiceNetworkConstruct
 from src.common.constructs.artifact_bucket import ArtifactBucketConstruct
 
 # from src.constructs.compute_construct import ComputeConstruct
@@ -46,8 +47,27 @@ class AuthStack(Stack):
             project=project,
             env_name=env_name,
             phase=phase,
+            network_param=props.network,
         )
 
+        #########################
+        #    Service Network    #
+        #########################
+        # 基盤間のプライベートな通信 (VPC Lattice)
+        service_network_construct = None
+        if props.network.service_network:
+            service_network_construct = ServiceNetworkConstruct(
+                scope=self,
+                id="ServiceNetworkConstruct",
+                project=project,
+                env_name=env_name,
+                phase=phase,
+                vpc_obj=network_construnt.vpc_obj,  # Conscruct共有リソース
+                account_id=props.account_id,
+                central_account_id=props.central_account_id,
+                service_network_param=props.network.service_network,
+            )
+
         ############################
         #      ArtifactBucket      #
         ############################
@@ -71,6 +91,13 @@ class AuthStack(Stack):
             domain_name = props.domain_name
         )
 
+        # 他の基盤からトークンの検証をプライベートな経路で呼び出す
+        if service_network_construct:
+            service_network_construct.add_lambda_service(
+                "auth-token-validator",
+                auth_construct.auth_token_validator_function_obj,
+            )
+
 
 #        #########################
 #        # Conpute(EC2, keypar)  #
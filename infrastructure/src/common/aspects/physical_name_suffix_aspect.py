@@ -0,0 +1,73 @@
+import re
+from typing import Optional
+
+import jsii
+from aws_cdk import IAspect, Token
+from aws_cdk import aws_ec2 as ec2
+from aws_cdk import aws_logs as logs
+from aws_cdk import aws_rds as rds
+from constructs import IConstruct
+
+# Aurora が出力するロググループ名 (クラスター識別子を含む)
+RDS_CLUSTER_LOG_GROUP_PATTERN = re.compile(r"^(/aws/rds/cluster/)([^/]+)(/.*)$")
+
+# VPC とともに置き換わるリソースと、物理名のプロパティ
+RENAMED_PROPERTIES = (
+    (ec2.CfnSecurityGroup, "group_name"),
+    (rds.CfnDBSubnetGroup, "db_subnet_group_name"),
+    (rds.CfnDBCluster, "db_cluster_identifier"),
+    (rds.CfnDBCluster, "db_subnet_group_name"),
+    (rds.CfnDBCluster, "source_db_cluster_identifier"),
+    (rds.CfnDBInstance, "db_instance_identifier"),
+    (rds.CfnDBProxy, "db_proxy_name"),
+    (rds.CfnDBProxyEndpoint, "db_proxy_endpoint_name"),
+)
+
+# スナップショットから復元する場合に、スナップショットから引き継ぐため指定できないクラスターのプロパティ
+SNAPSHOT_INHERITED_PROPERTIES = ("MasterUsername", "MasterUserPassword", "StorageEncrypted", "DatabaseName")
+
+
+@jsii.implements(IAspect)
+class PhysicalNameSuffixAspect:
+    """VPC の移行 (CIDR の変更) で置き換わるリソースの物理名に接尾辞を付与する Aspect.
+
+    CloudFormation は置き換え時に新しいリソースを作成してから古いリソースを削除するため、
+    セキュリティグループ名・DB サブネットグループ名・クラスター識別子等が同じ場合は作成に失敗する。
+    db_snapshot_identifier を指定した場合は、新しい Aurora クラスターをスナップショットから復元する。
+    Aurora のカスタムエンドポイントはカスタムリソース (SDK の呼び出しのパラメータ) のため対象外とし、
+    DatabaseConstruct の physical_name_suffix で名前を変更する。
+    """
+
+    def __init__(self, suffix: str, db_snapshot_identifier: Optional[str] = None) -> None:
+        """
+        :param suffix: 物理名に付与する接尾辞 (例: "-v2")
+        :param db_snapshot_identifier: Aurora クラスターの復元元のスナップショット
+        """
+        self.suffix = suffix
+        self.db_snapshot_identifier = db_snapshot_identifier
+
+    def visit(self, node: IConstruct) -> None:
+        for resource_type, property_name in RENAMED_PROPERTIES:
+            if isinstance(node, resource_type):
+                self._add_suffix(node, property_name)
+
+        # Aurora のロググループはクラスター識別子から決まるため、クラスターと同じ接尾辞を付与する
+        if isinstance(node, logs.CfnLogGroup) and self._is_literal(node.log_group_name):
+            match = RDS_CLUSTER_LOG_GROUP_PATTERN.match(node.log_group_name)
+            if match and not match.group(2).endswith(self.suffix):
+                node.log_group_name = f"{match.group(1)}{match.group(2)}{self.suffix}{match.group(3)}"
+
+        if isinstance(node, rds.CfnDBCluster) and self.db_snapshot_identifier and not node.source_db_cluster_identifier:
+            node.snapshot_identifier = self.db_snapshot_identifier
+            for property_name in SNAPSHOT_INHERITED_PROPERTIES:
+                node.add_property_deletion_override(property_name)
+
+    def _add_suffix(self, node: IConstruct, property_name: str) -> None:
+        value = getattr(node, property_name)
+        if self._is_literal(value) and not value.endswith(self.suffix):
+            setattr(node, property_name, f"{value}{self.suffix}")
+
+    @staticmethod
+    def _is_literal(value) -> bool:
+        # 他のリソースの参照 (トークン) は、参照先の名前の変更に追従するため対象外とする
+        return isinstance(value, str) and not Token.is_unresolved(value)
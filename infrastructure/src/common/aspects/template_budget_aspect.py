@@ -0,0 +1,142 @@
+import json
+import os
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, List
+
+import jsii
+from aws_cdk import Annotations, CfnOutput, CfnParameter, CfnResource, IAspect, Stack
+from constructs import IConstruct
+
+REPORT_FILE_NAME = "template-budget-report.json"
+
+
+@dataclass
+class StackBudgetUsage:
+    """スタックごとのテンプレート予算の使用状況."""
+
+    stack_name: str
+    resource_count: int = 0
+    parameter_count: int = 0
+    output_count: int = 0
+    template_bytes: int = 0
+    # スタック直下の Construct ID ごとのリソース数
+    resources_by_construct: Counter = field(default_factory=Counter)
+    # スタック直下の Construct ID ごとのテンプレートのバイト数
+    bytes_by_construct: Counter = field(default_factory=Counter)
+    # 論理ID → スタック直下の Construct ID
+    construct_by_logical_id: Dict[str, str] = field(default_factory=dict)
+    violations: List[str] = field(default_factory=list)
+
+
+@jsii.implements(IAspect)
+class TemplateBudgetAspect:
+    """スタックのリソース数・パラメータ数・出力数を予算と比較し、超過時に警告またはエラーとする Aspect.
+
+    テンプレートサイズは synth 後でないと確定しないため、`write_report` で synth 結果と合わせて判定する。
+    """
+
+    def __init__(self, budget) -> None:
+        """
+        :param budget: 予算 (config.TemplateBudgetParameter)
+        """
+        self.budget = budget
+        self.usages: Dict[str, StackBudgetUsage] = {}
+
+    def visit(self, node: IConstruct) -> None:
+        if not isinstance(node, Stack):
+            return
+
+        usage = StackBudgetUsage(stack_name=node.stack_name)
+        stack_path = node.node.path
+        # スタックのパスと区切りの "/" を除いた、スタック内の相対パスの開始位置
+        relative_path_start = len(stack_path) + 1
+        for child in node.node.find_all():
+            if Stack.of(child).node.path != stack_path:
+                continue
+            if isinstance(child, CfnResource):
+                # スタック直下の Construct (IamConstruct 等) 単位で集計する
+                contributor = child.node.path[relative_path_start:].split("/")[0]
+                usage.resource_count += 1
+                usage.resources_by_construct[contributor] += 1
+                usage.construct_by_logical_id[node.resolve(child.logical_id)] = contributor
+            elif isinstance(child, CfnParameter):
+                usage.parameter_count += 1
+            elif isinstance(child, CfnOutput):
+                usage.output_count += 1
+        self.usages[node.artifact_id] = usage
+
+        self._check(node, usage, "resources", usage.resource_count, self.budget.max_resources, usage.resources_by_construct)
+        self._check(node, usage, "parameters", usage.parameter_count, self.budget.max_parameters)
+        self._check(node, usage, "outputs", usage.output_count, self.budget.max_outputs)
+
+    def _check(self, stack: Stack, usage: StackBudgetUsage, name: str, actual: int, limit: int, contributors: Counter = None) -> None:
+        if actual <= limit:
+            return
+        message = f"{name} {actual} exceeds budget {limit}{self._format_contributors(contributors)}"
+        usage.violations.append(message)
+        if self.budget.action == "fail":
+            Annotations.of(stack).add_error(f"[TemplateBudget] {message}")
+        else:
+            Annotations.of(stack).add_warning_v2("npc:template-budget", f"[TemplateBudget] {message}")
+
+    def _format_contributors(self, contributors: Counter = None) -> str:
+        if not contributors:
+            return ""
+        top = ", ".join(f"{name}={count}" for name, count in contributors.most_common(self.budget.top_contributors))
+        return f" (top: {top})"
+
+    #########################
+    #    synth 後の判定      #
+    #########################
+    def write_report(self, outdir: str) -> List[str]:
+        """synth 結果のテンプレートサイズを判定し、予算の使用状況をレポートとして書き出す.
+
+        Args:
+            outdir: synth の出力先ディレクトリ (cdk.out)
+
+        Returns:
+            予算超過の内容のリスト
+
+        """
+        report = {}
+        violations = []
+        for artifact_id, usage in self.usages.items():
+            template_path = os.path.join(outdir, f"{artifact_id}.template.json")
+            if not os.path.exists(template_path):
+                continue
+            with open(template_path, encoding="utf-8") as f:
+                body = f.read()
+            template = json.loads(body)
+            usage.template_bytes = len(body.encode("utf-8"))
+            for logical_id, resource in template.get("Resources", {}).items():
+                contributor = usage.construct_by_logical_id.get(logical_id, logical_id)
+                usage.bytes_by_construct[contributor] += len(json.dumps(resource, separators=(",", ":")))
+
+            # BootstrapVersion 等、synth 時に追加されるパラメータ・出力を含めてテンプレートの値で判定する
+            usage.parameter_count = max(usage.parameter_count, len(template.get("Parameters", {})))
+            usage.output_count = max(usage.output_count, len(template.get("Outputs", {})))
+            checks = [
+                ("parameters", usage.parameter_count, self.budget.max_parameters, None),
+                ("outputs", usage.output_count, self.budget.max_outputs, None),
+                ("template bytes", usage.template_bytes, self.budget.max_template_bytes, usage.bytes_by_construct),
+            ]
+            for name, actual, limit, contributors in checks:
+                already_reported = any(message.startswith(f"{name} ") for message in usage.violations)
+                if actual > limit and not already_reported:
+                    usage.violations.append(f"{name} {actual} exceeds budget {limit}{self._format_contributors(contributors)}")
+            violations.extend(f"{usage.stack_name}: {message}" for message in usage.violations)
+
+            report[usage.stack_name] = {
+                "resource_count": {"actual": usage.resource_count, "budget": self.budget.max_resources},
+                "template_bytes": {"actual": usage.template_bytes, "budget": self.budget.max_template_bytes},
+                "parameter_count": {"actual": usage.parameter_count, "budget": self.budget.max_parameters},
+                "output_count": {"actual": usage.output_count, "budget": self.budget.max_outputs},
+                "top_resources_by_construct": dict(usage.resources_by_construct.most_common(self.budget.top_contributors)),
+                "top_bytes_by_construct": dict(usage.bytes_by_construct.most_common(self.budget.top_contributors)),
+                "violations": usage.violations,
+            }
+
+        with open(os.path.join(outdir, REPORT_FILE_NAME), "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        return violations
@@ -21,4 +21,6 @@ class ArtifactBucketConstruct(Construct):
             bucket_name=f"{project}-{env_name}-{phase}-s3-artifact",
             block_public_access=s3.BlockPublicAccess.BLOCK_ALL,
             removal_policy=cdk.RemovalPolicy.RETAIN
-        )
\ No newline at end of file
+        )
+
+        self.bucket_obj = bucket
@@ -0,0 +1,273 @@
+from aws_cdk import Duration, Fn, RemovalPolicy, Stack
+from aws_cdk import aws_events as events
+from aws_cdk import aws_events_targets as targets
+from aws_cdk import aws_iam as iam
+from aws_cdk import aws_lambda as _lambda
+from aws_cdk import aws_logs as logs
+from aws_cdk import aws_rds as rds
+from aws_cdk import aws_ssm as ssm
+from constructs import Construct
+
+from config.config import DatabaseParameter
+from src.common.constructs.database_construct import (
+    AURORA_ENGINE_VERSION,
+    clone_source_parameter_name,
+    proxy_parameter_name,
+)
+from src.common.database.parameter_tuning import (
+    ACU_MEMORY_GIB,
+    cluster_parameters,
+    instance_memory_gib,
+    instance_parameters,
+)
+
+# 期限切れのクローンを削除する Lambda のソース
+CLONE_REAPER_HANDLER_PATH = "src/common/handlers/clone_reaper"
+# クローンのスタックに付与するタグ (削除 Lambda は CLONE_TAG_EXPIRES_AT を過ぎたスタックを削除する)
+CLONE_TAG_EXPIRES_AT = "clone-expires-at"
+CLONE_TAG_SOURCE = "clone-source"
+
+
+def clone_stack_name(env_name: str, phase: str, clone_name: str) -> str:
+    """クローンのスタック名 (クラスター識別子を兼ねる) を返す. 例: parkings-dev-clone-loadtest."""
+    return f"{env_name}-{phase}-clone-{clone_name}"
+
+
+class AuroraCloneConstruct(Construct):
+    """基盤の Aurora クラスターの copy-on-write クローンを、専用のパラメータグループ・RDS Proxy とともに作成する.
+
+    クローンはクローン元とストレージを共有し、変更されたページのみ追加のストレージを使用する。
+    ネットワーク情報は DatabaseConstruct が SSM パラメータに公開した値を使用するため、VPC のルックアップは不要。
+    """
+
+    def __init__(
+        self,
+        scope: Construct,
+        id: str,
+        project: str,
+        env_name: str,
+        phase: str,
+        clone_name: str,
+        database_param: DatabaseParameter,
+        **kwargs,
+    ) -> None:
+        """
+        :param clone_name: クローン名 (英小文字・数字・ハイフン)
+        :param database_param: クローン元のパラメータ (パラメータグループ・接続プールの設定を引き継ぐ)
+        """
+        super().__init__(scope, id, **kwargs)
+
+        clone_param = database_param.clone
+        identifier = clone_stack_name(env_name, phase, clone_name)
+        source_cluster_identifier = f"{env_name}-{phase}-rds-cluster"
+
+        def source_parameter(key: str) -> str:
+            return ssm.StringParameter.value_for_string_parameter(
+                self, clone_source_parameter_name(project, env_name, phase, key)
+            )
+
+        security_group_id = source_parameter("security-group-id")
+        secret_arn = ssm.StringParameter.value_for_string_parameter(
+            self, proxy_parameter_name(project, env_name, phase, "secret-arn")
+        )
+
+        #########################
+        #   パラメータグループ     #
+        #########################
+        engine = rds.DatabaseClusterEngine.aurora_postgres(version=AURORA_ENGINE_VERSION)
+        cluster_parameter_group = rds.ParameterGroup(
+            self,
+            "ClusterParameterGroup",
+            engine=engine,
+            description=f"{identifier} Aurora cluster parameter group",
+            parameters={
+                **cluster_parameters(
+                    database_param.auto_explain_min_duration_ms,
+                    database_param.slow_query_log.min_duration_ms if database_param.slow_query_log else None,
+                ),
+                **database_param.cluster_parameter_overrides,
+            },
+        )
+        if clone_param.instance_type:
+            tuned_parameters = instance_parameters(instance_memory_gib(clone_param.instance_type))
+        else:
+            tuned_parameters = instance_parameters(clone_param.max_capacity * ACU_MEMORY_GIB, fixed_memory=False)
+        instance_parameter_group = rds.ParameterGroup(
+            self,
+            "InstanceParameterGroup",
+            engine=engine,
+            description=f"{identifier} Aurora instance parameter group",
+            parameters={**tuned_parameters, **database_param.instance_parameter_overrides},
+        )
+
+        #########################
+        #       クローン          #
+        #########################
+        cluster = rds.CfnDBCluster(
+            self,
+            "Cluster",
+            db_cluster_identifier=identifier,
+            engine="aurora-postgresql",
+            source_db_cluster_identifier=source_cluster_identifier,
+            restore_type="copy-on-write",
+            use_latest_restorable_time=True,
+            db_cluster_parameter_group_name=cluster_parameter_group.bind_to_cluster().parameter_group_name,
+            db_subnet_group_name=f"{env_name}-{phase}-rds-subgrp",
+            vpc_security_group_ids=[security_group_id],
+            serverless_v2_scaling_configuration=(
+                None
+                if clone_param.instance_type
+                else rds.CfnDBCluster.ServerlessV2ScalingConfigurationProperty(
+                    min_capacity=clone_param.min_capacity,
+                    max_capacity=clone_param.max_capacity,
+                )
+            ),
+            deletion_protection=False,
+        )
+        # 試験用のため、削除時にスナップショットを取得しない
+        cluster.apply_removal_policy(RemovalPolicy.DESTROY)
+
+        writer = rds.CfnDBInstance(
+            self,
+            "Writer",
+            db_instance_identifier=f"{identifier}-instance-01",
+            db_cluster_identifier=cluster.ref,
+            db_instance_class=f"db.{clone_param.instance_type}" if clone_param.instance_type else "db.serverless",
+            engine="aurora-postgresql",
+            db_parameter_group_name=instance_parameter_group.bind_to_instance().parameter_group_name,
+        )
+        writer.apply_removal_policy(RemovalPolicy.DESTROY)
+
+        #########################
+        #       RDS Proxy       #
+        #########################
+        proxy_role = iam.Role(
+            self,
+            "ProxyRole",
+            assumed_by=iam.ServicePrincipal("rds.amazonaws.com"),
+            description=f"Role for RDS Proxy of {identifier}",
+        )
+        # クローンのユーザー・パスワードはクローン元と同じため、クローン元のシークレットを使用する
+        proxy_role.add_to_policy(iam.PolicyStatement(actions=["secretsmanager:GetSecretValue"], resources=[secret_arn]))
+
+        proxy = rds.CfnDBProxy(
+            self,
+            "Proxy",
+            db_proxy_name=f"{identifier}-proxy",
+            engine_family="POSTGRESQL",
+            auth=[
+                rds.CfnDBProxy.AuthFormatProperty(
+                    auth_scheme="SECRETS",
+                    iam_auth="DISABLED",
+                    secret_arn=secret_arn,
+                )
+            ],
+            role_arn=proxy_role.role_arn,
+            vpc_subnet_ids=Fn.split(",", source_parameter("proxy-subnet-ids")),
+            vpc_security_group_ids=[security_group_id],
+            require_tls=True,
+            idle_client_timeout=database_param.proxy.idle_client_timeout_seconds,
+        )
+
+        proxy_param = database_param.proxy
+        target_group = rds.CfnDBProxyTargetGroup(
+            self,
+            "ProxyTargetGroup",
+            db_proxy_name=proxy.ref,
+            target_group_name="default",
+            db_cluster_identifiers=[cluster.ref],
+            connection_pool_configuration_info=rds.CfnDBProxyTargetGroup.ConnectionPoolConfigurationInfoFormatProperty(
+                max_connections_percent=proxy_param.max_connections_percent,
+                max_idle_connections_percent=proxy_param.max_idle_connections_percent,
+                connection_borrow_timeout=proxy_param.borrow_timeout_seconds,
+            ),
+        )
+        # writer の作成後でなければプロキシのターゲットが利用可能にならない
+        target_group.add_dependency(writer)
+
+        self.cluster_identifier = cluster.ref
+        self.cluster_endpoint = cluster.attr_endpoint_address
+        self.proxy_endpoint = proxy.attr_endpoint
+
+
+class AuroraCloneReaperConstruct(Construct):
+    """有効期限 (タグ) を過ぎたクローンのスタックを、定期的に削除する."""
+
+    def __init__(
+        self,
+        scope: Construct,
+        id: str,
+        project: str,
+        env_name: str,
+        phase: str,
+        database_param: DatabaseParameter,
+        **kwargs,
+    ) -> None:
+        """
+        :param database_param: 削除の間隔 (database_param.clone.reaper_interval_minutes)
+        """
+        super().__init__(scope, id, **kwargs)
+
+        function_name = f"{env_name}-{phase}-clone-reaper"
+        stack_name_prefix = clone_stack_name(env_name, phase, "")
+        stack = Stack.of(self)
+
+        reaper_function_log = logs.LogGroup(
+            self,
+            id="CloneReaperFunctionLog",
+            log_group_name=f"/aws/lambda/{function_name}",
+            retention=logs.RetentionDays.THREE_MONTHS,
+            removal_policy=RemovalPolicy.RETAIN,
+        )
+
+        reaper_function_role = iam.Role(
+            self,
+            id="CloneReaperFunctionRole",
+            role_name=f"{project}-{function_name}-role",
+            assumed_by=iam.ServicePrincipal("lambda.amazonaws.com"),
+        )
+        reaper_function_log.grant_write(reaper_function_role)
+        reaper_function_role.add_to_policy(
+            iam.PolicyStatement(actions=["cloudformation:DescribeStacks"], resources=["*"])
+        )
+        reaper_function_role.add_to_policy(
+            iam.PolicyStatement(
+                actions=["cloudformation:DeleteStack"],
+                resources=[
+                    stack.format_arn(service="cloudformation", resource="stack", resource_name=f"{stack_name_prefix}*/*")
+                ],
+            )
+        )
+        # CDK でデプロイしたスタックは、ブートストラップの実行ロールで削除される
+        reaper_function_role.add_to_policy(
+            iam.PolicyStatement(
+                actions=["iam:PassRole"],
+                resources=[
+                    stack.format_arn(service="iam", region="", resource="role", resource_name="cdk-*-cfn-exec-role-*")
+                ],
+            )
+        )
+
+        reaper_function = _lambda.Function(
+            self,
+            id="CloneReaperFunction",
+            function_name=function_name,
+            runtime=_lambda.Runtime.PYTHON_3_13,
+            code=_lambda.Code.from_asset(CLONE_REAPER_HANDLER_PATH),
+            handler="lambda_function.lambda_handler",
+            role=reaper_function_role,
+            environment={
+                "STACK_NAME_PREFIX": stack_name_prefix,
+                "EXPIRES_AT_TAG": CLONE_TAG_EXPIRES_AT,
+            },
+            timeout=Duration.seconds(60),
+            log_group=reaper_function_log,
+        )
+
+        events.Rule(
+            self,
+            "CloneReaperSchedule",
+            rule_name=function_name,
+            schedule=events.Schedule.rate(Duration.minutes(database_param.clone.reaper_interval_minutes)),
+            targets=[targets.LambdaFunction(reaper_function)],
+        )
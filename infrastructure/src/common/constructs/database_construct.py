@@ -2,15 +2,80 @@ import json
 import os
 from os.path import dirname, join
 
-from aws_cdk import Duration, Stack
+from aws_cdk import ArnFormat, Duration, Fn, RemovalPolicy, Stack
+from aws_cdk import aws_applicationautoscaling as appscaling
 from aws_cdk import aws_ec2 as ec2
 from aws_cdk import aws_iam as iam
 from aws_cdk import aws_lambda as lambda_
+from aws_cdk import aws_logs as logs
 from aws_cdk import aws_rds as rds
 from aws_cdk import aws_secretsmanager as secretsmanager
 from aws_cdk import aws_ssm as ssm
+from aws_cdk import custom_resources as cr
 from constructs import Construct
 
+from config.config import DB_CAPACITY_SERVERLESS_V2, DB_STORAGE_IO_OPTIMIZED, DatabaseParameter
+from src.common.database.parameter_tuning import (
+    ACU_MEMORY_GIB,
+    cluster_parameters,
+    instance_memory_gib,
+    instance_parameters,
+)
+
+# Aurora PostgreSQL / RDS Proxy のポート
+POSTGRES_PORT = 5432
+# ロググループの保持期間 (日) と RetentionDays の対応 (config.LOG_RETENTION_DAYS)
+RETENTION_DAYS = {
+    1: logs.RetentionDays.ONE_DAY,
+    7: logs.RetentionDays.ONE_WEEK,
+    14: logs.RetentionDays.TWO_WEEKS,
+    30: logs.RetentionDays.ONE_MONTH,
+    60: logs.RetentionDays.TWO_MONTHS,
+    90: logs.RetentionDays.THREE_MONTHS,
+    180: logs.RetentionDays.SIX_MONTHS,
+    365: logs.RetentionDays.ONE_YEAR,
+}
+# Aurora PostgreSQL のエンジンバージョン (クローンのパラメータグループも同じバージョンで作成する)
+AURORA_ENGINE_VERSION = rds.AuroraPostgresEngineVersion.VER_17_4
+# RDS Proxy の接続情報を公開する SSM パラメータのキー
+PROXY_PARAMETER_KEYS = ("read-write-endpoint", "read-only-endpoint", "port", "secret-arn")
+# Data API の接続情報を公開する SSM パラメータのキー (シークレットは PROXY_PARAMETER_KEYS の secret-arn を使用する)
+DATA_API_PARAMETER_KEYS = ("cluster-arn",)
+# クローンの作成に必要なネットワーク情報を公開する SSM パラメータのキー
+CLONE_SOURCE_PARAMETER_KEYS = ("security-group-id", "proxy-subnet-ids")
+
+
+def proxy_parameter_name(project: str, env_name: str, phase: str, key: str) -> str:
+    """RDS Proxy の接続情報を公開する SSM パラメータ名を返す.
+
+    例: /npc/parkings/dev/rds/proxy/read-only-endpoint
+    """
+    return f"/{project}/{env_name}/{phase}/rds/proxy/{key}"
+
+
+def data_api_parameter_name(project: str, env_name: str, phase: str, key: str) -> str:
+    """Data API の接続情報を公開する SSM パラメータ名を返す.
+
+    例: /npc/parkings/dev/rds/data-api/cluster-arn
+    """
+    return f"/{project}/{env_name}/{phase}/rds/data-api/{key}"
+
+
+def data_api_role_name(project: str, env_name: str, phase: str, consumer: str) -> str:
+    """他の基盤 (consumer) が Data API を使用する際に引き受けるロール名を返す.
+
+    例: npc-parkings-dev-data-api-auth-role
+    """
+    return f"{project}-{env_name}-{phase}-data-api-{consumer}-role"
+
+
+def clone_source_parameter_name(project: str, env_name: str, phase: str, key: str) -> str:
+    """クローンの作成に必要なネットワーク情報を公開する SSM パラメータ名を返す.
+
+    例: /npc/parkings/dev/rds/clone-source/security-group-id
+    """
+    return f"/{project}/{env_name}/{phase}/rds/clone-source/{key}"
+
 # from dotenv import load_dotenv
 #
 # load_dotenv(verbose=True)
@@ -28,9 +93,18 @@ class DatabaseConstruct(Construct):
         phase: str,
         vpc_obj: object,
         bastion_sg: object,
+        database_param: DatabaseParameter = DatabaseParameter(),
+        physical_name_suffix: str = "",
         **kwargs,
     ) -> None:
+        """
+        :param database_param: キャパシティモード・インスタンスタイプ等のパラメータ (config.DatabaseParameter)
+        :param physical_name_suffix: クラスターを置き換える場合 (config.CidrMigrationParameter.name_suffix) に、
+            カスタムエンドポイントの名前に付与する接尾辞
+        """
         super().__init__(scope, id, **kwargs)
+        self.database_param = database_param
+        self.physical_name_suffix = physical_name_suffix
 
         #########################
         #    Security Group     #
@@ -55,7 +129,7 @@ class DatabaseConstruct(Construct):
         #        )
         rds_sg.add_ingress_rule(
             peer=bastion_sg,
-            connection=ec2.Port.tcp(5432),
+            connection=ec2.Port.tcp(POSTGRES_PORT),
             description="Allow EC2 to access RDS",
         )
 
@@ -86,37 +160,88 @@ class DatabaseConstruct(Construct):
             username="AdminUser",
         )
 
+        # パラメータグループ (メモリに依存する値はインスタンスタイプから算出する)
+        engine = rds.DatabaseClusterEngine.aurora_postgres(
+            version=AURORA_ENGINE_VERSION
+        )
+        slow_query_log = database_param.slow_query_log
+        cluster_parameter_group = rds.ParameterGroup(
+            self,
+            "ClusterParameterGroup",
+            engine=engine,
+            description=f"{env_name}-{phase} Aurora cluster parameter group",
+            parameters={
+                **cluster_parameters(
+                    database_param.auto_explain_min_duration_ms,
+                    slow_query_log.min_duration_ms if slow_query_log else None,
+                ),
+                **database_param.cluster_parameter_overrides,
+            },
+        )
+        self.instance_parameter_group = rds.ParameterGroup(
+            self,
+            "InstanceParameterGroup",
+            engine=engine,
+            description=f"{env_name}-{phase} Aurora instance parameter group",
+            parameters={
+                **self._instance_parameters(),
+                **database_param.instance_parameter_overrides,
+            },
+        )
+
+        # postgresql ログの出力先 (保持期間を管理するため、Aurora が自動作成する前に作成する)
+        cluster_identifier = f"{env_name}-{phase}-rds-cluster"
+        self.postgresql_log_group_obj = None
+        if slow_query_log:
+            self.postgresql_log_group_obj = logs.LogGroup(
+                self,
+                "PostgresqlLogGroup",
+                log_group_name=f"/aws/rds/cluster/{cluster_identifier}/postgresql",
+                retention=RETENTION_DAYS[slow_query_log.log_retention_days],
+                removal_policy=RemovalPolicy.RETAIN,
+            )
+
         # クラスター／インスタンス作成
         aurora = rds.DatabaseCluster(
             self,
             id="Aurora",
-            cluster_identifier=f"{env_name}-{phase}-rds-cluster",
-            engine=rds.DatabaseClusterEngine.aurora_postgres(
-                version=rds.AuroraPostgresEngineVersion.VER_17_4
+            cluster_identifier=cluster_identifier,
+            engine=engine,
+            parameter_group=cluster_parameter_group,
+            # I/O-Optimized の場合のみ指定する (未指定時は標準の aurora)
+            storage_type=(
+                rds.DBClusterStorageType.AURORA_IOPT1
+                if database_param.storage_type == DB_STORAGE_IO_OPTIMIZED
+                else None
             ),
             credentials=rds.Credentials.from_secret(secret=rds_secret),
             vpc=vpc_obj,
             vpc_subnets=ec2.SubnetSelection(
                 subnet_type=ec2.SubnetType.PRIVATE_ISOLATED
             ),
-            writer=rds.ClusterInstance.provisioned(
-                "writer",
-                instance_type=ec2.InstanceType.of(
-                    ec2.InstanceClass.BURSTABLE3, ec2.InstanceSize.LARGE
-                ),
-                instance_identifier=f"{env_name}-{phase}-rds-instance-01",
-                preferred_maintenance_window="Tue:15:30-Tue:16:30",
+            writer=self._cluster_instance(
+                "writer", f"{env_name}-{phase}-rds-instance-01"
             ),
             readers=[
-                rds.ClusterInstance.provisioned(
-                    "reader",
-                    instance_type=ec2.InstanceType.of(
-                        ec2.InstanceClass.BURSTABLE3, ec2.InstanceSize.LARGE
-                    ),
-                    instance_identifier=f"{env_name}-{phase}-rds-instance-02",
-                    preferred_maintenance_window="Tue:15:30-Tue:16:30",
+                self._cluster_instance(
+                    "reader" if index == 0 else f"reader{index + 1}",
+                    f"{env_name}-{phase}-rds-instance-{index + 2:02d}",
+                    # 1台目の reader はフェイルオーバー先となるため、writer と同じ容量までスケールさせる
+                    scale_with_writer=index == 0,
+                )
+                for index in range(database_param.reader_count)
+            ]
+            + [
+                # 分析用の reader はフェイルオーバー先とせず、writer とは独立してスケールさせる
+                self._cluster_instance(
+                    f"analytics{index + 1}",
+                    f"{env_name}-{phase}-rds-analytics-{index + 1:02d}",
+                    scale_with_writer=False,
+                    promotion_tier=15,
                 )
+                for index in range(database_param.analytics_reader_count)
             ],
+            **self._serverless_v2_capacity(),
             security_groups=[rds_sg],
             subnet_group=rds_subnet_group,
             backup=rds.BackupProps(
@@ -125,11 +250,45 @@ class DatabaseConstruct(Construct):
             auto_minor_version_upgrade=False,
             storage_encrypted=True,
             deletion_protection=True,
+            cloudwatch_logs_exports=["postgresql"] if slow_query_log else None,
             monitoring_interval=Duration.seconds(60),
+            **self._performance_insights(),
+            # 未指定時は無効 (False を指定するとテンプレートに差分が出るため None とする)
+            enable_data_api=database_param.data_api or None,
             enable_cluster_level_enhanced_monitoring=True,
             preferred_maintenance_window="Tue:15:30-Tue:16:30",
         )
 
+        if self.postgresql_log_group_obj:
+            aurora.node.add_dependency(self.postgresql_log_group_obj)
+
+        # reader のオートスケーリング
+        if database_param.reader_autoscaling:
+            self._add_reader_autoscaling(aurora, database_param.reader_autoscaling)
+
+        # OLTP 用・分析用のカスタムエンドポイント
+        self.custom_endpoints = {}
+        if database_param.analytics_reader_count:
+            # 分析用の reader はインスタンスの末尾に追加している
+            # (インスタンス識別子の参照とし、インスタンスの物理名の変更に追従させる)
+            analytics_members = aurora.instance_identifiers[-database_param.analytics_reader_count:]
+            # OLTP: 分析用以外の reader (オートスケーリングで追加された reader を含む)
+            self.custom_endpoints["oltp"] = self._add_custom_endpoint(
+                "OltpEndpoint",
+                aurora,
+                endpoint_identifier=f"{env_name}-{phase}-rds-oltp",
+                endpoint_type="READER",
+                excluded_members=analytics_members,
+            )
+            # 分析: 分析用の reader のみ
+            self.custom_endpoints["analytics"] = self._add_custom_endpoint(
+                "AnalyticsEndpoint",
+                aurora,
+                endpoint_identifier=f"{env_name}-{phase}-rds-analytics",
+                endpoint_type="ANY",
+                static_members=analytics_members,
+            )
+
         #########################
         #       RDS Proxy       #
         #########################
@@ -147,6 +306,7 @@ class DatabaseConstruct(Construct):
         rds_secret.grant_read(proxy_role)
 
         # RDS Proxyの作成
+        proxy_param = database_param.proxy
         proxy = rds.DatabaseProxy(
             self,
             "RdsProxy",
@@ -159,8 +319,12 @@ class DatabaseConstruct(Construct):
             ),
             role=proxy_role,
             require_tls=True,
-            idle_client_timeout=Duration.seconds(1800),
-            debug_logging=True,
+            idle_client_timeout=Duration.seconds(proxy_param.idle_client_timeout_seconds),
+            max_connections_percent=proxy_param.max_connections_percent,
+            max_idle_connections_percent=proxy_param.max_idle_connections_percent,
+            borrow_timeout=Duration.seconds(proxy_param.borrow_timeout_seconds),
+            # 詳細ログはオーバーヘッドが大きく SQL 文も出力されるため、dev 以外では常に無効とする
+            debug_logging=proxy_param.debug_logging and phase == "dev",
         )
 
         # 明示的な依存関係を追加
@@ -176,12 +340,323 @@ class DatabaseConstruct(Construct):
                 vpc_obj.private_subnets[0].subnet_id,
                 vpc_obj.private_subnets[1].subnet_id,
             ],
-            # target_role=rds.ProxyEndpointTargetRole.READ_WRITE,
+            # target_role 未指定時は READ_WRITE (指定すると置換が発生するため省略する)
             vpc_security_group_ids=[rds_sg.security_group_id],
         )
         # エンドポイントもproxyに依存させる
         proxy_endpoint.node.add_dependency(proxy)
 
+        # 読み取り専用のプロキシエンドポイント (reader に接続する)
+        proxy_read_only_endpoint = rds.CfnDBProxyEndpoint(
+            self,
+            "ProxyReadOnlyEndpoint",
+            db_proxy_endpoint_name=f"{env_name}-{phase}-rds-proxy-endpoint-ro",
+            db_proxy_name=proxy.db_proxy_name,
+            vpc_subnet_ids=[
+                vpc_obj.private_subnets[0].subnet_id,
+                vpc_obj.private_subnets[1].subnet_id,
+            ],
+            target_role="READ_ONLY",
+            vpc_security_group_ids=[rds_sg.security_group_id],
+        )
+        proxy_read_only_endpoint.node.add_dependency(proxy)
+
+        #########################
+        #    接続情報の公開       #
+        #########################
+
+        # 各基盤のアプリケーションが参照する接続情報を SSM パラメータストアに登録する
+        proxy_parameters = {
+            "read-write-endpoint": proxy_endpoint.attr_endpoint,
+            "read-only-endpoint": proxy_read_only_endpoint.attr_endpoint,
+            "port": str(POSTGRES_PORT),
+            "secret-arn": rds_secret.secret_arn,
+        }
+        for key in PROXY_PARAMETER_KEYS:
+            ssm.StringParameter(
+                self,
+                f"ProxyParameter{key.title().replace('-', '')}",
+                parameter_name=proxy_parameter_name(project, env_name, phase, key),
+                string_value=proxy_parameters[key],
+            )
+
+        # 試験用のクローンは、クローン元と同じセキュリティグループ・サブネットに作成する
+        if database_param.clone:
+            # クローンの RDS Proxy は同じセキュリティグループからクローンに接続する
+            rds_sg.add_ingress_rule(
+                peer=rds_sg,
+                connection=ec2.Port.tcp(POSTGRES_PORT),
+                description="Allow RDS Proxy of clones to access clones",
+            )
+            clone_source_parameters = {
+                "security-group-id": rds_sg.security_group_id,
+                "proxy-subnet-ids": Fn.join(
+                    ",",
+                    [vpc_obj.private_subnets[0].subnet_id, vpc_obj.private_subnets[1].subnet_id],
+                ),
+            }
+            for key in CLONE_SOURCE_PARAMETER_KEYS:
+                ssm.StringParameter(
+                    self,
+                    f"CloneSourceParameter{key.title().replace('-', '')}",
+                    parameter_name=clone_source_parameter_name(project, env_name, phase, key),
+                    string_value=clone_source_parameters[key],
+                )
+
+        self.cluster_obj = aurora
+        self.proxy_obj = proxy
+        self.secret_obj = rds_secret
+
+        #########################
+        #       Data API        #
+        #########################
+        self.data_api_roles = {}
+        if database_param.data_api:
+            ssm.StringParameter(
+                self,
+                "DataApiParameterClusterArn",
+                parameter_name=data_api_parameter_name(project, env_name, phase, "cluster-arn"),
+                string_value=aurora.cluster_arn,
+            )
+
+    #########################
+    #   Data API の権限付与   #
+    #########################
+    def grant_data_api_access(self, grantee: iam.IGrantable) -> iam.Grant:
+        """Data API でクラスターに SQL を実行する権限 (rds-data と、クラスターのシークレットの読み取り) を付与する.
+
+        VPC 外の Lambda でも使用でき、接続プール (RDS Proxy) は経由しない。
+
+        Raises:
+            ValueError: database_param.data_api が無効の場合
+
+        """
+        if not self.database_param.data_api:
+            raise ValueError("Data API is disabled (set DatabaseParameter.data_api)")
+        return self.cluster_obj.grant_data_api_access(grantee)
+
+    def add_data_api_access_role(self, consumer: str, account_id: str, project: str, env_name: str, phase: str) -> iam.Role:
+        """他の基盤 (アカウント) の Lambda が引き受けて Data API を使用するロールを作成する.
+
+        Args:
+            consumer: 利用する基盤名 (例: "auth")
+            account_id: 利用する基盤のアカウント ID (アカウント内のプリンシパルに sts:AssumeRole の許可が必要)
+
+        Returns:
+            作成したロール
+
+        """
+        role = iam.Role(
+            self,
+            f"DataApi{consumer.title()}Role",
+            role_name=data_api_role_name(project, env_name, phase, consumer),
+            assumed_by=iam.AccountPrincipal(account_id),
+            description=f"Data API access to {env_name}-{phase}-rds-cluster from {consumer}",
+        )
+        self.grant_data_api_access(role)
+        self.data_api_roles[consumer] = role
+        return role
+
+    #########################
+    #    インスタンス定義     #
+    #########################
+    def _cluster_instance(
+        self,
+        id: str,
+        instance_identifier: str,
+        scale_with_writer: bool = True,
+        promotion_tier: int = None,
+    ) -> rds.IClusterInstance:
+        """キャパシティモードに応じた writer / reader インスタンスを返す.
+
+        promotion_tier は provisioned モードのみ有効 (serverless_v2 は scale_with_writer で決まる)
+        """
+        if self.database_param.capacity_mode == DB_CAPACITY_SERVERLESS_V2:
+            return rds.ClusterInstance.serverless_v2(
+                id,
+                instance_identifier=instance_identifier,
+                scale_with_writer=scale_with_writer,
+                preferred_maintenance_window="Tue:15:30-Tue:16:30",
+                parameter_group=self.instance_parameter_group,
+            )
+        return rds.ClusterInstance.provisioned(
+            id,
+            instance_type=ec2.InstanceType(self.database_param.instance_type),
+            instance_identifier=instance_identifier,
+            preferred_maintenance_window="Tue:15:30-Tue:16:30",
+            promotion_tier=promotion_tier,
+            parameter_group=self.instance_parameter_group,
+        )
+
+    def _instance_parameters(self) -> dict:
+        """キャパシティモード・インスタンスタイプのメモリ量から、インスタンスパラメータを算出する."""
+        if self.database_param.capacity_mode == DB_CAPACITY_SERVERLESS_V2:
+            # Serverless v2 は最大 ACU のメモリ量を基準とし、バッファは Aurora の自動調整に任せる
+            return instance_parameters(
+                self.database_param.max_capacity * ACU_MEMORY_GIB, fixed_memory=False
+            )
+        return instance_parameters(instance_memory_gib(self.database_param.instance_type))
+
+    def _serverless_v2_capacity(self) -> dict:
+        """serverless_v2 モードの場合に、クラスターに指定する ACU の範囲を返す."""
+        if self.database_param.capacity_mode != DB_CAPACITY_SERVERLESS_V2:
+            return {}
+        capacity = {
+            "serverless_v2_min_capacity": self.database_param.min_capacity,
+            "serverless_v2_max_capacity": self.database_param.max_capacity,
+        }
+        # 最小 0 ACU の場合は、アイドル時間の経過後に自動一時停止する
+        if self.database_param.min_capacity == 0:
+            capacity["serverless_v2_auto_pause_duration"] = Duration.seconds(
+                self.database_param.seconds_until_auto_pause
+            )
+        return capacity
+
+    def _performance_insights(self) -> dict:
+        """Performance Insights が有効な場合に、クラスターに指定する保持期間を返す."""
+        pi_param = self.database_param.performance_insights
+        if not pi_param:
+            return {}
+        if pi_param.retention_months == 0:
+            retention = rds.PerformanceInsightRetention.DEFAULT
+        elif pi_param.retention_months == 24:
+            retention = rds.PerformanceInsightRetention.LONG_TERM
+        else:
+            retention = getattr(rds.PerformanceInsightRetention, f"MONTHS_{pi_param.retention_months}")
+        return {
+            "enable_performance_insights": True,
+            "performance_insight_retention": retention,
+        }
+
+    #########################
+    #   reader のスケーリング  #
+    #########################
+    def _add_reader_autoscaling(self, aurora: rds.DatabaseCluster, autoscaling_param) -> None:
+        """reader 数を CPU 使用率・接続数のターゲット追跡でスケーリングする."""
+        target = appscaling.ScalableTarget(
+            self,
+            "ReaderScalableTarget",
+            service_namespace=appscaling.ServiceNamespace.RDS,
+            resource_id=f"cluster:{aurora.cluster_identifier}",
+            scalable_dimension="rds:cluster:ReadReplicaCount",
+            min_capacity=autoscaling_param.min_readers,
+            max_capacity=autoscaling_param.max_readers,
+            # reader の追加・削除には Aurora 用のサービスリンクロールを使用する (未作成の場合はターゲット登録時に作成される)
+            role=iam.Role.from_role_arn(
+                self,
+                "ReaderScalingRole",
+                Stack.of(self).format_arn(
+                    service="iam",
+                    region="",
+                    resource="role",
+                    resource_name="aws-service-role/rds.application-autoscaling.amazonaws.com/"
+                    "AWSServiceRoleForApplicationAutoScaling_RDSCluster",
+                ),
+            ),
+        )
+        target.node.add_dependency(aurora)
+
+        target.scale_to_track_metric(
+            "ReaderCpuTracking",
+            target_value=autoscaling_param.target_cpu_utilization,
+            predefined_metric=appscaling.PredefinedMetric.RDS_READER_AVERAGE_CPU_UTILIZATION,
+            scale_in_cooldown=Duration.seconds(autoscaling_param.scale_in_cooldown_seconds),
+            scale_out_cooldown=Duration.seconds(autoscaling_param.scale_out_cooldown_seconds),
+        )
+        if autoscaling_param.target_connections is not None:
+            target.scale_to_track_metric(
+                "ReaderConnectionsTracking",
+                target_value=autoscaling_param.target_connections,
+                predefined_metric=appscaling.PredefinedMetric.RDS_READER_AVERAGE_DATABASE_CONNECTIONS,
+                scale_in_cooldown=Duration.seconds(autoscaling_param.scale_in_cooldown_seconds),
+                scale_out_cooldown=Duration.seconds(autoscaling_param.scale_out_cooldown_seconds),
+            )
+
+    def _add_custom_endpoint(
+        self,
+        id: str,
+        aurora: rds.DatabaseCluster,
+        endpoint_identifier: str,
+        endpoint_type: str,
+        static_members: list = None,
+        excluded_members: list = None,
+    ) -> str:
+        """カスタムクラスターエンドポイントを作成し、エンドポイントのアドレスを返す.
+
+        カスタムエンドポイントは CloudFormation のリソースが無いため、RDS API を呼び出すカスタムリソースで作成する。
+        RDS API の更新 (modifyDBClusterEndpoint) ではクラスターを変更できないため、クラスターを置き換える場合は
+        physical_name_suffix で Construct ID・エンドポイント名を変更し、新しいクラスターに作成し直す。
+        """
+        id = f"{id}{self.physical_name_suffix}"
+        endpoint_identifier = f"{endpoint_identifier}{self.physical_name_suffix}"
+        members = {}
+        if static_members:
+            members["StaticMembers"] = static_members
+        if excluded_members:
+            members["ExcludedMembers"] = excluded_members
+
+        stack = Stack.of(self)
+        endpoint = cr.AwsCustomResource(
+            self,
+            id,
+            on_create=cr.AwsSdkCall(
+                service="RDS",
+                action="createDBClusterEndpoint",
+                parameters={
+                    "DBClusterIdentifier": aurora.cluster_identifier,
+                    "DBClusterEndpointIdentifier": endpoint_identifier,
+                    "EndpointType": endpoint_type,
+                    **members,
+                },
+                physical_resource_id=cr.PhysicalResourceId.of(endpoint_identifier),
+            ),
+            on_update=cr.AwsSdkCall(
+                service="RDS",
+                action="modifyDBClusterEndpoint",
+                parameters={
+                    "DBClusterEndpointIdentifier": endpoint_identifier,
+                    "EndpointType": endpoint_type,
+                    "StaticMembers": static_members or [],
+                    "ExcludedMembers": excluded_members or [],
+                },
+                physical_resource_id=cr.PhysicalResourceId.of(endpoint_identifier),
+            ),
+            on_delete=cr.AwsSdkCall(
+                service="RDS",
+                action="deleteDBClusterEndpoint",
+                parameters={"DBClusterEndpointIdentifier": endpoint_identifier},
+            ),
+            policy=cr.AwsCustomResourcePolicy.from_statements(
+                [
+                    iam.PolicyStatement(
+                        actions=[
+                            "rds:CreateDBClusterEndpoint",
+                            "rds:ModifyDBClusterEndpoint",
+                            "rds:DeleteDBClusterEndpoint",
+                        ],
+                        resources=[
+                            stack.format_arn(
+                                service="rds",
+                                resource="cluster",
+                                resource_name=aurora.cluster_identifier,
+                                arn_format=ArnFormat.COLON_RESOURCE_NAME,
+                            ),
+                            stack.format_arn(
+                                service="rds",
+                                resource="cluster-endpoint",
+                                resource_name=endpoint_identifier,
+                                arn_format=ArnFormat.COLON_RESOURCE_NAME,
+                            ),
+                        ],
+                    )
+                ]
+            ),
+            install_latest_aws_sdk=False,
+        )
+        # メンバーのインスタンスの作成後にエンドポイントを作成する
+        endpoint.node.add_dependency(aurora)
+        return endpoint.get_response_field("Endpoint")
+
 
 #        #シークレット
 #        secret_aurora_read_only = secretsmanager.Secret(
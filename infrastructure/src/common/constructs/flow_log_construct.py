@@ -0,0 +1,206 @@
+from aws_cdk import Duration, RemovalPolicy, Stack
+from aws_cdk import aws_ec2 as ec2
+from aws_cdk import aws_glue as glue
+from aws_cdk import aws_iam as iam
+from aws_cdk import aws_s3 as s3
+from constructs import Construct
+
+from config.config import FlowLogParameter
+
+# S3 のキーのプレフィックス (配下は AWSLogs/aws-account-id=/aws-service=vpcflowlogs/aws-region=/year=/month=/day=/hour=/)
+FLOW_LOG_PREFIX = "vpc-flow-logs"
+
+# 出力するフィールドと、Parquet の列名・Glue の型
+# (デフォルトのフィールドに加え、AZ 間の通信・VPC エンドポイントを経由しない通信の調査に使用するフィールドを出力する)
+FLOW_LOG_FIELDS = (
+    (ec2.LogFormat.VERSION, "version", "int"),
+    (ec2.LogFormat.ACCOUNT_ID, "account_id", "string"),
+    (ec2.LogFormat.INTERFACE_ID, "interface_id", "string"),
+    (ec2.LogFormat.SRC_ADDR, "srcaddr", "string"),
+    (ec2.LogFormat.DST_ADDR, "dstaddr", "string"),
+    (ec2.LogFormat.SRC_PORT, "srcport", "int"),
+    (ec2.LogFormat.DST_PORT, "dstport", "int"),
+    (ec2.LogFormat.PROTOCOL, "protocol", "bigint"),
+    (ec2.LogFormat.PACKETS, "packets", "bigint"),
+    (ec2.LogFormat.BYTES, "bytes", "bigint"),
+    (ec2.LogFormat.START_TIMESTAMP, "start", "bigint"),
+    (ec2.LogFormat.END_TIMESTAMP, "end", "bigint"),
+    (ec2.LogFormat.ACTION, "action", "string"),
+    (ec2.LogFormat.LOG_STATUS, "log_status", "string"),
+    (ec2.LogFormat.VPC_ID, "vpc_id", "string"),
+    (ec2.LogFormat.SUBNET_ID, "subnet_id", "string"),
+    (ec2.LogFormat.INSTANCE_ID, "instance_id", "string"),
+    (ec2.LogFormat.AZ_ID, "az_id", "string"),
+    (ec2.LogFormat.PKT_SRC_ADDR, "pkt_srcaddr", "string"),
+    (ec2.LogFormat.PKT_DST_ADDR, "pkt_dstaddr", "string"),
+    (ec2.LogFormat.PKT_SRC_AWS_SERVICE, "pkt_src_aws_service", "string"),
+    (ec2.LogFormat.PKT_DST_AWS_SERVICE, "pkt_dst_aws_service", "string"),
+    (ec2.LogFormat.FLOW_DIRECTION, "flow_direction", "string"),
+    (ec2.LogFormat.TRAFFIC_PATH, "traffic_path", "int"),
+)
+
+# パーティション射影の範囲 (Athena はクエリの条件から S3 のパスを生成するため、パーティションの登録が不要)
+PARTITION_PROJECTION = {
+    "year": ("2025,2099", 4),
+    "month": ("1,12", 2),
+    "day": ("1,31", 2),
+    "hour": ("0,23", 2),
+}
+
+
+class FlowLogConstruct(Construct):
+    """VPC フローログを S3 に Parquet・時間単位の Hive 形式のパーティションで出力し、Glue テーブルに登録する.
+
+    Athena のクエリで year, month, day, hour を条件に指定すると、該当するパーティションのみを読み込む。
+    """
+
+    def __init__(
+        self,
+        scope: Construct,
+        id: str,
+        project: str,
+        env_name: str,
+        phase: str,
+        vpc_obj: ec2.IVpc,
+        flow_log_param: FlowLogParameter,
+        **kwargs,
+    ) -> None:
+        """
+        :param vpc_obj: フローログを出力する VPC
+        :param flow_log_param: フローログのパラメータ (config.FlowLogParameter)
+        """
+        super().__init__(scope, id, **kwargs)
+
+        stack = Stack.of(self)
+
+        #########################
+        #       S3 Bucket       #
+        #########################
+        # フローログ専用のバケット (保持期間を過ぎたオブジェクトは削除する)
+        bucket = s3.Bucket(
+            self,
+            id="FlowLogBucket",
+            bucket_name=f"{project}-{env_name}-{phase}-s3-flow-logs",
+            block_public_access=s3.BlockPublicAccess.BLOCK_ALL,
+            encryption=s3.BucketEncryption.S3_MANAGED,
+            enforce_ssl=True,
+            removal_policy=RemovalPolicy.RETAIN,
+            lifecycle_rules=[
+                s3.LifecycleRule(
+                    id="FlowLogExpiration",
+                    expiration=Duration.days(flow_log_param.retention_days),
+                )
+            ],
+        )
+
+        # フローログの配信 (バケットポリシーは CloudFormation で管理するため、配信元のサービスの権限を明示的に付与する)
+        log_delivery = iam.ServicePrincipal("delivery.logs.amazonaws.com")
+        source_arn = stack.format_arn(service="logs", resource="*")
+        bucket.add_to_resource_policy(
+            iam.PolicyStatement(
+                sid="AWSLogDeliveryWrite",
+                principals=[log_delivery],
+                actions=["s3:PutObject"],
+                # Hive 形式のパーティションの場合、キーは AWSLogs/aws-account-id=<アカウントID>/ 以下となる
+                resources=[bucket.arn_for_objects(f"{FLOW_LOG_PREFIX}/AWSLogs/*")],
+                conditions={
+                    "StringEquals": {"aws:SourceAccount": stack.account, "s3:x-amz-acl": "bucket-owner-full-control"},
+                    "ArnLike": {"aws:SourceArn": source_arn},
+                },
+            )
+        )
+        bucket.add_to_resource_policy(
+            iam.PolicyStatement(
+                sid="AWSLogDeliveryAclCheck",
+                principals=[log_delivery],
+                actions=["s3:GetBucketAcl", "s3:ListBucket"],
+                resources=[bucket.bucket_arn],
+                conditions={
+                    "StringEquals": {"aws:SourceAccount": stack.account},
+                    "ArnLike": {"aws:SourceArn": source_arn},
+                },
+            )
+        )
+
+        #########################
+        #       Flow Log        #
+        #########################
+        flow_log = ec2.FlowLog(
+            self,
+            id="FlowLog",
+            flow_log_name=f"{env_name}-{phase}-vpc-flow-log",
+            resource_type=ec2.FlowLogResourceType.from_vpc(vpc_obj),
+            traffic_type=ec2.FlowLogTrafficType[flow_log_param.traffic_type],
+            max_aggregation_interval=(
+                ec2.FlowLogMaxAggregationInterval.ONE_MINUTE
+                if flow_log_param.max_aggregation_interval_seconds == 60
+                else ec2.FlowLogMaxAggregationInterval.TEN_MINUTES
+            ),
+            log_format=[log_format for log_format, _, _ in FLOW_LOG_FIELDS],
+            destination=ec2.FlowLogDestination.to_s3(
+                bucket,
+                f"{FLOW_LOG_PREFIX}/",
+                file_format=ec2.FlowLogFileFormat.PARQUET,
+                hive_compatible_partitions=True,
+                per_hour_partition=True,
+            ),
+        )
+        flow_log.node.add_dependency(bucket.policy)
+
+        #########################
+        #      Glue Table       #
+        #########################
+        database_name = f"{env_name}_{phase}_network"
+        glue_database = glue.CfnDatabase(
+            self,
+            id="FlowLogDatabase",
+            catalog_id=stack.account,
+            database_input=glue.CfnDatabase.DatabaseInputProperty(name=database_name),
+        )
+
+        location = (
+            f"s3://{bucket.bucket_name}/{FLOW_LOG_PREFIX}/AWSLogs/aws-account-id={stack.account}"
+            f"/aws-service=vpcflowlogs/aws-region={stack.region}"
+        )
+        projection_parameters = {"projection.enabled": "true"}
+        for key, (value_range, digits) in PARTITION_PROJECTION.items():
+            projection_parameters[f"projection.{key}.type"] = "integer"
+            projection_parameters[f"projection.{key}.range"] = value_range
+            projection_parameters[f"projection.{key}.digits"] = str(digits)
+
+        glue_table = glue.CfnTable(
+            self,
+            id="FlowLogTable",
+            catalog_id=stack.account,
+            database_name=database_name,
+            table_input=glue.CfnTable.TableInputProperty(
+                name="vpc_flow_logs",
+                table_type="EXTERNAL_TABLE",
+                parameters={
+                    "EXTERNAL": "TRUE",
+                    "classification": "parquet",
+                    "storage.location.template": f"{location}/year=${{year}}/month=${{month}}/day=${{day}}/hour=${{hour}}",
+                    **projection_parameters,
+                },
+                partition_keys=[
+                    glue.CfnTable.ColumnProperty(name=key, type="string") for key in PARTITION_PROJECTION
+                ],
+                storage_descriptor=glue.CfnTable.StorageDescriptorProperty(
+                    location=location,
+                    columns=[glue.CfnTable.ColumnProperty(name=name, type=type_) for _, name, type_ in FLOW_LOG_FIELDS],
+                    input_format="org.apache.hadoop.hive.ql.io.parquet.MapredParquetInputFormat",
+                    output_format="org.apache.hadoop.hive.ql.io.parquet.MapredParquetOutputFormat",
+                    serde_info=glue.CfnTable.SerdeInfoProperty(
+                        serialization_library="org.apache.hadoop.hive.ql.io.parquet.serde.ParquetHiveSerDe"
+                    ),
+                ),
+            ),
+        )
+        glue_table.add_dependency(glue_database)
+
+        #############################################################
+        #      他Constructで使用するインスタンスをOutput                #
+        #############################################################
+        self.bucket_obj = bucket
+        self.database_name = database_name
+        self.table_name = "vpc_flow_logs"
@@ -1,7 +1,63 @@
-from aws_cdk import Aspects, RemovalPolicy, Tag
+import jsii
+from aws_cdk import Annotations, Aspects, RemovalPolicy, Stack, Tag
 from aws_cdk import aws_ec2 as ec2
 from constructs import Construct
 
+from config.config import (
+    EGRESS_NAT_INSTANCE,
+    EGRESS_NAT_PER_AZ,
+    EGRESS_NONE,
+    EGRESS_SINGLE_NAT,
+    NetworkParameter,
+)
+from src.common.aspects.physical_name_suffix_aspect import PhysicalNameSuffixAspect
+from src.common.constructs.flow_log_construct import FlowLogConstruct
+from src.common.network.cidr_allocator import NetworkAllocation, allocate_network
+
+# VPC エンドポイント (NetworkParameter.vpc_endpoints の属性名) と、Construct ID・サービスの対応
+INTERFACE_ENDPOINTS = {
+    "secrets_manager": ("VpcEndpointSecrets", ec2.InterfaceVpcEndpointAwsService.SECRETS_MANAGER),
+    "ecr": ("VpcEndpointEcr", ec2.InterfaceVpcEndpointAwsService.ECR),
+    "ecr_docker": ("VpcEndpointEcrDocker", ec2.InterfaceVpcEndpointAwsService.ECR_DOCKER),
+    "logs": ("VpcEndpointLogs", ec2.InterfaceVpcEndpointAwsService.CLOUDWATCH_LOGS),
+    "sts": ("VpcEndpointSts", ec2.InterfaceVpcEndpointAwsService.STS),
+    "ssm": ("VpcEndpointSsm", ec2.InterfaceVpcEndpointAwsService.SSM),
+    "kms": ("VpcEndpointKms", ec2.InterfaceVpcEndpointAwsService.KMS),
+    "sqs": ("VpcEndpointSqs", ec2.InterfaceVpcEndpointAwsService.SQS),
+}
+
+# VPC の AZ 数 (CIDR の割り当て・重複の検証にも使用する)
+VPC_MAX_AZS = 2
+
+# サブネット種別と、cidr_allocator のサブネット種別の対応
+SUBNET_TIERS = {
+    ec2.SubnetType.PUBLIC: "public",
+    ec2.SubnetType.PRIVATE_WITH_EGRESS: "protected",
+    ec2.SubnetType.PRIVATE_ISOLATED: "private",
+}
+
+
+@jsii.implements(ec2.IIpAddresses)
+class AllocatedIpAddresses:
+    """cidr_allocator で割り当てた CIDR を VPC・サブネットに使用する IIpAddresses."""
+
+    def __init__(self, allocation: NetworkAllocation) -> None:
+        self.allocation = allocation
+
+    def allocate_vpc_cidr(self) -> ec2.VpcIpamOptions:
+        return ec2.VpcIpamOptions(cidr_block=self.allocation.vpc_cidr)
+
+    def allocate_subnets_cidr(self, *, requested_subnets, vpc_cidr: str) -> ec2.SubnetIpamOptions:
+        # サブネットは種別ごとに AZ 順で要求されるため、種別ごとの出現順を AZ の番号とする
+        az_indexes = {}
+        allocated_subnets = []
+        for requested_subnet in requested_subnets:
+            tier = SUBNET_TIERS[requested_subnet.configuration.subnet_type]
+            az_index = az_indexes.get(tier, 0)
+            az_indexes[tier] = az_index + 1
+            allocated_subnets.append(ec2.AllocatedSubnet(cidr=self.allocation.subnet_cidrs[tier][az_index]))
+        return ec2.SubnetIpamOptions(allocated_subnets=allocated_subnets)
+
 
 class NetworkConstruct(Construct):
 
@@ -12,21 +68,53 @@ class NetworkConstruct(Construct):
         project: str,
         env_name: str,
         phase: str,
+        network_param: NetworkParameter = NetworkParameter(),
         **kwargs,
     ) -> None:
+        """
+        :param network_param: VPC エンドポイント・インターネットへの経路等のパラメータ (config.NetworkParameter)
+        """
         super().__init__(scope, id, **kwargs)
 
         #########################
         #          VPC          #
         #########################
+        # インターネットへの経路 (NAT は AZ ごとに作成し、各 AZ のプライベートサブネットは同じ AZ の NAT にルーティングする)
+        max_azs = VPC_MAX_AZS
+        nat_provider = None
+        if network_param.egress_mode == EGRESS_NAT_INSTANCE:
+            # 受信は VPC 内からのみ許可する (VPC 作成後に設定)
+            nat_provider = ec2.NatProvider.instance_v2(
+                instance_type=ec2.InstanceType(network_param.nat_instance_type),
+                machine_image=ec2.MachineImage.latest_amazon_linux2023(
+                    cpu_type=ec2.AmazonLinuxCpuType.ARM_64
+                ),
+                default_allowed_traffic=ec2.NatTrafficDirection.OUTBOUND_ONLY,
+            )
+        nat_gateways = {
+            EGRESS_NONE: 0,
+            EGRESS_SINGLE_NAT: 1,
+            EGRESS_NAT_PER_AZ: max_azs,
+            EGRESS_NAT_INSTANCE: max_azs,
+        }[network_param.egress_mode]
+        if network_param.egress_mode == EGRESS_SINGLE_NAT and phase == "prod":
+            Annotations.of(self).add_warning_v2(
+                "npc:network:single-nat",
+                "single_nat routes private subnets across AZs; use nat_per_az or nat_instance in prod",
+            )
+
         # VPC
         my_vpc = ec2.Vpc(
             self,
             id="MyVpc",
             vpc_name=f"{env_name}-{phase}-vpc",
-            ip_addresses=ec2.IpAddresses.cidr("10.0.0.0/16"),
-            max_azs=2,
-            nat_gateways=0,  # 必要になったら2にする
+            # 基盤・フェーズごとに重複しない CIDR (cidr_allocator) を使用する (移行前の VPC は legacy_vpc_cidr を維持する)
+            ip_addresses=AllocatedIpAddresses(
+                allocate_network(env_name, phase, max_azs, vpc_cidr=network_param.legacy_vpc_cidr)
+            ),
+            max_azs=max_azs,
+            nat_gateways=nat_gateways,
+            nat_gateway_provider=nat_provider,
             # VPC作成時デフォルトで生成されるセキュリティグループを作成しないようにする設定
             restrict_default_security_group=True,
             subnet_configuration=[
@@ -52,6 +140,13 @@ class NetworkConstruct(Construct):
         )
         my_vpc.apply_removal_policy(RemovalPolicy.DESTROY)
 
+        if nat_provider:
+            nat_provider.connections.allow_from(
+                ec2.Peer.ipv4(my_vpc.vpc_cidr_block),
+                ec2.Port.all_traffic(),
+                "Allow outbound traffic from the VPC through the NAT instance",
+            )
+
         # 各サブネットを取得
         cfn_public_subnet_a = my_vpc.public_subnets[0].node.default_child
         cfn_public_subnet_b = my_vpc.public_subnets[1].node.default_child
@@ -80,14 +175,6 @@ class NetworkConstruct(Construct):
             Tag("Name", f"{env_name}-{phase}-subnet-private-1c")
         )
 
-        # 各サブネットに明示的なCIDRを上書き
-        cfn_public_subnet_a.add_property_override("CidrBlock", "10.0.0.0/24")
-        cfn_public_subnet_b.add_property_override("CidrBlock", "10.0.1.0/24")
-        cfn_privete_egress_subnet_a.add_property_override("CidrBlock", "10.0.10.0/24")
-        cfn_privete_egress_subnet_b.add_property_override("CidrBlock", "10.0.11.0/24")
-        cfn_private_subnet_a.add_property_override("CidrBlock", "10.0.20.0/24")
-        cfn_private_subnet_b.add_property_override("CidrBlock", "10.0.21.0/24")
-
         #########################
         #    Security Group     #
         #########################
@@ -104,25 +191,22 @@ class NetworkConstruct(Construct):
         #      VPC EndPoint     #
         #########################
 
-        # VPCエンドポイント（Secrets Manager）
-        # my_vpc.add_interface_endpoint(
-        #    id="VpcEndpointSecrets",
-        #    service=ec2.InterfaceVpcEndpointAwsService.SECRETS_MANAGER,
-        #    subnets=ec2.SubnetSelection(
-        #        subnet_type=ec2.SubnetType.PRIVATE_WITH_EGRESS
-        #    ),
-        #    security_groups=[vpc_endpoint_sg]
-        # )
-
-        ## VPCエンドポイント（ECR）
-        # my_vpc.add_interface_endpoint(
-        #    id="VpcEndpointEcr",
-        #    service=ec2.InterfaceVpcEndpointAwsService.ECR,
-        #    subnets=ec2.SubnetSelection(
-        #        subnet_type=ec2.SubnetType.PRIVATE_WITH_EGRESS
-        #    ),
-        #    security_groups=[vpc_endpoint_sg]
-        # )
+        # インターフェイス型の VPC エンドポイント (基盤ごとに config で有効にしたもののみ)
+        # プライベート DNS により、プライベートサブネットから通常の API エンドポイント名で NAT を経由せずに接続する
+        endpoint_param = network_param.vpc_endpoints
+        self.interface_endpoints = {}
+        for name, (endpoint_id, service) in INTERFACE_ENDPOINTS.items():
+            if not getattr(endpoint_param, name):
+                continue
+            self.interface_endpoints[name] = my_vpc.add_interface_endpoint(
+                id=endpoint_id,
+                service=service,
+                subnets=ec2.SubnetSelection(
+                    subnet_type=ec2.SubnetType.PRIVATE_WITH_EGRESS
+                ),
+                security_groups=[vpc_endpoint_sg],
+                private_dns_enabled=True,
+            )
 
         # VPCエンドポイント（s3）
         my_vpc.add_gateway_endpoint(
@@ -133,6 +217,41 @@ class NetworkConstruct(Construct):
             ],
         )
 
+        # VPCエンドポイント（DynamoDB）
+        if endpoint_param.dynamodb:
+            my_vpc.add_gateway_endpoint(
+                id="VpcEndpointDynamoDb",
+                service=ec2.GatewayVpcEndpointAwsService.DYNAMODB,
+                subnets=[
+                    ec2.SubnetSelection(subnet_type=ec2.SubnetType.PRIVATE_WITH_EGRESS),
+                    ec2.SubnetSelection(subnet_type=ec2.SubnetType.PRIVATE_ISOLATED),
+                ],
+            )
+
+        #########################
+        #       Flow Log        #
+        #########################
+        # S3 に Parquet で出力し、Glue テーブルから Athena で分析する (config で有効にした基盤のみ)
+        if network_param.flow_logs:
+            FlowLogConstruct(
+                self,
+                id="FlowLogConstruct",
+                project=project,
+                env_name=env_name,
+                phase=phase,
+                vpc_obj=my_vpc,
+                flow_log_param=network_param.flow_logs,
+            )
+
+        # CIDR の移行時は、VPC とともに置き換わるスタック内のリソースの物理名を変更する
+        if network_param.cidr_migration:
+            Aspects.of(Stack.of(self)).add(
+                PhysicalNameSuffixAspect(
+                    network_param.cidr_migration.name_suffix,
+                    db_snapshot_identifier=network_param.cidr_migration.db_snapshot_identifier,
+                )
+            )
+
         #############################################################
         #      他Constructで使用するインスタンスをOutput                #
         #############################################################
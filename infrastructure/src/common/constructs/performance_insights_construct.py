@@ -0,0 +1,100 @@
+from aws_cdk import Duration, RemovalPolicy, Stack
+from aws_cdk import aws_events as events
+from aws_cdk import aws_events_targets as targets
+from aws_cdk import aws_iam as iam
+from aws_cdk import aws_lambda as _lambda
+from aws_cdk import aws_logs as logs
+from aws_cdk import aws_s3 as s3
+from constructs import Construct
+
+from config.config import PerformanceInsightsParameter
+
+# PI コレクタの Lambda のソース
+PI_COLLECTOR_HANDLER_PATH = "src/common/handlers/pi_collector"
+# S3 の保存先 (<prefix>/<table>/cluster=<id>/dt=YYYY-MM-DD/snapshot.parquet)
+SNAPSHOT_PREFIX = "performance-insights"
+
+
+class PerformanceInsightsCollectorConstruct(Construct):
+    """Performance Insights の待機イベント別の DB 負荷と上位の SQL を、日次で S3 に Parquet で保存する."""
+
+    def __init__(
+        self,
+        scope: Construct,
+        id: str,
+        project: str,
+        env_name: str,
+        phase: str,
+        cluster_identifier: str,
+        bucket_obj: s3.IBucket,
+        pi_param: PerformanceInsightsParameter,
+        **kwargs,
+    ) -> None:
+        """
+        :param cluster_identifier: 収集対象の Aurora クラスターの識別子
+        :param bucket_obj: スナップショットの保存先 (ArtifactBucketConstruct.bucket_obj)
+        :param pi_param: 収集する SQL の件数・Parquet 用のレイヤー (config.PerformanceInsightsParameter)
+        """
+        super().__init__(scope, id, **kwargs)
+
+        function_name = f"{env_name}-{phase}-pi-collector"
+
+        collector_function_log = logs.LogGroup(
+            self,
+            id="PiCollectorFunctionLog",
+            log_group_name=f"/aws/lambda/{function_name}",
+            retention=logs.RetentionDays.THREE_MONTHS,
+            removal_policy=RemovalPolicy.RETAIN,
+        )
+
+        collector_function_role = iam.Role(
+            self,
+            id="PiCollectorFunctionRole",
+            role_name=f"{project}-{function_name}-role",
+            assumed_by=iam.ServicePrincipal("lambda.amazonaws.com"),
+        )
+        collector_function_log.grant_write(collector_function_role)
+        # DbiResourceId はデプロイ後に決まるため、アカウント内の RDS の PI メトリクスを対象とする
+        collector_function_role.add_to_policy(
+            iam.PolicyStatement(
+                actions=["pi:GetResourceMetrics", "pi:DescribeDimensionKeys"],
+                resources=[
+                    Stack.of(self).format_arn(service="pi", resource="metrics", resource_name="rds/*")
+                ],
+            )
+        )
+        collector_function_role.add_to_policy(
+            iam.PolicyStatement(actions=["rds:DescribeDBInstances"], resources=["*"])
+        )
+        bucket_obj.grant_put(collector_function_role, f"{SNAPSHOT_PREFIX}/*")
+
+        collector_function = _lambda.Function(
+            self,
+            id="PiCollectorFunction",
+            function_name=function_name,
+            runtime=_lambda.Runtime.PYTHON_3_13,
+            code=_lambda.Code.from_asset(PI_COLLECTOR_HANDLER_PATH),
+            handler="lambda_function.lambda_handler",
+            role=collector_function_role,
+            layers=[
+                _lambda.LayerVersion.from_layer_version_arn(self, "ParquetLayer", pi_param.parquet_layer_arn)
+            ],
+            environment={
+                "BUCKET_NAME": bucket_obj.bucket_name,
+                "PREFIX": SNAPSHOT_PREFIX,
+                "CLUSTER_IDENTIFIER": cluster_identifier,
+                "TOP_SQL_LIMIT": str(pi_param.top_sql_limit),
+            },
+            timeout=Duration.minutes(5),
+            memory_size=512,
+            log_group=collector_function_log,
+        )
+
+        # 前日分 (UTC) を UTC 1:30 に収集する
+        events.Rule(
+            self,
+            "PiCollectorSchedule",
+            rule_name=function_name,
+            schedule=events.Schedule.cron(minute="30", hour="1"),
+            targets=[targets.LambdaFunction(collector_function)],
+        )
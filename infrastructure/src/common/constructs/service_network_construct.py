@@ -0,0 +1,229 @@
+from typing import Dict, Iterable, Optional
+
+from aws_cdk import Annotations, CfnOutput, Stack
+from aws_cdk import aws_ec2 as ec2
+from aws_cdk import aws_iam as iam
+from aws_cdk import aws_lambda as _lambda
+from aws_cdk import aws_ram as ram
+from aws_cdk import aws_vpclattice as vpclattice
+from constructs import Construct
+
+from config.config import ServiceNetworkParameter
+
+# VPC Lattice のサービスのリスナーのポート (証明書は VPC Lattice が生成するサービスのドメインのものを使用する)
+LATTICE_HTTPS_PORT = 443
+
+
+def invoke_policy(account_ids: Iterable[str]) -> dict:
+    """指定したアカウントからの VPC Lattice のサービスの呼び出しを許可する認証ポリシーを返す."""
+    return {
+        "Version": "2012-10-17",
+        "Statement": [
+            {
+                "Effect": "Allow",
+                "Principal": {"AWS": [f"arn:aws:iam::{account_id}:root" for account_id in sorted(set(account_ids))]},
+                "Action": "vpc-lattice-svcs:Invoke",
+                "Resource": "*",
+            }
+        ],
+    }
+
+
+class ServiceNetworkConstruct(Construct):
+    """基盤間のプライベートな通信に使用する VPC Lattice のサービスネットワークに、VPC とサービスを参加させる.
+
+    中央アカウント (Parkings) ではサービスネットワークを作成し、RAM で他の基盤のアカウントに共有する。
+    他の基盤では、共有されたサービスネットワークに ARN で VPC を関連付ける。
+    基盤のサービス (Lambda 等) は add_lambda_service でサービスネットワークに登録し、
+    呼び出し元は VPC Lattice が生成するサービスのドメイン (https) にインターネット・パブリックエンドポイントを経由せずに接続する。
+    他の基盤のアカウントは中央アカウントのデプロイ後までサービスネットワークの ID が確定しないため、2段階でデプロイする (README)。
+    """
+
+    def __init__(
+        self,
+        scope: Construct,
+        id: str,
+        project: str,
+        env_name: str,
+        phase: str,
+        vpc_obj: ec2.IVpc,
+        account_id: str,
+        central_account_id: str,
+        service_network_param: ServiceNetworkParameter,
+        share_account_ids: Optional[Dict[str, str]] = None,
+        **kwargs,
+    ) -> None:
+        """
+        :param vpc_obj: サービスネットワークに関連付ける VPC
+        :param account_id: 基盤のアカウントID
+        :param central_account_id: サービスネットワークを作成する中央アカウント (Parkings) のアカウントID
+        :param service_network_param: サービスネットワークのパラメータ (config.ServiceNetworkParameter)
+        :param share_account_ids: 中央アカウントの場合の、サービスネットワークの共有先 (基盤名: アカウントID)
+        """
+        super().__init__(scope, id, **kwargs)
+
+        self.project = project
+        self.env_name = env_name
+        self.phase = phase
+        self.auth_type = service_network_param.auth_type
+        self.is_central = account_id == central_account_id
+        # サービスを呼び出し可能なアカウント (中央アカウントと共有先の基盤のアカウント)
+        self.member_account_ids = sorted({central_account_id, account_id, *(share_account_ids or {}).values()})
+
+        ##############################
+        #      Service Network       #
+        ##############################
+        if self.is_central:
+            service_network = vpclattice.CfnServiceNetwork(
+                self,
+                id="ServiceNetwork",
+                name=f"{project}-{phase}-service-network",
+                auth_type=self.auth_type,
+            )
+            self.service_network_identifier = service_network.attr_arn
+
+            if self.auth_type == "AWS_IAM":
+                vpclattice.CfnAuthPolicy(
+                    self,
+                    id="ServiceNetworkAuthPolicy",
+                    resource_identifier=service_network.attr_id,
+                    policy=invoke_policy(self.member_account_ids),
+                )
+
+            # 他の基盤のアカウントに RAM で共有する
+            if share_account_ids:
+                ram.CfnResourceShare(
+                    self,
+                    id="ServiceNetworkShare",
+                    name=f"{project}-{phase}-service-network-share",
+                    resource_arns=[service_network.attr_arn],
+                    principals=sorted(set(share_account_ids.values())),
+                    allow_external_principals=service_network_param.allow_external_principals,
+                )
+
+            # 他の基盤の config に設定するサービスネットワークの ID
+            CfnOutput(self, "ServiceNetworkId", value=service_network.attr_id)
+        elif service_network_param.service_network_id:
+            # 共有されたサービスネットワークは、アカウントを跨ぐため ID ではなく ARN で参照する
+            self.service_network_identifier = Stack.of(self).format_arn(
+                service="vpc-lattice",
+                account=central_account_id,
+                resource="servicenetwork",
+                resource_name=service_network_param.service_network_id,
+            )
+        else:
+            # 中央アカウントのデプロイ前は、VPC・サービスをサービスネットワークに関連付けない
+            self.service_network_identifier = None
+            Annotations.of(self).add_warning(
+                f"{env_name}-{phase}: ServiceNetworkParameter.service_network_id is not set; "
+                "the VPC and services are not associated with the service network until the parkings stack is deployed"
+            )
+
+        ##############################
+        #      VPC Association       #
+        ##############################
+        # サービスネットワークへの通信を VPC 内からのみ許可する
+        service_network_sg = ec2.SecurityGroup(
+            self,
+            id="ServiceNetworkSg",
+            vpc=vpc_obj,
+            security_group_name=f"{env_name}-{phase}-sg-service-network",
+        )
+        service_network_sg.add_ingress_rule(
+            peer=ec2.Peer.ipv4(vpc_obj.vpc_cidr_block),
+            connection=ec2.Port.tcp(LATTICE_HTTPS_PORT),
+            description="Allow HTTPS to VPC Lattice services from the VPC",
+        )
+
+        if self.service_network_identifier:
+            vpclattice.CfnServiceNetworkVpcAssociation(
+                self,
+                id="ServiceNetworkVpcAssociation",
+                service_network_identifier=self.service_network_identifier,
+                vpc_identifier=vpc_obj.vpc_id,
+                security_group_ids=[service_network_sg.security_group_id],
+            )
+
+        #############################################################
+        #      他Constructで使用するインスタンスをOutput                #
+        #############################################################
+        self.service_network_sg = service_network_sg
+        self.services = {}
+
+    def add_lambda_service(
+        self,
+        name: str,
+        function: _lambda.IFunction,
+        allowed_account_ids: Optional[Iterable[str]] = None,
+    ) -> vpclattice.CfnService:
+        """Lambda 関数を VPC Lattice のサービスとして作成し、サービスネットワークに登録する.
+
+        :param name: サービス名 (例: authorization)。サービスは {env_name}-{phase}-{name} として作成する
+        :param function: リクエストを処理する Lambda 関数 (イベントは VPC Lattice のイベント構造 V2)
+        :param allowed_account_ids: サービスを呼び出し可能なアカウント。未指定の場合はサービスネットワークの全アカウント
+        """
+        if name in self.services:
+            raise ValueError(f"Service {name} is already registered")
+
+        construct_id = "".join(part.capitalize() for part in name.split("-"))
+        service_name = f"{self.env_name}-{self.phase}-{name}"
+
+        target_group = vpclattice.CfnTargetGroup(
+            self,
+            id=f"{construct_id}TargetGroup",
+            name=f"{service_name}-tg",
+            type="LAMBDA",
+            config=vpclattice.CfnTargetGroup.TargetGroupConfigProperty(lambda_event_structure_version="V2"),
+            targets=[vpclattice.CfnTargetGroup.TargetProperty(id=function.function_arn)],
+        )
+        function.add_permission(
+            f"{construct_id}LatticeInvoke",
+            principal=iam.ServicePrincipal("vpc-lattice.amazonaws.com"),
+            source_arn=target_group.attr_arn,
+        )
+
+        service = vpclattice.CfnService(
+            self,
+            id=f"{construct_id}Service",
+            name=service_name,
+            auth_type=self.auth_type,
+        )
+        vpclattice.CfnListener(
+            self,
+            id=f"{construct_id}Listener",
+            service_identifier=service.attr_id,
+            protocol="HTTPS",
+            port=LATTICE_HTTPS_PORT,
+            default_action=vpclattice.CfnListener.DefaultActionProperty(
+                forward=vpclattice.CfnListener.ForwardProperty(
+                    target_groups=[
+                        vpclattice.CfnListener.WeightedTargetGroupProperty(
+                            target_group_identifier=target_group.attr_id,
+                            weight=100,
+                        )
+                    ]
+                )
+            ),
+        )
+
+        if self.auth_type == "AWS_IAM":
+            vpclattice.CfnAuthPolicy(
+                self,
+                id=f"{construct_id}AuthPolicy",
+                resource_identifier=service.attr_id,
+                policy=invoke_policy(allowed_account_ids or self.member_account_ids),
+            )
+
+        if self.service_network_identifier:
+            vpclattice.CfnServiceNetworkServiceAssociation(
+                self,
+                id=f"{construct_id}ServiceAssociation",
+                service_identifier=service.attr_id,
+                service_network_identifier=self.service_network_identifier,
+            )
+
+        # 呼び出し元は https://<サービスのドメイン> に SigV4 (サービス名: vpc-lattice-svcs) で署名して接続する
+        CfnOutput(self, f"{construct_id}ServiceDomain", value=service.attr_dns_entry_domain_name)
+
+        self.services[name] = service
+        return service
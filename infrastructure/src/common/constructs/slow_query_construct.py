@@ -0,0 +1,140 @@
+from aws_cdk import Duration, RemovalPolicy
+from aws_cdk import aws_events as events
+from aws_cdk import aws_events_targets as targets
+from aws_cdk import aws_iam as iam
+from aws_cdk import aws_lambda as _lambda
+from aws_cdk import aws_logs as logs
+from aws_cdk import aws_logs_destinations as logs_destinations
+from aws_cdk import aws_s3 as s3
+from constructs import Construct
+
+from config.config import SlowQueryLogParameter
+
+# スロークエリの Lambda のソース (slow_query_parser.py を ingest / report で共有する)
+SLOW_QUERY_HANDLER_PATH = "src/common/handlers/slow_query"
+# S3 の保存先 (構造化レコードは dt=YYYY-MM-DD/hour=HH のパーティション)
+RECORD_PREFIX = "slow-query/records"
+REPORT_PREFIX = "slow-query/reports"
+
+
+class SlowQueryPipelineConstruct(Construct):
+    """postgresql ログのスロークエリ・実行計画を S3 に収集し、日次で上位のクエリを集計する."""
+
+    def __init__(
+        self,
+        scope: Construct,
+        id: str,
+        project: str,
+        env_name: str,
+        phase: str,
+        log_group: logs.ILogGroup,
+        bucket_obj: s3.Bucket,
+        slow_query_param: SlowQueryLogParameter,
+        **kwargs,
+    ) -> None:
+        """
+        :param log_group: Aurora の postgresql ログのロググループ (DatabaseConstruct.postgresql_log_group_obj)
+        :param bucket_obj: レコード・レポートの保存先 (ArtifactBucketConstruct.bucket_obj、ライフサイクルルールを追加するため s3.Bucket)
+        :param slow_query_param: 保持期間・レポートの件数 (config.SlowQueryLogParameter)
+        """
+        super().__init__(scope, id, **kwargs)
+
+        bucket_obj.add_lifecycle_rule(
+            id="SlowQueryRecordExpiration",
+            prefix=f"{RECORD_PREFIX}/",
+            expiration=Duration.days(slow_query_param.record_retention_days),
+        )
+
+        environment = {
+            "BUCKET_NAME": bucket_obj.bucket_name,
+            "RECORD_PREFIX": RECORD_PREFIX,
+            "REPORT_PREFIX": REPORT_PREFIX,
+            "TOP_N": str(slow_query_param.report_top_n),
+        }
+
+        ###################################
+        #      SlowQueryIngestFunction    #
+        ###################################
+        ingest_function = self._function(
+            "SlowQueryIngest",
+            project,
+            f"{env_name}-{phase}-slow-query-ingest",
+            handler="lambda_function.ingest_handler",
+            environment=environment,
+            timeout=Duration.seconds(60),
+        )
+        bucket_obj.grant_put(ingest_function, f"{RECORD_PREFIX}/*")
+
+        # 実行時間のログのみを Lambda に送信する
+        logs.SubscriptionFilter(
+            self,
+            "SlowQuerySubscription",
+            log_group=log_group,
+            destination=logs_destinations.LambdaDestination(ingest_function),
+            filter_pattern=logs.FilterPattern.literal('"duration:"'),
+        )
+
+        ###################################
+        #      SlowQueryReportFunction    #
+        ###################################
+        report_function = self._function(
+            "SlowQueryReport",
+            project,
+            f"{env_name}-{phase}-slow-query-report",
+            handler="lambda_function.report_handler",
+            environment=environment,
+            timeout=Duration.minutes(5),
+            memory_size=512,
+        )
+        bucket_obj.grant_read(report_function, f"{RECORD_PREFIX}/*")
+        bucket_obj.grant_put(report_function, f"{REPORT_PREFIX}/*")
+
+        # 前日分のパーティションが揃った後 (UTC 1:00 = JST 10:00) に集計する
+        events.Rule(
+            self,
+            "SlowQueryReportSchedule",
+            rule_name=f"{env_name}-{phase}-slow-query-report",
+            schedule=events.Schedule.cron(minute="0", hour="1"),
+            targets=[targets.LambdaFunction(report_function)],
+        )
+
+    def _function(
+        self,
+        id: str,
+        project: str,
+        function_name: str,
+        handler: str,
+        environment: dict,
+        timeout: Duration,
+        memory_size: int = 256,
+    ) -> _lambda.Function:
+        """ロググループ・IAM ロールを含む、スロークエリの Lambda 関数を作成する."""
+        log_group = logs.LogGroup(
+            self,
+            id=f"{id}FunctionLog",
+            log_group_name=f"/aws/lambda/{function_name}",
+            retention=logs.RetentionDays.THREE_MONTHS,
+            removal_policy=RemovalPolicy.RETAIN,
+        )
+
+        role = iam.Role(
+            self,
+            id=f"{id}FunctionRole",
+            role_name=f"{project}-{function_name}-role",
+            assumed_by=iam.ServicePrincipal("lambda.amazonaws.com"),
+        )
+        log_group.grant_write(role)
+
+        return _lambda.Function(
+            self,
+            id=f"{id}Function",
+            function_name=function_name,
+            runtime=_lambda.Runtime.PYTHON_3_13,
+            code=_lambda.Code.from_asset(SLOW_QUERY_HANDLER_PATH),
+            handler=handler,
+            role=role,
+            environment=environment,
+            timeout=timeout,
+            memory_size=memory_size,
+            log_group=log_group,
+        )
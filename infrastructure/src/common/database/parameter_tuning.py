@@ -0,0 +1,113 @@
+"""インスタンスクラスのメモリ量から、Aurora PostgreSQL のパラメータを算出するモジュール.
+
+インスタンスタイプ (または Serverless v2 の最大 ACU) からメモリ量を求め、shared_buffers 等の
+メモリに依存するパラメータを算出する。インスタンスタイプを変更すると synth 時に再計算される。
+"""
+
+from typing import Dict, Optional
+
+# 1 ACU あたりのメモリ量 (GiB)
+ACU_MEMORY_GIB = 2
+
+# インスタンスサイズごとのメモリ量 (GiB)
+_T_SIZES = {"medium": 4, "large": 8}
+_R_SIZES = {
+    "large": 16,
+    "xlarge": 32,
+    "2xlarge": 64,
+    "4xlarge": 128,
+    "8xlarge": 256,
+    "12xlarge": 384,
+    "16xlarge": 512,
+}
+
+# Aurora PostgreSQL で使用可能なインスタンスタイプごとのメモリ量 (GiB)
+INSTANCE_MEMORY_GIB: Dict[str, int] = {
+    **{f"{family}.{size}": memory for family in ("t3", "t4g") for size, memory in _T_SIZES.items()},
+    **{f"{family}.{size}": memory for family in ("r5", "r6g", "r6i", "r7g", "r7i", "r8g") for size, memory in _R_SIZES.items()},
+}
+
+# PostgreSQL のページサイズ (shared_buffers, effective_cache_size の単位)
+_PAGE_BYTES = 8192
+# max_connections の算出に使用する、接続あたりのメモリ量 (Aurora の既定値の式と同じ)
+_BYTES_PER_CONNECTION = 9531392
+_MAX_CONNECTIONS = 5000
+
+# プリロードする拡張機能
+SHARED_PRELOAD_LIBRARIES = "pg_stat_statements,auto_explain"
+
+
+#########################
+#      ヘルパー関数       #
+#########################
+def _clamp(value: int, lower: int, upper: int) -> int:
+    return max(lower, min(value, upper))
+
+
+def instance_memory_gib(instance_type: str) -> int:
+    """インスタンスタイプ (例: "r6g.large") のメモリ量 (GiB) を返す.
+
+    Raises:
+        ValueError: メモリ量が定義されていないインスタンスタイプの場合
+
+    """
+    memory = INSTANCE_MEMORY_GIB.get(instance_type.removeprefix("db."))
+    if memory is None:
+        raise ValueError(f"Unknown instance type for parameter tuning: {instance_type} (add it to INSTANCE_MEMORY_GIB)")
+    return memory
+
+
+def cluster_parameters(auto_explain_min_duration_ms: int, log_min_duration_ms: Optional[int] = None) -> Dict[str, str]:
+    """クラスターパラメータグループのパラメータを返す.
+
+    Args:
+        auto_explain_min_duration_ms: 実行計画をログに出力する SQL の実行時間の閾値 (ミリ秒)
+        log_min_duration_ms: SQL 文と実行時間をログに出力する閾値 (ミリ秒)。None の場合は出力しない
+
+    Returns:
+        パラメータ名と値の辞書
+
+    """
+    parameters = {
+        "shared_preload_libraries": SHARED_PRELOAD_LIBRARIES,
+        "pg_stat_statements.track": "top",
+        "pg_stat_statements.max": "10000",
+        "auto_explain.log_min_duration": str(auto_explain_min_duration_ms),
+        "auto_explain.log_format": "json",
+        # log_analyze は全 SQL の実行時間を計測するオーバーヘッドがあるため無効とする
+        "auto_explain.log_analyze": "0",
+        # Aurora のストレージはランダムアクセスのコストがシーケンシャルと大差ない
+        "random_page_cost": "1.1",
+    }
+    if log_min_duration_ms is not None:
+        parameters["log_min_duration_statement"] = str(log_min_duration_ms)
+    return parameters
+
+
+def instance_parameters(memory_gib: float, fixed_memory: bool = True) -> Dict[str, str]:
+    """インスタンスのメモリ量から、インスタンスパラメータグループのパラメータを算出する.
+
+    Args:
+        memory_gib: インスタンスのメモリ量 (Serverless v2 の場合は最大 ACU のメモリ量)
+        fixed_memory: False の場合 (Serverless v2) は、キャパシティに応じて Aurora が調整する
+            shared_buffers / effective_cache_size を設定しない
+
+    Returns:
+        パラメータ名と値の辞書
+
+    """
+    memory_bytes = int(memory_gib * 1024**3)
+    max_connections = min(memory_bytes // _BYTES_PER_CONNECTION, _MAX_CONNECTIONS)
+    parameters = {
+        "max_connections": str(max_connections),
+        # メモリの 1/4 を全接続のソート・ハッシュに割り当てる (4MB〜256MB)
+        "work_mem": str(_clamp(memory_bytes // 4 // max_connections // 1024, 4096, 262144)),
+        # VACUUM・インデックス作成用 (64MB〜2GB)
+        "maintenance_work_mem": str(_clamp(memory_bytes // 16 // 1024, 65536, 2097152)),
+    }
+    if fixed_memory:
+        # Aurora は OS のページキャッシュを使用しないため、共有バッファを大きく取りキャッシュサイズも同等とする
+        buffer_pages = int(memory_bytes * 0.7) // _PAGE_BYTES
+        parameters["shared_buffers"] = str(buffer_pages)
+        parameters["effective_cache_size"] = str(buffer_pages)
+    return parameters
@@ -0,0 +1,37 @@
+import os
+from datetime import datetime, timezone
+
+import boto3
+
+cloudformation = boto3.client("cloudformation")
+
+STACK_NAME_PREFIX = os.environ.get("STACK_NAME_PREFIX", "")
+EXPIRES_AT_TAG = os.environ.get("EXPIRES_AT_TAG", "clone-expires-at")
+# 削除中・削除済みのスタックは対象外とする
+SKIP_STATUSES = ("DELETE_IN_PROGRESS", "DELETE_COMPLETE")
+
+
+def expired_stacks(stacks, now):
+    """有効期限のタグを過ぎたクローンのスタック名を返す."""
+    expired = []
+    for stack in stacks:
+        if not stack["StackName"].startswith(STACK_NAME_PREFIX) or stack["StackStatus"] in SKIP_STATUSES:
+            continue
+        tags = {tag["Key"]: tag["Value"] for tag in stack.get("Tags", [])}
+        if EXPIRES_AT_TAG not in tags:
+            continue
+        if datetime.fromisoformat(tags[EXPIRES_AT_TAG]) <= now:
+            expired.append(stack["StackName"])
+    return expired
+
+
+def lambda_handler(event, context):
+    stacks = []
+    for page in cloudformation.get_paginator("describe_stacks").paginate():
+        stacks.extend(page["Stacks"])
+
+    deleted = expired_stacks(stacks, datetime.now(timezone.utc))
+    for stack_name in deleted:
+        print(f"Deleting expired clone stack: {stack_name}")
+        cloudformation.delete_stack(StackName=stack_name)
+    return {"deleted": deleted}
@@ -0,0 +1,31 @@
+import os
+from datetime import date, datetime, timedelta, timezone
+
+import boto3
+
+from pi_collector import Boto3PerformanceInsightsClient, collect_snapshot, to_parquet
+
+s3 = boto3.client("s3")
+
+BUCKET_NAME = os.environ.get("BUCKET_NAME", "")
+PREFIX = os.environ.get("PREFIX", "performance-insights")
+CLUSTER_IDENTIFIER = os.environ.get("CLUSTER_IDENTIFIER", "")
+TOP_SQL_LIMIT = int(os.environ.get("TOP_SQL_LIMIT", "25"))
+
+
+def lambda_handler(event, context):
+    """前日 (event の date で指定可能) の PI のスナップショットを、テーブルごとに Parquet で S3 に保存する."""
+    target_date = (
+        date.fromisoformat(event["date"]) if event.get("date") else (datetime.now(timezone.utc) - timedelta(days=1)).date()
+    )
+    snapshot = collect_snapshot(Boto3PerformanceInsightsClient(), CLUSTER_IDENTIFIER, target_date, TOP_SQL_LIMIT)
+
+    keys = []
+    for table, rows in snapshot.tables.items():
+        if not rows:
+            continue
+        key = f"{PREFIX}/{table}/cluster={CLUSTER_IDENTIFIER}/dt={snapshot.date}/snapshot.parquet"
+        s3.put_object(Bucket=BUCKET_NAME, Key=key, Body=to_parquet(rows))
+        keys.append(key)
+    print(f"Wrote {len(keys)} objects for {snapshot.date}: {keys}")
+    return {"keys": keys}
@@ -0,0 +1,224 @@
+"""Performance Insights (PI) API から、待機イベント別の DB 負荷と上位の SQL を日次のスナップショットとして収集するモジュール.
+
+PI API の呼び出しは PerformanceInsightsClient に集約しているため、StubPerformanceInsightsClient に差し替えることで
+AWS を使用せずに収集・変換処理を確認できる。
+
+    client = StubPerformanceInsightsClient()
+    snapshot = collect_snapshot(client, "parkings-dev-rds-cluster", date(2026, 10, 17))
+"""
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Dict, List, Optional
+
+# 待機イベント別の DB 負荷の集計単位 (秒)
+PERIOD_SECONDS = 3600
+# 取得する待機イベント数の上限 (上位以外は PI API が集計しない)
+WAIT_EVENT_LIMIT = 10
+
+
+@dataclass(frozen=True)
+class DbInstance:
+    """PI の収集対象のインスタンス."""
+
+    instance_identifier: str
+    # PI API の識別子 (DbiResourceId, 例: db-ABCDEFGHIJKL)
+    resource_id: str
+
+
+@dataclass
+class Snapshot:
+    """日次のスナップショット. テーブル名 (S3 のプレフィックス) ごとの行のリスト."""
+
+    date: str
+    tables: Dict[str, List[dict]] = field(default_factory=dict)
+
+
+class PerformanceInsightsClient(ABC):
+    """PI API・RDS API の呼び出しをまとめたクライアントの基底クラス."""
+
+    @abstractmethod
+    def list_instances(self, cluster_identifier: str) -> List[DbInstance]:
+        """クラスターのインスタンスのうち、PI が有効なものを返す."""
+
+    @abstractmethod
+    def db_load_by_wait_event(self, resource_id: str, start: datetime, end: datetime) -> List[dict]:
+        """待機イベント別の DB 負荷 (平均アクティブセッション数) を、PERIOD_SECONDS ごとに返す.
+
+        Returns:
+            timestamp・wait_event・wait_event_type・db_load を持つ辞書のリスト
+
+        """
+
+    @abstractmethod
+    def top_sql(self, resource_id: str, start: datetime, end: datetime, limit: int) -> List[dict]:
+        """期間中の DB 負荷の上位の SQL (正規化済み) を返す.
+
+        Returns:
+            sql_id・statement・db_load を持つ辞書のリスト
+
+        """
+
+
+class Boto3PerformanceInsightsClient(PerformanceInsightsClient):
+    """boto3 で PI API・RDS API を呼び出すクライアント."""
+
+    def __init__(self, pi_client=None, rds_client=None) -> None:
+        import boto3
+
+        self.pi = pi_client or boto3.client("pi")
+        self.rds = rds_client or boto3.client("rds")
+
+    def list_instances(self, cluster_identifier: str) -> List[DbInstance]:
+        instances = []
+        paginator = self.rds.get_paginator("describe_db_instances")
+        for page in paginator.paginate(Filters=[{"Name": "db-cluster-id", "Values": [cluster_identifier]}]):
+            for instance in page["DBInstances"]:
+                if instance.get("PerformanceInsightsEnabled"):
+                    instances.append(DbInstance(instance["DBInstanceIdentifier"], instance["DbiResourceId"]))
+        return instances
+
+    def db_load_by_wait_event(self, resource_id: str, start: datetime, end: datetime) -> List[dict]:
+        response = self.pi.get_resource_metrics(
+            ServiceType="RDS",
+            Identifier=resource_id,
+            MetricQueries=[
+                {
+                    "Metric": "db.load.avg",
+                    "GroupBy": {"Group": "db.wait_event", "Limit": WAIT_EVENT_LIMIT},
+                }
+            ],
+            StartTime=start,
+            EndTime=end,
+            PeriodInSeconds=PERIOD_SECONDS,
+        )
+        rows = []
+        for metric in response["MetricList"]:
+            dimensions = metric["Key"].get("Dimensions")
+            # グループ化していない合計値の系列は除外する
+            if not dimensions:
+                continue
+            for point in metric["DataPoints"]:
+                if "Value" not in point:
+                    continue
+                rows.append(
+                    {
+                        "timestamp": point["Timestamp"],
+                        "wait_event": dimensions.get("db.wait_event.name", ""),
+                        "wait_event_type": dimensions.get("db.wait_event.type", ""),
+                        "db_load": point["Value"],
+                    }
+                )
+        return rows
+
+    def top_sql(self, resource_id: str, start: datetime, end: datetime, limit: int) -> List[dict]:
+        response = self.pi.describe_dimension_keys(
+            ServiceType="RDS",
+            Identifier=resource_id,
+            StartTime=start,
+            EndTime=end,
+            Metric="db.load.avg",
+            GroupBy={
+                "Group": "db.sql_tokenized",
+                "Dimensions": ["db.sql_tokenized.id", "db.sql_tokenized.statement"],
+                "Limit": limit,
+            },
+        )
+        return [
+            {
+                "sql_id": key["Dimensions"].get("db.sql_tokenized.id", ""),
+                "statement": key["Dimensions"].get("db.sql_tokenized.statement", ""),
+                "db_load": key.get("Total", 0.0),
+            }
+            for key in response["Keys"]
+        ]
+
+
+class StubPerformanceInsightsClient(PerformanceInsightsClient):
+    """AWS を使用せず、固定値を返すクライアント (収集・変換処理の動作確認用)."""
+
+    def __init__(
+        self,
+        instances: Optional[List[DbInstance]] = None,
+        wait_events: Optional[Dict[str, float]] = None,
+        top_sql_rows: Optional[List[dict]] = None,
+    ) -> None:
+        """
+        :param instances: list_instances が返すインスタンス
+        :param wait_events: 待機イベント名 ("<type>:<name>") ごとの DB 負荷 (全期間で一定とする)
+        :param top_sql_rows: top_sql が返す行
+        """
+        self.instances = instances or [DbInstance("stub-rds-instance-01", "db-STUB0000000001")]
+        self.wait_events = wait_events or {"CPU:CPU": 0.5, "IO:DataFileRead": 0.2}
+        self.top_sql_rows = top_sql_rows or [{"sql_id": "STUB0001", "statement": "SELECT * FROM stub WHERE id = ?", "db_load": 0.3}]
+        # 呼び出しの記録 (引数の確認用)
+        self.calls: List[tuple] = []
+
+    def list_instances(self, cluster_identifier: str) -> List[DbInstance]:
+        self.calls.append(("list_instances", cluster_identifier))
+        return list(self.instances)
+
+    def db_load_by_wait_event(self, resource_id: str, start: datetime, end: datetime) -> List[dict]:
+        self.calls.append(("db_load_by_wait_event", resource_id, start, end))
+        rows = []
+        timestamp = start
+        while timestamp < end:
+            for wait_event, db_load in self.wait_events.items():
+                wait_event_type, name = wait_event.split(":", 1)
+                rows.append({"timestamp": timestamp, "wait_event": name, "wait_event_type": wait_event_type, "db_load": db_load})
+            timestamp += timedelta(seconds=PERIOD_SECONDS)
+        return rows
+
+    def top_sql(self, resource_id: str, start: datetime, end: datetime, limit: int) -> List[dict]:
+        self.calls.append(("top_sql", resource_id, start, end, limit))
+        return [dict(row) for row in self.top_sql_rows[:limit]]
+
+
+#########################
+#      ヘルパー関数       #
+#########################
+def collect_snapshot(
+    client: PerformanceInsightsClient,
+    cluster_identifier: str,
+    target_date: date,
+    top_sql_limit: int = 25,
+) -> Snapshot:
+    """指定日 (UTC) の待機イベント別の DB 負荷と上位の SQL を、クラスターの全インスタンスについて収集する.
+
+    Args:
+        client: PI API のクライアント
+        cluster_identifier: Aurora クラスターの識別子
+        target_date: 収集対象日 (UTC の 0:00〜24:00)
+        top_sql_limit: インスタンスごとに収集する SQL の件数
+
+    Returns:
+        "wait_events" と "top_sql" の行を持つ Snapshot
+
+    """
+    start = datetime.combine(target_date, time.min, tzinfo=timezone.utc)
+    end = start + timedelta(days=1)
+    snapshot = Snapshot(date=target_date.isoformat(), tables={"wait_events": [], "top_sql": []})
+    for instance in client.list_instances(cluster_identifier):
+        common = {
+            "date": snapshot.date,
+            "cluster_identifier": cluster_identifier,
+            "instance_identifier": instance.instance_identifier,
+        }
+        for row in client.db_load_by_wait_event(instance.resource_id, start, end):
+            snapshot.tables["wait_events"].append({**common, **row, "timestamp": row["timestamp"].isoformat()})
+        for rank, row in enumerate(client.top_sql(instance.resource_id, start, end, top_sql_limit), start=1):
+            snapshot.tables["top_sql"].append({**common, "rank": rank, **row})
+    return snapshot
+
+
+def to_parquet(rows: List[dict]) -> bytes:
+    """行のリストを Parquet に変換する (pyarrow は Lambda レイヤーで提供する)."""
+    import io
+
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    buffer = io.BytesIO()
+    pq.write_table(pa.Table.from_pylist(rows), buffer, compression="snappy")
+    return buffer.getvalue()
@@ -0,0 +1,66 @@
+import base64
+import gzip
+import json
+import os
+from collections import defaultdict
+from dataclasses import asdict
+from datetime import datetime, timedelta, timezone
+
+import boto3
+
+from slow_query_parser import parse_log, top_queries
+
+s3 = boto3.client("s3")
+
+BUCKET_NAME = os.environ.get("BUCKET_NAME", "")
+RECORD_PREFIX = os.environ.get("RECORD_PREFIX", "slow-query/records")
+REPORT_PREFIX = os.environ.get("REPORT_PREFIX", "slow-query/reports")
+TOP_N = int(os.environ.get("TOP_N", "20"))
+
+
+def ingest_handler(event, context):
+    """CloudWatch Logs のサブスクリプションで受け取った postgresql ログを、時間単位のパーティションで S3 に保存する."""
+    data = json.loads(gzip.decompress(base64.b64decode(event["awslogs"]["data"])))
+    if data.get("messageType") != "DATA_MESSAGE":
+        return {"records": 0}
+
+    records = []
+    for log_event in data["logEvents"]:
+        records.extend(parse_log(log_event["message"]))
+
+    partitions = defaultdict(list)
+    for record in records:
+        partitions[record.partition].append(json.dumps(asdict(record), ensure_ascii=False))
+    # オブジェクト名はログストリーム名 (インスタンス識別子) と先頭のイベント ID とし、再送時は上書きする
+    first_event_id = data["logEvents"][0]["id"]
+    for partition, lines in partitions.items():
+        s3.put_object(
+            Bucket=BUCKET_NAME,
+            Key=f"{RECORD_PREFIX}/{partition}/{data['logStream']}-{first_event_id}.json.gz",
+            Body=gzip.compress("\n".join(lines).encode("utf-8")),
+            ContentType="application/x-ndjson",
+        )
+    return {"records": len(records)}
+
+
+def report_handler(event, context):
+    """前日 (event の date で指定可能) のスロークエリを集計し、合計実行時間の上位のクエリのレポートを S3 に保存する."""
+    date = event.get("date") or (datetime.now(timezone.utc) - timedelta(days=1)).strftime("%Y-%m-%d")
+
+    records = []
+    paginator = s3.get_paginator("list_objects_v2")
+    for page in paginator.paginate(Bucket=BUCKET_NAME, Prefix=f"{RECORD_PREFIX}/dt={date}/"):
+        for obj in page.get("Contents", []):
+            body = s3.get_object(Bucket=BUCKET_NAME, Key=obj["Key"])["Body"].read()
+            records.extend(json.loads(line) for line in gzip.decompress(body).decode("utf-8").splitlines() if line)
+
+    report = {"date": date, "records": len(records), "top_queries": top_queries(records, TOP_N)}
+    key = f"{REPORT_PREFIX}/dt={date}/top-queries.json"
+    s3.put_object(
+        Bucket=BUCKET_NAME,
+        Key=key,
+        Body=json.dumps(report, ensure_ascii=False, indent=2).encode("utf-8"),
+        ContentType="application/json",
+    )
+    print(f"Wrote {key}: {len(records)} records, {len(report['top_queries'])} queries")
+    return {"report": key}
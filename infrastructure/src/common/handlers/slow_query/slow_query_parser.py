@@ -0,0 +1,205 @@
+"""Aurora PostgreSQL のログ (postgresql ログ) から、スロークエリ・実行計画を構造化レコードに変換するモジュール.
+
+log_min_duration_statement によるスロークエリのログと、auto_explain (log_format=json) による実行計画のログを
+解析する。AWS SDK 等に依存しないため、ログファイルを読み込んで単体でテストできる。
+
+    with open("postgresql.log.2026-10-17-03") as f:
+        records = parse_log(f.read())
+    report = top_queries([asdict(record) for record in records], top_n=20)
+"""
+
+import hashlib
+import json
+import re
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional
+
+# Aurora PostgreSQL のログの接頭辞 (log_line_prefix = "%t:%r:%u@%d:[%p]:", 変更不可)
+# 例: 2026-10-17 03:12:45 UTC:10.0.1.23(45678):AdminUser@parkings_dev_rds:[12345]:LOG:  duration: ...
+_PREFIX_PATTERN = re.compile(
+    r"^(?P<date>\d{4}-\d{2}-\d{2}) (?P<time>\d{2}:\d{2}:\d{2})(?:\.\d+)? \w+:"
+    r"(?P<client>[^:]*):(?P<user>[^@:]*)@(?P<database>[^:]*):\[(?P<pid>\d+)\]:"
+    r"(?P<level>[A-Z0-9]+):\s+(?P<message>.*)$",
+    re.DOTALL,
+)
+# 実行時間のログ。execute は拡張問合せプロトコル (プリペアドステートメント) の場合
+_DURATION_PATTERN = re.compile(
+    r"^duration: (?P<duration>\d+(?:\.\d+)?) ms\s+(?P<kind>statement|execute [^:]*|bind [^:]*|parse [^:]*|plan):\s*(?P<body>.*)$",
+    re.DOTALL,
+)
+
+# レコードの種別
+KIND_STATEMENT = "statement"
+KIND_PLAN = "plan"
+
+# クエリの正規化 (リテラル・パラメータをプレースホルダに置き換え、同じ形のクエリを同一視する)
+_NORMALIZE_PATTERNS = [
+    (re.compile(r"/\*.*?\*/", re.DOTALL), " "),
+    (re.compile(r"--[^\n]*"), " "),
+    (re.compile(r"'(?:[^']|'')*'"), "?"),
+    (re.compile(r"\$\d+"), "?"),
+    (re.compile(r"\b\d+(?:\.\d+)?\b"), "?"),
+    (re.compile(r"\s+"), " "),
+    # IN (?, ?, ?) や VALUES (?, ?), (?, ?) は要素数が異なっても同一視する
+    (re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)"), "(?)"),
+    (re.compile(r"\(\?\)(?:\s*,\s*\(\?\))+"), "(?)"),
+]
+
+
+@dataclass
+class SlowQueryRecord:
+    """スロークエリ・実行計画の構造化レコード."""
+
+    # ログの出力日時 (UTC, ISO 8601)
+    timestamp: str
+    database: str
+    user: str
+    client: str
+    pid: int
+    # "statement": スロークエリ, "plan": auto_explain の実行計画
+    kind: str
+    duration_ms: float
+    query: str
+    # 正規化したクエリとそのハッシュ値 (集計キー)
+    normalized_query: str
+    fingerprint: str
+    # auto_explain の実行計画 (JSON 文字列)。kind が "plan" の場合のみ
+    plan: Optional[str] = None
+
+    @property
+    def partition(self) -> str:
+        """S3 の時間単位のパーティション (例: "dt=2026-10-17/hour=03")."""
+        return f"dt={self.timestamp[:10]}/hour={self.timestamp[11:13]}"
+
+
+#########################
+#      ヘルパー関数       #
+#########################
+def normalize_query(query: str) -> str:
+    """リテラル・パラメータ・コメントを除去し、同じ形のクエリが同じ文字列となるよう正規化する."""
+    normalized = query
+    for pattern, replacement in _NORMALIZE_PATTERNS:
+        normalized = pattern.sub(replacement, normalized)
+    return normalized.strip().rstrip(";").strip().lower()
+
+
+def query_fingerprint(normalized_query: str) -> str:
+    """正規化したクエリのハッシュ値 (16桁) を返す."""
+    return hashlib.sha1(normalized_query.encode("utf-8")).hexdigest()[:16]
+
+
+def split_entries(lines: Iterable[str]) -> Iterator[str]:
+    """ログの行を、接頭辞で始まるエントリごとに結合する (実行計画等の複数行のエントリに対応)."""
+    entry: List[str] = []
+    for line in lines:
+        line = line.rstrip("\n")
+        if _PREFIX_PATTERN.match(line) and entry:
+            yield "\n".join(entry)
+            entry = []
+        if entry or _PREFIX_PATTERN.match(line):
+            entry.append(line)
+    if entry:
+        yield "\n".join(entry)
+
+
+def parse_entry(entry: str) -> Optional[SlowQueryRecord]:
+    """ログのエントリを解析し、スロークエリ・実行計画のレコードを返す.
+
+    Returns:
+        SlowQueryRecord。実行時間のログ以外 (エラー・DETAIL 等) や、解析できない実行計画の場合は None
+
+    """
+    prefix = _PREFIX_PATTERN.match(entry)
+    if not prefix or prefix["level"] != "LOG":
+        return None
+    duration = _DURATION_PATTERN.match(prefix["message"])
+    if not duration:
+        return None
+
+    kind = duration["kind"].split(" ")[0]
+    body = duration["body"].strip()
+    plan = None
+    if kind == KIND_PLAN:
+        try:
+            plan_json = json.loads(body)
+        except json.JSONDecodeError:
+            return None
+        query = plan_json.get("Query Text", "")
+        plan = json.dumps(plan_json.get("Plan", {}), separators=(",", ":"))
+    elif kind in ("statement", "execute"):
+        kind = KIND_STATEMENT
+        query = body
+    else:
+        # parse / bind は execute と重複して計上されるため対象外とする
+        return None
+
+    normalized_query = normalize_query(query)
+    return SlowQueryRecord(
+        timestamp=f"{prefix['date']}T{prefix['time']}Z",
+        database=prefix["database"],
+        user=prefix["user"],
+        client=prefix["client"],
+        pid=int(prefix["pid"]),
+        kind=kind,
+        duration_ms=float(duration["duration"]),
+        query=query,
+        normalized_query=normalized_query,
+        fingerprint=query_fingerprint(normalized_query),
+        plan=plan,
+    )
+
+
+def parse_log(text: str) -> List[SlowQueryRecord]:
+    """ログファイル・ログイベントのテキストから、スロークエリ・実行計画のレコードを返す."""
+    records = []
+    for entry in split_entries(text.splitlines()):
+        record = parse_entry(entry)
+        if record:
+            records.append(record)
+    return records
+
+
+def top_queries(records: Iterable[Mapping], top_n: int = 20) -> List[Dict]:
+    """スロークエリのレコードをクエリのハッシュ値ごとに集計し、合計実行時間の上位を返す.
+
+    Args:
+        records: SlowQueryRecord を辞書に変換したもの (S3 から読み込んだ JSON Lines)
+        top_n: 返すクエリの件数
+
+    Returns:
+        合計実行時間の降順に、fingerprint・正規化したクエリ・回数・合計/平均/最大実行時間・実行計画の件数を持つ辞書のリスト
+
+    """
+    stats: Dict[str, Dict] = {}
+    for record in records:
+        query_stats = stats.setdefault(
+            record["fingerprint"],
+            {
+                "fingerprint": record["fingerprint"],
+                "normalized_query": record["normalized_query"],
+                "databases": set(),
+                "calls": 0,
+                "total_ms": 0.0,
+                "max_ms": 0.0,
+                "plans": 0,
+            },
+        )
+        # 実行計画は同じ実行のスロークエリと重複するため、件数のみ計上する
+        if record["kind"] == KIND_PLAN:
+            query_stats["plans"] += 1
+            continue
+        query_stats["databases"].add(record["database"])
+        query_stats["calls"] += 1
+        query_stats["total_ms"] += record["duration_ms"]
+        query_stats["max_ms"] = max(query_stats["max_ms"], record["duration_ms"])
+
+    ranking = sorted((s for s in stats.values() if s["calls"]), key=lambda s: s["total_ms"], reverse=True)[:top_n]
+    return [
+        {
+            **query_stats,
+            "databases": sorted(query_stats["databases"]),
+            "total_ms": round(query_stats["total_ms"], 3),
+            "mean_ms": round(query_stats["total_ms"] / query_stats["calls"], 3),
+        }
+        for query_stats in ranking
+    ]
@@ -0,0 +1,160 @@
+"""基盤・フェーズごとに、重複しない VPC・サブネットの CIDR を決定的に割り当てるモジュール.
+
+VPC は 10.<フェーズのオフセット + 基盤の番号>.0.0/16 とし、サブネットは種別ごとに10個分の /24 の枠を確保して
+AZ の順に割り当てる (例: 10.0.0.0/16 の場合、public は 10.0.0.0/24〜, protected は 10.0.10.0/24〜, private は 10.0.20.0/24〜)。
+基盤・フェーズの番号は固定のため、基盤を追加しても既存の VPC の CIDR は変わらない。
+
+割り当て前から存在する VPC は、移行 (README「VPC の CIDR」) が完了するまで NetworkParameter.legacy_vpc_cidr で
+既存の CIDR を維持できる。この場合も同じサブネットの配置で割り当て、移行先の CIDR の重複は常に検証する。
+"""
+
+import ipaddress
+from dataclasses import dataclass
+from itertools import combinations
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+
+# フェーズごとの第2オクテットのオフセット (フェーズあたり16基盤まで)
+PHASE_OFFSETS = {"dev": 0, "stg": 16, "prod": 32}
+# 基盤ごとの番号 (既存の VPC の CIDR が変わらないよう、追加時は末尾に追加する)
+DOMAIN_INDEXES = {"parkings": 0, "members": 1, "payments": 2, "auth": 3, "integration": 4}
+MAX_DOMAINS_PER_PHASE = 16
+
+# サブネット種別ごとの、VPC 内の /24 の枠の開始位置
+SUBNET_TIER_OFFSETS = {"public": 0, "protected": 10, "private": 20}
+# 種別ごとの枠の大きさ (= 最大 AZ 数)
+MAX_AZS = 10
+SUBNET_PREFIX_LENGTH = 24
+
+
+@dataclass(frozen=True)
+class NetworkAllocation:
+    """1つの VPC に割り当てた CIDR."""
+
+    env_name: str
+    phase: str
+    vpc_cidr: str
+    # サブネット種別 (SUBNET_TIER_OFFSETS のキー) ごとの、AZ 順の CIDR
+    subnet_cidrs: Dict[str, Tuple[str, ...]]
+
+    def all_subnet_cidrs(self) -> List[str]:
+        return [cidr for cidrs in self.subnet_cidrs.values() for cidr in cidrs]
+
+
+#########################
+#      ヘルパー関数       #
+#########################
+def allocate_network(env_name: str, phase: str, az_count: int, vpc_cidr: Optional[str] = None) -> NetworkAllocation:
+    """基盤・フェーズ・AZ 数から、VPC とサブネットの CIDR を割り当てる.
+
+    Args:
+        vpc_cidr: 移行前の VPC の CIDR (/16)。指定した場合は、基盤・フェーズの CIDR の代わりに使用する
+
+    Raises:
+        ValueError: 未定義の基盤・フェーズの場合や、AZ 数・vpc_cidr が不正な場合
+
+    """
+    if env_name not in DOMAIN_INDEXES:
+        raise ValueError(f"No CIDR index for env_name: {env_name} (add it to DOMAIN_INDEXES)")
+    if phase not in PHASE_OFFSETS:
+        raise ValueError(f"No CIDR offset for phase: {phase} (add it to PHASE_OFFSETS)")
+    if not 1 <= az_count <= MAX_AZS:
+        raise ValueError(f"az_count must be between 1 and {MAX_AZS}: {az_count}")
+
+    if vpc_cidr is None:
+        vpc = ipaddress.ip_network(f"10.{PHASE_OFFSETS[phase] + DOMAIN_INDEXES[env_name]}.0.0/16")
+    else:
+        vpc = ipaddress.ip_network(vpc_cidr)
+        if vpc.prefixlen != 16:
+            raise ValueError(f"vpc_cidr must be a /16 network: {vpc_cidr}")
+    subnet_size = 2 ** (32 - SUBNET_PREFIX_LENGTH)
+    subnet_cidrs = {
+        tier: tuple(
+            str(ipaddress.ip_network((int(vpc.network_address) + (offset + az_index) * subnet_size, SUBNET_PREFIX_LENGTH)))
+            for az_index in range(az_count)
+        )
+        for tier, offset in SUBNET_TIER_OFFSETS.items()
+    }
+    return NetworkAllocation(env_name=env_name, phase=phase, vpc_cidr=str(vpc), subnet_cidrs=subnet_cidrs)
+
+
+def find_conflicts(allocations: Iterable[NetworkAllocation]) -> List[Tuple[str, Tuple[NetworkAllocation, ...]]]:
+    """VPC 同士・VPC 内のサブネット同士の重複と、VPC の範囲外のサブネットを返す.
+
+    Returns:
+        (内容, 対象の割り当て) のリスト
+
+    """
+    allocations = list(allocations)
+    conflicts = []
+    for a, b in combinations(allocations, 2):
+        if ipaddress.ip_network(a.vpc_cidr).overlaps(ipaddress.ip_network(b.vpc_cidr)):
+            conflicts.append(
+                (f"VPC {a.env_name}/{a.phase} ({a.vpc_cidr}) overlaps {b.env_name}/{b.phase} ({b.vpc_cidr})", (a, b))
+            )
+    for allocation in allocations:
+        vpc = ipaddress.ip_network(allocation.vpc_cidr)
+        subnets = [ipaddress.ip_network(cidr) for cidr in allocation.all_subnet_cidrs()]
+        for subnet in subnets:
+            if not subnet.subnet_of(vpc):
+                conflicts.append(
+                    (f"Subnet {subnet} is outside VPC {allocation.env_name}/{allocation.phase} ({vpc})", (allocation,))
+                )
+        for a, b in combinations(subnets, 2):
+            if a.overlaps(b):
+                conflicts.append((f"Subnets {a} and {b} overlap in {allocation.env_name}/{allocation.phase}", (allocation,)))
+    return conflicts
+
+
+def validate_allocations(allocations: Iterable[NetworkAllocation]) -> None:
+    """VPC 同士・VPC 内のサブネット同士の CIDR が重複せず、サブネットが VPC の範囲内であることを検証する.
+
+    Raises:
+        ValueError: 重複・範囲外の CIDR がある場合 (全件をまとめて通知)
+
+    """
+    errors = [message for message, _ in find_conflicts(allocations)]
+    if errors:
+        raise ValueError("CIDR allocation conflicts:\n" + "\n".join(errors))
+
+
+def validate_cidr_plan(az_count: int, legacy_vpc_cidrs: Mapping[Tuple[str, str], str] = None) -> List[str]:
+    """全フェーズ・全基盤の CIDR を割り当て、重複がないことを検証する (app の synth 前に実行する).
+
+    移行先の割り当て (legacy_vpc_cidrs を使用しない場合) は、重複があればエラーとする。
+    legacy_vpc_cidrs で既存の CIDR を維持している VPC が関わる重複は、移行が完了するまで警告とする。
+
+    Args:
+        legacy_vpc_cidrs: (基盤名, フェーズ) ごとの移行前の VPC の CIDR
+
+    Returns:
+        警告 (移行前の VPC が関わる重複)
+
+    """
+    if max(DOMAIN_INDEXES.values()) >= MAX_DOMAINS_PER_PHASE:
+        raise ValueError(f"DOMAIN_INDEXES must be below {MAX_DOMAINS_PER_PHASE}")
+    legacy_vpc_cidrs = legacy_vpc_cidrs or {}
+    for env_name, phase in legacy_vpc_cidrs:
+        if env_name not in DOMAIN_INDEXES or phase not in PHASE_OFFSETS:
+            raise ValueError(f"Unknown env_name/phase in legacy_vpc_cidrs: {env_name}/{phase}")
+
+    # 移行先の割り当て
+    validate_allocations(
+        allocate_network(env_name, phase, az_count) for phase in PHASE_OFFSETS for env_name in DOMAIN_INDEXES
+    )
+
+    # 移行前の CIDR を含む、現在の割り当て
+    allocations = [
+        allocate_network(env_name, phase, az_count, vpc_cidr=legacy_vpc_cidrs.get((env_name, phase)))
+        for phase in PHASE_OFFSETS
+        for env_name in DOMAIN_INDEXES
+    ]
+    errors = []
+    warnings = []
+    for message, targets in find_conflicts(allocations):
+        if any((target.env_name, target.phase) in legacy_vpc_cidrs for target in targets):
+            warnings.append(f"{message} (legacy_vpc_cidr is set; migrate the VPC to its allocated CIDR)")
+        else:
+            errors.append(message)
+    if errors:
+        raise ValueError("CIDR allocation conflicts:\n" + "\n".join(errors))
+    return warnings
@@ -0,0 +1,57 @@
+from datetime import datetime
+
+from aws_cdk import Aspects, CfnOutput, Stack, Tags
+from constructs import Construct
+
+from src.common.aspects.physical_name_suffix_aspect import PhysicalNameSuffixAspect
+from src.common.constructs.aurora_clone_construct import (
+    CLONE_TAG_EXPIRES_AT,
+    CLONE_TAG_SOURCE,
+    AuroraCloneConstruct,
+)
+
+
+class AuroraCloneStack(Stack):
+    """試験用の Aurora クローンのスタック (有効期限を過ぎると AuroraCloneReaperConstruct が削除する)."""
+
+    def __init__(self, scope: Construct, id: str, props, clone_name: str, expires_at: datetime, **kwargs) -> None:
+        """
+        :param props: クローン元の基盤のパラメータ (props.database.clone が設定されていること)
+        :param clone_name: クローン名
+        :param expires_at: 有効期限 (タイムゾーン付き)
+        """
+        super().__init__(scope, id, **kwargs)
+
+        project = props.project
+        env_name = props.env_name
+        phase = props.phase
+
+        #########################
+        #     Aurora Clone      #
+        #########################
+        clone_construct = AuroraCloneConstruct(
+            scope=self,
+            id="AuroraCloneConstruct",
+            project=project,
+            env_name=env_name,
+            phase=phase,
+            clone_name=clone_name,
+            database_param=props.database,
+        )
+
+        # CIDR の移行後のクローン元 (物理名に接尾辞を付与したクラスター・DB サブネットグループ) を参照する
+        cidr_migration = props.network.cidr_migration
+        if cidr_migration:
+            Aspects.of(self).add(PhysicalNameSuffixAspect(cidr_migration.name_suffix))
+
+        # スタックとリソースに有効期限のタグを付与する
+        Tags.of(self).add(CLONE_TAG_EXPIRES_AT, expires_at.isoformat(timespec="seconds"))
+        Tags.of(self).add(
+            CLONE_TAG_SOURCE,
+            f"{env_name}-{phase}-rds-cluster{cidr_migration.name_suffix if cidr_migration else ''}",
+        )
+
+        CfnOutput(self, "ClusterIdentifier", value=clone_construct.cluster_identifier)
+        CfnOutput(self, "ClusterEndpoint", value=clone_construct.cluster_endpoint)
+        CfnOutput(self, "ProxyEndpoint", value=clone_construct.proxy_endpoint)
+        CfnOutput(self, "ExpiresAt", value=expires_at.isoformat(timespec="seconds"))
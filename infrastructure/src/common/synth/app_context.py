@@ -0,0 +1,72 @@
+import json
+import os
+from typing import Any, Dict
+
+from constructs import Construct
+
+
+def get_bool_context(scope: Construct, key: str, default: bool = False) -> bool:
+    """コンテキスト値を真偽値として取得する.
+
+    `-c key=true` のように CLI から渡された値は文字列となるため、文字列・真偽値の両方を受け付ける。
+
+    Args:
+        scope: コンテキストを参照する Construct (通常は App)
+        key: コンテキストのキー
+        default: 未指定の場合の値
+
+    Returns:
+        コンテキスト値の真偽値
+
+    """
+    value: Any = scope.node.try_get_context(key)
+    if value is None:
+        return default
+    if isinstance(value, bool):
+        return value
+    return str(value).strip().lower() in ("true", "1", "yes", "on")
+
+
+def load_cdk_json_context(path: str = "cdk.json") -> Dict[str, Any]:
+    """cdk.json の context (フィーチャーフラグ等) を読み込む.
+
+    CDK CLI を経由せずに App を生成する場合 (ベンチマーク等) に、CLI 実行時と同じコンテキストを再現するために使用する。
+
+    Args:
+        path: cdk.json のパス
+
+    Returns:
+        cdk.json の context の辞書
+
+    """
+    with open(path, encoding="utf-8") as f:
+        return json.load(f).get("context", {})
+
+
+def get_worker_count_context(scope: Construct, key: str, default: int = 1) -> int:
+    """コンテキスト値を並列数として取得する.
+
+    Args:
+        scope: コンテキストを参照する Construct (通常は App)
+        key: コンテキストのキー
+        default: 未指定の場合の値
+
+    Returns:
+        並列数 ("auto" の場合は CPU コア数)
+
+    Raises:
+        ValueError: 1以上の整数または "auto" でない場合
+
+    """
+    value: Any = scope.node.try_get_context(key)
+    if value is None:
+        return default
+    if str(value).strip().lower() == "auto":
+        return os.cpu_count() or 1
+    try:
+        count = int(value)
+    except (TypeError, ValueError):
+        count = 0
+    if count < 1:
+        raise ValueError(f"Invalid {key}: {value} (positive integer or auto)")
+    return count
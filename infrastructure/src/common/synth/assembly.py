@@ -0,0 +1,83 @@
+"""スタックごとに synth したクラウドアセンブリを、1つのクラウドアセンブリにまとめるモジュール."""
+
+import json
+import os
+import shutil
+from typing import Dict, Iterable
+
+from src.common.aspects.template_budget_aspect import REPORT_FILE_NAME
+
+MANIFEST_FILE_NAME = "manifest.json"
+TREE_FILE_NAME = "tree.json"
+
+
+#########################
+#      ヘルパー関数       #
+#########################
+def _load_json(path: str) -> Dict:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _dump_json(data: Dict, path: str) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+
+
+def merge_assemblies(source_dirs: Iterable[str], outdir: str) -> None:
+    """スタックごとのクラウドアセンブリを outdir にマージする.
+
+    manifest.json の artifacts/missing、tree.json の children、テンプレート予算レポートを結合し、
+    テンプレート・アセット等のその他のファイルはそのままコピーする。
+
+    Args:
+        source_dirs: スタックごとのクラウドアセンブリのディレクトリ
+        outdir: マージ先のディレクトリ (cdk.out)
+
+    """
+    os.makedirs(outdir, exist_ok=True)
+    manifest: Dict = {}
+    tree: Dict = {}
+    budget_report: Dict = {}
+    missing_keys = set()
+
+    for source_dir in source_dirs:
+        source_manifest = _load_json(os.path.join(source_dir, MANIFEST_FILE_NAME))
+        if not manifest:
+            manifest = {**source_manifest, "artifacts": {}, "missing": []}
+        manifest["artifacts"].update(source_manifest.get("artifacts", {}))
+        for missing in source_manifest.get("missing", []):
+            if missing["key"] not in missing_keys:
+                missing_keys.add(missing["key"])
+                manifest["missing"].append(missing)
+
+        tree_path = os.path.join(source_dir, TREE_FILE_NAME)
+        if os.path.exists(tree_path):
+            source_tree = _load_json(tree_path)
+            if not tree:
+                tree = {**source_tree, "tree": {**source_tree["tree"], "children": {}}}
+            tree["tree"]["children"].update(source_tree["tree"].get("children", {}))
+
+        report_path = os.path.join(source_dir, REPORT_FILE_NAME)
+        if os.path.exists(report_path):
+            budget_report.update(_load_json(report_path))
+
+        for name in os.listdir(source_dir):
+            if name in (MANIFEST_FILE_NAME, TREE_FILE_NAME, REPORT_FILE_NAME):
+                continue
+            source_path = os.path.join(source_dir, name)
+            target_path = os.path.join(outdir, name)
+            if os.path.isdir(source_path):
+                # アセットのディレクトリ名はハッシュ値のため、同名であれば内容も同一
+                if not os.path.exists(target_path):
+                    shutil.copytree(source_path, target_path)
+            else:
+                shutil.copy2(source_path, target_path)
+
+    if not manifest.get("missing"):
+        manifest.pop("missing", None)
+    _dump_json(manifest, os.path.join(outdir, MANIFEST_FILE_NAME))
+    if tree:
+        _dump_json(tree, os.path.join(outdir, TREE_FILE_NAME))
+    if budget_report:
+        _dump_json(budget_report, os.path.join(outdir, REPORT_FILE_NAME))
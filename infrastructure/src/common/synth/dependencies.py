@@ -0,0 +1,81 @@
+import ast
+import os
+from typing import Iterable, List, Set
+
+from src.common.synth.stack_registry import StackDefinition
+
+# スタックの入力とみなすローカルパッケージ
+LOCAL_PACKAGES = ("src", "config")
+
+
+#########################
+#      ヘルパー関数       #
+#########################
+def module_file(module_path: str, root: str = ".") -> str:
+    """モジュール名 (src.auth.stacks.auth_stack) をファイルパスに変換する. 存在しない場合は空文字."""
+    path = os.path.join(root, *module_path.split(".")) + ".py"
+    return path if os.path.exists(path) else ""
+
+
+def imported_modules(path: str) -> Set[str]:
+    """ファイル内の import 文から、ローカルパッケージのモジュール名を取得する."""
+    with open(path, encoding="utf-8") as f:
+        tree = ast.parse(f.read(), filename=path)
+
+    modules = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names = [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom) and node.module and node.level == 0:
+            # "from config import config" のようにモジュールを import する場合にも対応する
+            names = [node.module] + [f"{node.module}.{alias.name}" for alias in node.names]
+        else:
+            continue
+        modules.update(name for name in names if name.split(".")[0] in LOCAL_PACKAGES)
+    return modules
+
+
+def module_dependencies(module_path: str, root: str = ".") -> Set[str]:
+    """モジュールが直接・間接的に import しているローカルモジュールのファイルパスを返す（自身を含む）."""
+    files: Set[str] = set()
+    pending = [module_path]
+    while pending:
+        path = module_file(pending.pop(), root)
+        if not path or path in files:
+            continue
+        files.add(path)
+        pending.extend(imported_modules(path))
+    return files
+
+
+def asset_files(asset_dirs: Iterable[str], root: str = ".") -> Set[str]:
+    """アセット (ディレクトリまたはファイル) 配下のファイルパスを返す.
+
+    アセットのハッシュ値は __pycache__ 等を含むディレクトリ全体から計算されるため、除外せずに全ファイルを返す。
+    """
+    files = set()
+    for asset_dir in asset_dirs:
+        path = os.path.join(root, asset_dir)
+        if os.path.isfile(path):
+            files.add(path)
+        for dirpath, _, filenames in os.walk(path):
+            files.update(os.path.join(dirpath, name) for name in filenames)
+    return files
+
+
+def stack_source_files(definition: StackDefinition, asset_dirs: Iterable[str] = (), root: str = ".") -> List[str]:
+    """スタックの synth 結果に影響するソースファイル (Python モジュール・config・アセット) を返す.
+
+    Args:
+        definition: スタック定義
+        asset_dirs: 前回の synth で記録したスタックのアセットのパス (StackSynthResult.asset_dirs)
+        root: infrastructure ディレクトリのパス
+
+    Returns:
+        ソート済みのファイルパスのリスト
+
+    """
+    files = module_dependencies(definition.module_path, root)
+    files.update(module_dependencies("config.config", root))
+    files.update(asset_files(asset_dirs, root))
+    return sorted(os.path.normpath(path) for path in files)
@@ -0,0 +1,298 @@
+"""入力のハッシュ値 (フィンガープリント) が前回と一致するスタックの synth を省略するモジュール.
+
+スタックごとに以下の入力からフィンガープリントを計算し、前回の synth 時と一致する場合は
+`.cdk.local/synth-cache/<phase>/<基盤名>/` に保存済みのクラウドアセンブリを再利用する。
+
+- 基盤固有のパラメータ (config の dataclass)
+- スタックが import するソースファイル・config・前回の synth で記録したアセット (Lambda のソース等) の内容
+- App のコンテキスト (cdk.json の feature flag、ルックアップキャッシュ等)
+- aws-cdk-lib のバージョン
+
+フィンガープリントと入力ごとのハッシュ値は `.cdk.local/synth-cache/<phase>/manifest.json` に保存され、
+以下のコマンドで前回からの変更内容を確認できる。
+
+    python3 -m src.common.synth.incremental_synth show --phase DEV
+"""
+
+import argparse
+import hashlib
+import importlib
+import json
+import multiprocessing
+import os
+import shutil
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from importlib import metadata
+from typing import Any, Dict, List, Optional, Set
+
+from src.common.synth.assembly import MANIFEST_FILE_NAME, merge_assemblies
+from src.common.synth.dependencies import module_dependencies, stack_source_files
+from src.common.synth.stack_registry import STACK_DEFINITIONS, parse_stack_selection
+from src.common.synth.stack_synth import StackSynthResult, synth_stack
+from src.common.synth.synth_server import load_server_context
+
+# スタックごとのクラウドアセンブリとフィンガープリントの保存先
+CACHE_DIR = os.path.join(".cdk.local", "synth-cache")
+# フィンガープリントのマニフェストのフォーマットバージョン
+FINGERPRINT_MANIFEST_VERSION = 2
+# synth の制御のみに使用し、synth 結果に影響しないコンテキスト
+SYNTH_CONTROL_CONTEXT_KEYS = ("stacks", "full_synth", "profile", "lookup_offline", "synth_workers")
+# 全スタック共通で synth 結果に影響するモジュール (スタックの生成処理・Aspect)
+FRAMEWORK_MODULES = ("src.common.synth.stack_synth",)
+
+
+#########################
+#      ヘルパー関数       #
+#########################
+def _sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _json_digest(value: Any) -> str:
+    return _sha256(json.dumps(value, sort_keys=True, default=str).encode("utf-8"))
+
+
+def file_digest(path: str) -> str:
+    """ファイル内容のハッシュ値を返す."""
+    with open(path, "rb") as f:
+        return _sha256(f.read())
+
+
+def framework_files(root: str = ".") -> Set[str]:
+    """全スタック共通の synth 処理のソースファイルを返す."""
+    files: Set[str] = set()
+    for module_path in FRAMEWORK_MODULES:
+        files.update(os.path.normpath(path) for path in module_dependencies(module_path, root))
+    return files
+
+
+def fingerprint_inputs(
+    env_name: str, props: Any, context: Dict[str, Any], asset_dirs: Optional[List[str]] = None, root: str = "."
+) -> Dict[str, Any]:
+    """スタックの synth 結果に影響する入力ごとのハッシュ値を返す.
+
+    アセットの追加・パスの変更は、アセットを参照する Construct のソースファイルの変更として検知される。
+
+    Args:
+        env_name: 基盤名 (例: "parkings")
+        props: 基盤固有のパラメータ (dataclass)
+        context: App のコンテキスト
+        asset_dirs: 前回の synth で記録したスタックのアセットのパス
+        root: infrastructure ディレクトリのパス
+
+    Returns:
+        入力の種類ごとのハッシュ値 (files はファイルパスごと)
+
+    """
+    files = set(stack_source_files(STACK_DEFINITIONS[env_name], asset_dirs=asset_dirs or (), root=root)) | framework_files(root)
+    synth_context = {key: value for key, value in context.items() if key not in SYNTH_CONTROL_CONTEXT_KEYS}
+    return {
+        "cdk_version": metadata.version("aws-cdk-lib"),
+        "props": _json_digest(asdict(props)),
+        "context": _json_digest(synth_context),
+        "files": {path: file_digest(os.path.join(root, path)) for path in sorted(files)},
+    }
+
+
+def fingerprint(inputs: Dict[str, Any]) -> str:
+    """入力ごとのハッシュ値から、スタックのフィンガープリントを返す."""
+    return _json_digest(inputs)
+
+
+def changed_inputs(previous: Dict[str, Any], current: Dict[str, Any]) -> List[str]:
+    """前回と今回で異なる入力 (ファイルの場合はパス) を返す."""
+    changes = [key for key in ("cdk_version", "props", "context") if previous.get(key) != current.get(key)]
+    previous_files = previous.get("files", {})
+    current_files = current.get("files", {})
+    changes.extend(
+        path
+        for path in sorted(previous_files.keys() | current_files.keys())
+        if previous_files.get(path) != current_files.get(path)
+    )
+    return changes
+
+
+def load_fingerprint_manifest(path: str) -> Dict[str, Any]:
+    """フィンガープリントのマニフェストを読み込む. 存在しない・バージョンが異なる場合は空のマニフェストを返す."""
+    if os.path.exists(path):
+        with open(path, encoding="utf-8") as f:
+            manifest = json.load(f)
+        if manifest.get("version") == FINGERPRINT_MANIFEST_VERSION:
+            return manifest
+    return {"version": FINGERPRINT_MANIFEST_VERSION, "stacks": {}}
+
+
+def save_fingerprint_manifest(manifest: Dict[str, Any], path: str) -> None:
+    """フィンガープリントのマニフェストを差分が見やすいようキー順で保存する."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+@dataclass
+class IncrementalSynthResult:
+    """増分 synth の結果."""
+
+    # 再 synth したスタックの結果
+    synthesized: List[StackSynthResult] = field(default_factory=list)
+    # 保存済みのクラウドアセンブリを再利用したスタックの基盤名
+    reused: List[str] = field(default_factory=list)
+    # 再利用分を含む、対象スタック全体のテンプレート予算の超過内容
+    budget_violations: List[str] = field(default_factory=list)
+
+
+def incremental_synth(
+    phase: str,
+    env_names: List[str],
+    props: Dict[str, Any],
+    outdir: str,
+    context: Dict[str, Any],
+    template_budget: Any = None,
+    force: bool = False,
+    workers: int = 1,
+    cache_dir: str = CACHE_DIR,
+) -> IncrementalSynthResult:
+    """フィンガープリントが変わったスタックのみを synth し、対象スタック全体を outdir にマージする.
+
+    Args:
+        phase: フェーズ (DEV, STG, PROD)
+        env_names: 対象の基盤名
+        props: 基盤名ごとのパラメータ
+        outdir: マージ先のディレクトリ (cdk.out)
+        context: App のコンテキスト
+        template_budget: テンプレート予算 (config.TemplateBudgetParameter)。None の場合は判定しない
+        force: True の場合はフィンガープリントに関わらず全スタックを synth する
+        workers: 並列に synth するワーカープロセス数 (1 の場合は現在のプロセスで順に synth する)
+        cache_dir: スタックごとのクラウドアセンブリとマニフェストの保存先
+
+    Returns:
+        IncrementalSynthResult
+
+    """
+    phase_dir = os.path.join(cache_dir, phase.lower())
+    manifest_path = os.path.join(phase_dir, MANIFEST_FILE_NAME)
+    manifest = load_fingerprint_manifest(manifest_path)
+    result = IncrementalSynthResult()
+
+    # synth が必要なスタックを判定する
+    pending: Dict[str, Dict[str, Any]] = {}
+    for env_name in env_names:
+        entry = manifest["stacks"].get(env_name)
+        inputs = fingerprint_inputs(env_name, props[env_name], context, asset_dirs=(entry or {}).get("asset_dirs", []))
+        digest = fingerprint(inputs)
+
+        cached = entry is not None and os.path.exists(os.path.join(phase_dir, env_name, MANIFEST_FILE_NAME))
+        if cached and not force and entry["fingerprint"] == digest:
+            result.reused.append(env_name)
+            result.budget_violations.extend(entry.get("budget_violations", []))
+            print(f"  {STACK_DEFINITIONS[env_name].stack_id}: unchanged, reusing cached assembly", file=sys.stderr)
+            continue
+
+        if force:
+            reason = "full synth"
+        elif not cached:
+            reason = "no cache"
+        else:
+            reason = "changed: " + ", ".join(changed_inputs(entry["inputs"], inputs))
+        pending[env_name] = {"reason": reason}
+
+    def record(stack_result: StackSynthResult) -> None:
+        target = pending[stack_result.env_name]
+        # 今回の synth で参照したアセットを含めて、フィンガープリントを計算し直す
+        inputs = fingerprint_inputs(stack_result.env_name, props[stack_result.env_name], context, asset_dirs=stack_result.asset_dirs)
+        result.synthesized.append(stack_result)
+        result.budget_violations.extend(stack_result.budget_violations)
+        print(f"  {STACK_DEFINITIONS[stack_result.env_name].stack_id}: {stack_result.elapsed_ms:.0f} ms ({target['reason']})", file=sys.stderr)
+
+        manifest["stacks"][stack_result.env_name] = {
+            "fingerprint": fingerprint(inputs),
+            "synthesized_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "elapsed_ms": round(stack_result.elapsed_ms),
+            "budget_violations": stack_result.budget_violations,
+            "asset_dirs": stack_result.asset_dirs,
+            "inputs": inputs,
+        }
+        # 途中のスタックで失敗しても、synth 済みのスタックは次回再利用できるようスタックごとに保存する
+        save_fingerprint_manifest(manifest, manifest_path)
+
+    synth_args = {
+        env_name: (env_name, props[env_name], os.path.join(phase_dir, env_name), context, template_budget)
+        for env_name in pending
+    }
+    if workers > 1 and len(pending) > 1:
+        # 各スタックは別アカウントでスタック間の参照が無いため、ワーカープロセスごとに独立した App で synth する。
+        # jsii カーネル (node プロセス) をワーカーと共有しないよう、fork ではなく spawn で起動する
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(pending)), mp_context=multiprocessing.get_context("spawn")
+        ) as executor:
+            futures = [executor.submit(synth_stack, *args) for args in synth_args.values()]
+            for future in as_completed(futures):
+                record(future.result())
+        # 完了順ではなく定義順に並べる
+        result.synthesized.sort(key=lambda stack_result: env_names.index(stack_result.env_name))
+    else:
+        for args in synth_args.values():
+            record(synth_stack(*args))
+
+    # 前回の synth 結果 (対象外のスタック等) が残らないよう、出力先を空にしてからマージする
+    shutil.rmtree(outdir, ignore_errors=True)
+    merge_assemblies([os.path.join(phase_dir, env_name) for env_name in env_names], outdir)
+    return result
+
+
+#########################
+#        CLI            #
+#########################
+def show(phase: str, env_names: List[str], context: Optional[Dict[str, Any]], cache_dir: str = CACHE_DIR) -> None:
+    """保存済みのフィンガープリントと、現在の入力からの変更内容を表示する."""
+    config = importlib.import_module("config.config")
+    manifest = load_fingerprint_manifest(os.path.join(cache_dir, phase.lower(), MANIFEST_FILE_NAME))
+    for env_name in env_names:
+        entry = manifest["stacks"].get(env_name)
+        if entry is None:
+            print(f"{env_name}: no cache")
+            continue
+        print(f"{env_name}: {entry['fingerprint'][:12]} (synthesized at {entry['synthesized_at']}, {entry['elapsed_ms']} ms)")
+        if context is None:
+            continue
+        try:
+            props = getattr(config, f"{phase}_ACCOUNTS_PARAMS").resolve([env_name])[env_name]
+        except ValueError as e:
+            print(f"  cannot resolve parameters: {e}")
+            continue
+        current = fingerprint_inputs(env_name, props, context, asset_dirs=entry.get("asset_dirs", []))
+        # CDK CLI が付与するコンテキスト (aws:cdk:*) はここでは再現できないため、コンテキストは比較しない
+        current["context"] = entry["inputs"]["context"]
+        changes = changed_inputs(entry["inputs"], current)
+        print("  changed: " + ", ".join(changes) if changes else "  up to date")
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="増分 synth のフィンガープリントの確認")
+    parser.add_argument("--cache-dir", default=CACHE_DIR, help="フィンガープリントとクラウドアセンブリの保存先")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    show_parser = subparsers.add_parser("show", help="保存済みのフィンガープリントと変更内容を表示する")
+    show_parser.add_argument("--phase", default="DEV", help="フェーズ (DEV, STG, PROD)")
+    show_parser.add_argument("--stacks", default=None, help="対象の基盤名 (カンマ区切り、未指定の場合は全スタック)")
+    show_parser.add_argument("--no-diff", action="store_true", help="現在の入力との比較を行わない")
+
+    subparsers.add_parser("clean", help="保存済みのクラウドアセンブリとフィンガープリントを削除する")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "show":
+        context = None if args.no_diff else load_server_context(args.phase)
+        show(args.phase, parse_stack_selection(args.stacks), context, cache_dir=args.cache_dir)
+    elif args.command == "clean":
+        shutil.rmtree(args.cache_dir, ignore_errors=True)
+        print(f"Removed {args.cache_dir}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
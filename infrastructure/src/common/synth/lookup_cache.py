@@ -0,0 +1,162 @@
+"""from_lookup 等のコンテキストルックアップ結果を、リポジトリにコミットするキャッシュとして扱うモジュール.
+
+キャッシュは `config/lookup_cache.json` に保存し、App 生成時のコンテキストとして読み込む。
+キャッシュの更新は、ネットワーク接続のある環境で `cdk synth` を実行して `cdk.context.json` に
+ルックアップ結果を書き込ませた後、以下のコマンドで取り込む。
+
+    python3 -m src.common.synth.lookup_cache refresh
+"""
+
+import argparse
+import json
+import os
+import sys
+from typing import Dict, List
+
+# キャッシュファイルのフォーマットバージョン
+LOOKUP_CACHE_VERSION = 1
+
+DEFAULT_LOOKUP_CACHE_PATH = os.path.join("config", "lookup_cache.json")
+DEFAULT_CDK_CONTEXT_PATH = "cdk.context.json"
+
+# キャッシュ対象とする CDK コンテキストプロバイダのキーのプレフィックス
+LOOKUP_PROVIDER_PREFIXES = (
+    "availability-zones:",
+    "hosted-zone:",
+    "vpc-provider:",
+    "ami:",
+    "ssm:",
+    "security-group:",
+    "load-balancer:",
+    "load-balancer-listener:",
+    "endpoint-service-availability-zones:",
+    "key-provider:",
+)
+
+
+#########################
+#      ヘルパー関数       #
+#########################
+def is_lookup_key(key: str) -> bool:
+    """コンテキストのキーがルックアップ結果かどうかを判定する."""
+    return key.startswith(LOOKUP_PROVIDER_PREFIXES)
+
+
+def load_lookup_cache(path: str = DEFAULT_LOOKUP_CACHE_PATH) -> Dict[str, object]:
+    """ルックアップキャッシュを読み込み、コンテキストとして渡せる辞書を返す.
+
+    Args:
+        path: キャッシュファイルのパス
+
+    Returns:
+        コンテキストキーとルックアップ結果の辞書（ファイルが無い場合は空）
+
+    Raises:
+        ValueError: キャッシュのバージョンが一致しない場合
+
+    """
+    if not os.path.exists(path):
+        return {}
+
+    with open(path, encoding="utf-8") as f:
+        cache = json.load(f)
+
+    if cache.get("version") != LOOKUP_CACHE_VERSION:
+        raise ValueError(f"ルックアップキャッシュのバージョンが一致しません: {path} (expected {LOOKUP_CACHE_VERSION}, got {cache.get('version')})")
+    return cache.get("entries", {})
+
+
+def save_lookup_cache(entries: Dict[str, object], path: str = DEFAULT_LOOKUP_CACHE_PATH) -> None:
+    """ルックアップキャッシュを差分が見やすいようキー順で保存する."""
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"version": LOOKUP_CACHE_VERSION, "entries": entries}, f, indent=2, sort_keys=True, ensure_ascii=False)
+        f.write("\n")
+
+
+def refresh_lookup_cache(context_path: str = DEFAULT_CDK_CONTEXT_PATH, path: str = DEFAULT_LOOKUP_CACHE_PATH) -> List[str]:
+    """cdk.context.json のルックアップ結果をキャッシュに取り込む.
+
+    Args:
+        context_path: CDK CLI が書き込んだ cdk.context.json のパス
+        path: キャッシュファイルのパス
+
+    Returns:
+        追加・更新されたキーのリスト
+
+    """
+    with open(context_path, encoding="utf-8") as f:
+        context = json.load(f)
+
+    entries = load_lookup_cache(path)
+    updated = []
+    for key, value in context.items():
+        if not is_lookup_key(key) or entries.get(key) == value:
+            continue
+        entries[key] = value
+        updated.append(key)
+
+    save_lookup_cache(entries, path)
+    return updated
+
+
+def find_missing_lookups(assembly_dir: str) -> List[str]:
+    """synth 結果のうち、キャッシュに無くダミー値で作成されたルックアップのキーを返す.
+
+    Args:
+        assembly_dir: クラウドアセンブリのディレクトリ (cdk.out)
+
+    """
+    # assembly.manifest は jsii 経由だと一部のアーティファクトを復元できないため、manifest.json を直接読む
+    # (スタックごとの synth 結果をマージした cdk.out にも対応するため、ディレクトリで受け取る)
+    with open(os.path.join(assembly_dir, "manifest.json"), encoding="utf-8") as f:
+        manifest = json.load(f)
+    return [missing["key"] for missing in manifest.get("missing", [])]
+
+
+def verify_offline_lookups(assembly_dir: str) -> None:
+    """オフラインモードで、キャッシュミスしたルックアップがあればエラーとする.
+
+    Args:
+        assembly_dir: クラウドアセンブリのディレクトリ (cdk.out)
+
+    Raises:
+        ValueError: キャッシュに存在しないルックアップがある場合
+
+    """
+    missing_keys = find_missing_lookups(assembly_dir)
+    if missing_keys:
+        raise ValueError(
+            "Lookup cache miss in offline mode:\n"
+            + "\n".join(f"  - {key}" for key in missing_keys)
+            + "\nRun `cdk synth` with AWS credentials, then `python3 -m src.common.synth.lookup_cache refresh`."
+        )
+
+
+#########################
+#        CLI            #
+#########################
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="CDK ルックアップキャッシュの管理")
+    parser.add_argument("--cache", default=DEFAULT_LOOKUP_CACHE_PATH, help="キャッシュファイルのパス")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    refresh_parser = subparsers.add_parser("refresh", help="cdk.context.json のルックアップ結果をキャッシュに取り込む")
+    refresh_parser.add_argument("--context", default=DEFAULT_CDK_CONTEXT_PATH, help="cdk.context.json のパス")
+
+    subparsers.add_parser("list", help="キャッシュ済みのキーを表示する")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "refresh":
+        updated = refresh_lookup_cache(context_path=args.context, path=args.cache)
+        print(f"{len(updated)} lookup(s) updated in {args.cache}")
+        for key in updated:
+            print(f"  - {key}")
+    elif args.command == "list":
+        for key in sorted(load_lookup_cache(args.cache)):
+            print(key)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
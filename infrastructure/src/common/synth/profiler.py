@@ -0,0 +1,180 @@
+"""synth 時の Construct ごとの所要時間を計測するプロファイラ.
+
+`-c profile=true` を指定した場合に有効化され、src 配下で定義した Construct / Stack の生成を計測する。
+結果はツリー形式で標準エラーに出力し、flamegraph.pl や speedscope で読み込める folded 形式のファイルにも書き出す。
+"""
+
+import functools
+import os
+import sys
+import time
+from contextlib import contextmanager
+from typing import Iterator, List, Optional
+
+from constructs import Construct
+from jsii import kernel as jsii_kernel
+
+# jsii カーネル (Node.js プロセス) への呼び出しとして数えるリクエスト
+JSII_PROVIDER_METHODS = ("create", "get", "set", "sget", "sset", "invoke", "sinvoke", "begin", "complete")
+
+PROFILE_FILE_NAME = "synth-profile.folded"
+
+
+class ProfileNode:
+    """プロファイル結果のツリーの1ノード."""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.wall_ms = 0.0
+        self.jsii_calls = 0
+        self.child_nodes = 0
+        self.children: List["ProfileNode"] = []
+
+    @property
+    def self_ms(self) -> float:
+        """子ノードを除いた自身の所要時間."""
+        return max(self.wall_ms - sum(child.wall_ms for child in self.children), 0.0)
+
+
+class SynthProfiler:
+    """src 配下の Construct の __init__ をラップし、所要時間・jsii 呼び出し数・子ノード数を計測する."""
+
+    def __init__(self) -> None:
+        self.root = ProfileNode("App")
+        self._current: List[ProfileNode] = [self.root]
+        self._jsii_calls = 0
+        self._started_at: Optional[float] = None
+
+    #########################
+    #      計測の開始        #
+    #########################
+    def install(self, module_prefix: str = "src.") -> None:
+        """jsii 呼び出しのカウンタと、インポート済みの Construct クラスのラップを設定する.
+
+        Args:
+            module_prefix: ラップ対象とする Construct クラスのモジュール名のプレフィックス
+
+        """
+        # jsii.create 等はカーネルのメソッドを束縛済みのため、カーネルが保持するプロバイダ側をラップする
+        provider = jsii_kernel.provider
+        for method_name in JSII_PROVIDER_METHODS:
+            setattr(provider, method_name, self._count_jsii_call(getattr(provider, method_name)))
+
+        for construct_class in self._find_construct_classes(module_prefix):
+            construct_class.__init__ = self._profile_init(construct_class, construct_class.__init__)
+
+        self._started_at = time.perf_counter()
+
+    @staticmethod
+    def _find_construct_classes(module_prefix: str) -> List[type]:
+        """Construct のサブクラスのうち、指定モジュール配下で定義されたクラスを返す."""
+        found, pending, seen = [], [Construct], set()
+        while pending:
+            klass = pending.pop()
+            for subclass in klass.__subclasses__():
+                if subclass in seen:
+                    continue
+                seen.add(subclass)
+                pending.append(subclass)
+                if subclass.__module__.startswith(module_prefix):
+                    found.append(subclass)
+        return found
+
+    def _count_jsii_call(self, method):
+        @functools.wraps(method)
+        def wrapped(*args, **kwargs):
+            self._jsii_calls += 1
+            return method(*args, **kwargs)
+
+        return wrapped
+
+    def _profile_init(self, construct_class: type, init):
+        profiler = self
+
+        @functools.wraps(init)
+        def wrapped(construct, scope, id, *args, **kwargs):
+            # サブクラスから super().__init__ で呼ばれた場合は、サブクラス側のノードで計測済み
+            if type(construct) is not construct_class:
+                return init(construct, scope, id, *args, **kwargs)
+
+            name = id if id == construct_class.__name__ else f"{id}[{construct_class.__name__}]"
+            with profiler.measure(name) as node:
+                init(construct, scope, id, *args, **kwargs)
+            # 子ノード数の取得自体の jsii 呼び出しは計測対象外とする
+            jsii_calls = profiler._jsii_calls
+            node.child_nodes = len(construct.node.find_all()) - 1
+            profiler._jsii_calls = jsii_calls
+            return None
+
+        return wrapped
+
+    @contextmanager
+    def measure(self, name: str) -> Iterator[ProfileNode]:
+        """任意の処理 (synth 等) を1ノードとして計測する."""
+        node = ProfileNode(name)
+        self._current[-1].children.append(node)
+        self._current.append(node)
+        jsii_calls_before = self._jsii_calls
+        start = time.perf_counter()
+        try:
+            yield node
+        finally:
+            node.wall_ms = (time.perf_counter() - start) * 1000
+            node.jsii_calls = self._jsii_calls - jsii_calls_before
+            self._current.pop()
+
+    #########################
+    #      結果の出力        #
+    #########################
+    def finish(self) -> None:
+        """計測を終了し、ルートノードの集計値を確定する."""
+        if self._started_at is not None:
+            self.root.wall_ms = (time.perf_counter() - self._started_at) * 1000
+        self.root.jsii_calls = self._jsii_calls
+
+    def format_tree(self) -> str:
+        """計測結果をインデント付きのツリー文字列にする."""
+        lines = [f"{'construct':<60} {'wall_ms':>10} {'self_ms':>10} {'jsii':>8} {'nodes':>7}"]
+
+        def walk(node: ProfileNode, depth: int) -> None:
+            label = f"{'  ' * depth}{node.name}"
+            lines.append(f"{label:<60} {node.wall_ms:>10.1f} {node.self_ms:>10.1f} {node.jsii_calls:>8} {node.child_nodes:>7}")
+            for child in sorted(node.children, key=lambda c: c.wall_ms, reverse=True):
+                walk(child, depth + 1)
+
+        walk(self.root, 0)
+        return "\n".join(lines)
+
+    def write_folded(self, path: str) -> None:
+        """flamegraph 用の folded 形式 (`App;Stack;Construct <自身の所要時間(μs)>`) で書き出す."""
+        lines = []
+
+        def walk(node: ProfileNode, frames: List[str]) -> None:
+            frames = frames + [node.name.replace(";", "_").replace(" ", "_")]
+            self_us = int(node.self_ms * 1000)
+            if self_us > 0:
+                lines.append(f"{';'.join(frames)} {self_us}")
+            for child in node.children:
+                walk(child, frames)
+
+        walk(self.root, [])
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+
+    def report(self, outdir: str) -> str:
+        """計測を終了し、ツリーを標準エラーに出力して folded ファイルを書き出す.
+
+        Args:
+            outdir: folded ファイルの出力先ディレクトリ (通常は cdk.out)
+
+        Returns:
+            folded ファイルのパス
+
+        """
+        self.finish()
+        path = os.path.join(outdir, PROFILE_FILE_NAME)
+        self.write_folded(path)
+        print(self.format_tree(), file=sys.stderr)
+        print(f"Synth profile written to {path}", file=sys.stderr)
+        return path
@@ -0,0 +1,117 @@
+import importlib
+from dataclasses import dataclass
+from typing import Any, List, Optional, Tuple, Union
+
+from aws_cdk import Stack
+from constructs import Construct
+
+
+@dataclass(frozen=True)
+class StackDefinition:
+    """基盤ごとのスタック定義."""
+
+    env_name: str
+    stack_id: str
+    module_path: str
+    class_name: str
+    # 先にデプロイが必要な基盤名 (アカウントを跨ぐため CDK の依存関係として表現できないもの)
+    depends_on: Tuple[str, ...] = ()
+
+    def load_class(self) -> type:
+        """スタックのモジュールを初めて必要になった時点でインポートし、クラスを返す."""
+        module = importlib.import_module(self.module_path)
+        return getattr(module, self.class_name)
+
+
+#############################
+# 　     スタック定義          #
+#############################
+STACK_DEFINITIONS = {
+    "members": StackDefinition(
+        env_name="members",
+        stack_id="MembersStack",
+        module_path="src.members.stacks.members_stack",
+        class_name="MembersStack",
+    ),
+    "parkings": StackDefinition(
+        env_name="parkings",
+        stack_id="ParkingsStack",
+        module_path="src.parkings.stacks.parkings_stack",
+        class_name="ParkingsStack",
+        # サブドメインのホストゾーンへの NS 委任を行うため、各基盤のホストゾーン作成後にデプロイする
+        depends_on=("members", "payments", "auth"),
+    ),
+    "payments": StackDefinition(
+        env_name="payments",
+        stack_id="PaymentsStack",
+        module_path="src.payments.stacks.payments_stack",
+        class_name="PaymentsStack",
+    ),
+    "auth": StackDefinition(
+        env_name="auth",
+        stack_id="AuthStack",
+        module_path="src.auth.stacks.auth_stack",
+        class_name="AuthStack",
+    ),
+    "integration": StackDefinition(
+        env_name="integration",
+        stack_id="IntegrationStack",
+        module_path="src.integration.stacks.integration_stack",
+        class_name="IntegrationStack",
+    ),
+}
+
+
+#########################
+#      ヘルパー関数       #
+#########################
+def parse_stack_selection(value: Optional[Union[str, List[str]]]) -> List[str]:
+    """コンテキスト `stacks` の値から、作成対象の基盤名を定義順で返す.
+
+    Args:
+        value: カンマ区切りの基盤名 (例: "parkings,auth")。未指定または "all" の場合は全基盤
+
+    Returns:
+        作成対象の基盤名のリスト
+
+    Raises:
+        ValueError: 未定義の基盤名が指定された場合
+
+    """
+    if not value:
+        return list(STACK_DEFINITIONS)
+
+    names = value if isinstance(value, list) else str(value).split(",")
+    selected = {name.strip().lower() for name in names if name.strip()}
+    if not selected or selected == {"all"}:
+        return list(STACK_DEFINITIONS)
+
+    unknown = sorted(selected - set(STACK_DEFINITIONS))
+    if unknown:
+        raise ValueError(f"Unknown stacks: {', '.join(unknown)} (choose from {', '.join(STACK_DEFINITIONS)})")
+
+    return [env_name for env_name in STACK_DEFINITIONS if env_name in selected]
+
+
+def build_stack(scope: Construct, env_name: str, props: Any, **kwargs) -> Stack:
+    """指定された基盤のスタックを作成する.
+
+    Args:
+        scope: スタックを追加する App
+        env_name: 基盤名 (例: "parkings")
+        props: 基盤固有のパラメータ (例: ParkingsServiceParameter)
+        **kwargs: スタックに渡す追加の引数
+
+    Returns:
+        作成したスタック
+
+    """
+    definition = STACK_DEFINITIONS[env_name]
+    stack_class = definition.load_class()
+    return stack_class(
+        scope,
+        definition.stack_id,
+        props=props,
+        env={"account": props.account_id, "region": props.region},
+        **kwargs,
+    )
@@ -0,0 +1,83 @@
+import os
+import shutil
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+import aws_cdk as cdk
+
+from src.common.aspects.template_budget_aspect import TemplateBudgetAspect
+from src.common.synth.lookup_cache import find_missing_lookups
+from src.common.synth.stack_registry import build_stack
+
+
+@dataclass
+class StackSynthResult:
+    """スタック単体の synth 結果."""
+
+    env_name: str
+    outdir: str
+    elapsed_ms: float
+    missing_lookups: List[str] = field(default_factory=list)
+    budget_violations: List[str] = field(default_factory=list)
+    # スタックが参照するローカルのアセット (Lambda のソース等) のパス
+    asset_dirs: List[str] = field(default_factory=list)
+
+
+def local_asset_paths(app: cdk.App, root: str = ".") -> List[str]:
+    """App 内のアセットのステージング元のうち、root 配下のパスを返す.
+
+    Construct がアセットを追加・変更した場合も synth 結果から取得するため、スタック定義への登録は不要。
+    aws-cdk-lib 内のアセット (カスタムリソースのプロバイダー等) は aws-cdk-lib のバージョンで判定するため含めない。
+    """
+    root_path = os.path.abspath(root)
+    paths = set()
+    for node in app.node.find_all():
+        if isinstance(node, cdk.AssetStaging):
+            source_path = os.path.abspath(node.source_path)
+            if os.path.commonpath([root_path, source_path]) == root_path:
+                paths.add(os.path.relpath(source_path, root_path))
+    return sorted(paths)
+
+
+def synth_stack(
+    env_name: str,
+    props: Any,
+    outdir: str,
+    context: Optional[Dict[str, Any]] = None,
+    template_budget: Any = None,
+) -> StackSynthResult:
+    """1スタックのみを含む App を生成し、outdir にクラウドアセンブリを出力する.
+
+    Args:
+        env_name: 基盤名 (例: "parkings")
+        props: 基盤固有のパラメータ
+        outdir: クラウドアセンブリの出力先 (既存の内容は削除する)
+        context: App に渡すコンテキスト (CDK CLI 経由の場合は CDK_CONTEXT_JSON も併せて読み込まれる)
+        template_budget: テンプレート予算 (config.TemplateBudgetParameter)。None の場合は判定しない
+
+    Returns:
+        StackSynthResult
+
+    """
+    start = time.perf_counter()
+    shutil.rmtree(outdir, ignore_errors=True)
+    os.makedirs(outdir)
+
+    app = cdk.App(outdir=outdir, context=context)
+    build_stack(app, env_name, props)
+
+    template_budget_aspect = None
+    if template_budget is not None:
+        template_budget_aspect = TemplateBudgetAspect(template_budget)
+        cdk.Aspects.of(app).add(template_budget_aspect)
+
+    app.synth()
+    return StackSynthResult(
+        env_name=env_name,
+        outdir=outdir,
+        elapsed_ms=(time.perf_counter() - start) * 1000,
+        missing_lookups=find_missing_lookups(outdir),
+        budget_violations=template_budget_aspect.write_report(outdir) if template_budget_aspect else [],
+        asset_dirs=local_asset_paths(app),
+    )
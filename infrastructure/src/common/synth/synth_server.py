@@ -0,0 +1,171 @@
+"""Python インタプリタと jsii カーネルを起動したまま、変更のあったスタックのみを再 synth するサーバ.
+
+`src/` と `config/` を監視し、変更されたファイルに依存するスタックのみを再 synth して cdk.out にマージする。
+別ターミナルで `cdk diff --app cdk.out` 等を実行することで、毎回の synth を待たずに差分を確認できる。
+
+    python3 -m src.common.synth.synth_server --phase DEV [--stacks parkings,auth]
+"""
+
+import argparse
+import importlib
+import json
+import os
+import shutil
+import sys
+import time
+import traceback
+from typing import Dict, List
+
+from src.common.synth.app_context import load_cdk_json_context
+from src.common.synth.assembly import merge_assemblies
+from src.common.synth.dependencies import stack_source_files
+from src.common.synth.lookup_cache import DEFAULT_CDK_CONTEXT_PATH, load_lookup_cache
+from src.common.synth.stack_registry import STACK_DEFINITIONS, parse_stack_selection
+from src.common.synth.stack_synth import synth_stack
+
+# 監視対象のディレクトリ
+WATCH_DIRS = ("src", "config")
+# スタックごとのクラウドアセンブリの出力先
+WORK_DIR = os.path.join(".cdk.local", "synth")
+# 再読み込みの対象外とするモジュール (サーバ自身)
+RELOAD_EXCLUDED_PREFIXES = ("src.common.synth", "src.common.aspects")
+
+
+#########################
+#      ヘルパー関数       #
+#########################
+def snapshot_mtimes(dirs=WATCH_DIRS) -> Dict[str, float]:
+    """監視対象のファイルパスと更新日時の辞書を返す."""
+    mtimes = {}
+    for watch_dir in dirs:
+        for dirpath, dirnames, filenames in os.walk(watch_dir):
+            dirnames[:] = [name for name in dirnames if name != "__pycache__"]
+            for name in filenames:
+                if name.endswith(".pyc"):
+                    continue
+                path = os.path.normpath(os.path.join(dirpath, name))
+                mtimes[path] = os.stat(path).st_mtime
+    return mtimes
+
+
+def changed_files(before: Dict[str, float], after: Dict[str, float]) -> List[str]:
+    """追加・更新・削除されたファイルのパスを返す."""
+    return sorted(path for path in before.keys() | after.keys() if before.get(path) != after.get(path))
+
+
+def reload_local_modules() -> None:
+    """src / config 配下のモジュールを sys.modules から削除し、次回の import で再読み込みさせる.
+
+    aws_cdk 等の外部モジュールと jsii カーネルは起動したまま維持される。
+    """
+    for name in list(sys.modules):
+        if name.split(".")[0] in ("src", "config") and not name.startswith(RELOAD_EXCLUDED_PREFIXES):
+            del sys.modules[name]
+
+
+def load_server_context(phase: str) -> Dict[str, object]:
+    """CDK CLI が App に渡すコンテキスト (cdk.json, cdk.context.json) とルックアップキャッシュを読み込む."""
+    # CDK CLI と同じく、ルックアップキャッシュ < cdk.json < cdk.context.json の順に優先する
+    context = {**load_lookup_cache(), **load_cdk_json_context()}
+    if os.path.exists(DEFAULT_CDK_CONTEXT_PATH):
+        with open(DEFAULT_CDK_CONTEXT_PATH, encoding="utf-8") as f:
+            context.update(json.load(f))
+    context["phase"] = phase
+    return context
+
+
+class SynthServer:
+    """変更されたスタックのみを再 synth するサーバ."""
+
+    def __init__(self, phase: str, env_names: List[str], outdir: str, interval: float) -> None:
+        self.phase = phase
+        self.env_names = env_names
+        self.outdir = outdir
+        self.interval = interval
+        self.context = load_server_context(phase)
+        # スタックごとの、直近の synth で参照したアセットのパス
+        self.asset_dirs: Dict[str, List[str]] = {}
+
+    def affected_stacks(self, files: List[str]) -> List[str]:
+        """変更されたファイルに依存するスタックの基盤名を返す."""
+        changed = set(files)
+        affected = []
+        for env_name in self.env_names:
+            source_files = stack_source_files(STACK_DEFINITIONS[env_name], asset_dirs=self.asset_dirs.get(env_name, ()))
+            if changed & set(source_files):
+                affected.append(env_name)
+        return affected
+
+    def synth(self, env_names: List[str]) -> None:
+        """指定されたスタックを再 synth し、対象スタック全体を cdk.out にマージする."""
+        start = time.perf_counter()
+        try:
+            # config も再読み込みされるため、都度パラメータを生成し直す
+            config = importlib.import_module("config.config")
+            props = getattr(config, f"{self.phase}_ACCOUNTS_PARAMS").resolve(env_names)
+            for env_name in env_names:
+                result = synth_stack(
+                    env_name,
+                    props[env_name],
+                    outdir=os.path.join(WORK_DIR, env_name),
+                    context=self.context,
+                    template_budget=config.TEMPLATE_BUDGET,
+                )
+                self.asset_dirs[env_name] = result.asset_dirs
+                print(f"  {STACK_DEFINITIONS[env_name].stack_id}: {result.elapsed_ms:.0f} ms", file=sys.stderr)
+                for message in result.budget_violations:
+                    print(f"  Warning: [TemplateBudget] {message}", file=sys.stderr)
+                if result.missing_lookups:
+                    print(f"  Warning: {len(result.missing_lookups)} lookup(s) missing from the lookup cache", file=sys.stderr)
+
+            shutil.rmtree(self.outdir, ignore_errors=True)
+            merge_assemblies([os.path.join(WORK_DIR, env_name) for env_name in self.env_names], self.outdir)
+        except Exception:
+            traceback.print_exc()
+            print("Synth failed. Waiting for changes...", file=sys.stderr)
+            return
+        print(f"Synthesized {', '.join(env_names)} in {(time.perf_counter() - start) * 1000:.0f} ms", file=sys.stderr)
+
+    def run(self) -> None:
+        """初回に全対象スタックを synth し、以降はファイルの変更を監視する."""
+        print(f"Synthesizing {', '.join(self.env_names)} ...", file=sys.stderr)
+        self.synth(self.env_names)
+        mtimes = snapshot_mtimes()
+        print(f"Watching {', '.join(WATCH_DIRS)} (Ctrl+C to stop)", file=sys.stderr)
+
+        while True:
+            time.sleep(self.interval)
+            current = snapshot_mtimes()
+            files = changed_files(mtimes, current)
+            if not files:
+                continue
+            mtimes = current
+
+            reload_local_modules()
+            targets = self.affected_stacks(files)
+            print(f"Changed: {', '.join(files)}", file=sys.stderr)
+            if targets:
+                self.synth(targets)
+
+
+#########################
+#        CLI            #
+#########################
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="変更されたスタックのみを再 synth する常駐サーバ")
+    parser.add_argument("--phase", default="DEV", help="フェーズ (DEV, STG, PROD)")
+    parser.add_argument("--stacks", default=None, help="対象の基盤名 (カンマ区切り、未指定の場合は全スタック)")
+    parser.add_argument("--outdir", default="cdk.out", help="クラウドアセンブリの出力先")
+    parser.add_argument("--interval", type=float, default=0.5, help="ファイル変更の確認間隔 (秒)")
+    args = parser.parse_args(argv)
+
+    server = SynthServer(args.phase, parse_stack_selection(args.stacks), args.outdir, args.interval)
+    try:
+        server.run()
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
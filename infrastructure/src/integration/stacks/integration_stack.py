@@ -3,6 +3,7 @@ from constructs import Construct
 
 from src.common.constructs.iam_construct import IamConstruct
 from src.common.constructs.network_construct import NetworkConstruct
+from src.common.constructs.service_network_construct import ServiceNetworkConstruct
 from src.common.constructs.artifact_bucket import ArtifactBucketConstruct
 
 # from src.constructs.compute_construct import ComputeConstruct
@@ -45,8 +46,26 @@ class IntegrationStack(Stack):
             project=project,
             env_name=env_name,
             phase=phase,
+            network_param=props.network,
         )
 
+        #########################
+        #    Service Network    #
+        #########################
+        # 基盤間のプライベートな通信 (VPC Lattice)
+        if props.network.service_network:
+            ServiceNetworkConstruct(
+                scope=self,
+                id="ServiceNetworkConstruct",
+                project=project,
+                env_name=env_name,
+                phase=phase,
+                vpc_obj=network_construnt.vpc_obj,  # Conscruct共有リソース
+                account_id=props.account_id,
+                central_account_id=props.central_account_id,
+                service_network_param=props.network.service_network,
+            )
+
         ############################
         #      ArtifactBucket      #
         ############################
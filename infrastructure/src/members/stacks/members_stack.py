@@ -1,10 +1,14 @@
 from aws_cdk import Stack
 from constructs import Construct
 
+from src.common.constructs.aurora_clone_construct import AuroraCloneReaperConstruct
 from src.common.constructs.compute_construct import ComputeConstruct
 from src.common.constructs.database_construct import DatabaseConstruct
 from src.common.constructs.iam_construct import IamConstruct
 from src.common.constructs.network_construct import NetworkConstruct
+from src.common.constructs.service_network_construct import ServiceNetworkConstruct
+from src.common.constructs.performance_insights_construct import PerformanceInsightsCollectorConstruct
+from src.common.constructs.slow_query_construct import SlowQueryPipelineConstruct
 from src.common.constructs.artifact_bucket import ArtifactBucketConstruct
 
 # from src.constructs.compute_construct import ComputeConstruct
@@ -47,12 +51,30 @@ class MembersStack(Stack):
             project=project,
             env_name=env_name,
             phase=phase,
+            network_param=props.network,
         )
 
+        #########################
+        #    Service Network    #
+        #########################
+        # 基盤間のプライベートな通信 (VPC Lattice)
+        if props.network.service_network:
+            ServiceNetworkConstruct(
+                scope=self,
+                id="ServiceNetworkConstruct",
+                project=project,
+                env_name=env_name,
+                phase=phase,
+                vpc_obj=network_construnt.vpc_obj,  # Conscruct共有リソース
+                account_id=props.account_id,
+                central_account_id=props.central_account_id,
+                service_network_param=props.network.service_network,
+            )
+
         ############################
         #      ArtifactBucket      #
         ############################
-        ArtifactBucketConstruct(
+        artifact_bucket_construct = ArtifactBucketConstruct(
             scope=self,
             id="ArtifactBucketConstruct",
             project=project,
@@ -77,7 +99,7 @@ class MembersStack(Stack):
         #########################
         #       Database        #
         #########################
-        DatabaseConstruct(
+        database_construct = DatabaseConstruct(
             scope=self,
             id="DatabaseConstruct",
             project=project,
@@ -85,8 +107,54 @@ class MembersStack(Stack):
             phase=phase,
             vpc_obj=network_construnt.vpc_obj,  # Conscruct共有リソース
             bastion_sg=compute_construnt.bastion_sg,
+            database_param=props.database,
+            # VPC の移行でクラスターが置き換わる場合は、カスタムエンドポイントも作成し直す
+            physical_name_suffix=props.network.cidr_migration.name_suffix if props.network.cidr_migration else "",
         )
 
+        #########################
+        #   Slow Query Pipeline #
+        #########################
+        if props.database.slow_query_log:
+            SlowQueryPipelineConstruct(
+                scope=self,
+                id="SlowQueryPipelineConstruct",
+                project=project,
+                env_name=env_name,
+                phase=phase,
+                log_group=database_construct.postgresql_log_group_obj,
+                bucket_obj=artifact_bucket_construct.bucket_obj,
+                slow_query_param=props.database.slow_query_log,
+            )
+
+        #########################
+        #  Performance Insights #
+        #########################
+        if props.database.performance_insights and props.database.performance_insights.collect_snapshots:
+            PerformanceInsightsCollectorConstruct(
+                scope=self,
+                id="PerformanceInsightsCollectorConstruct",
+                project=project,
+                env_name=env_name,
+                phase=phase,
+                cluster_identifier=database_construct.cluster_obj.cluster_identifier,
+                bucket_obj=artifact_bucket_construct.bucket_obj,
+                pi_param=props.database.performance_insights,
+            )
+
+        #########################
+        #  Aurora Clone Reaper  #
+        #########################
+        if props.database.clone:
+            AuroraCloneReaperConstruct(
+                scope=self,
+                id="AuroraCloneReaperConstruct",
+                project=project,
+                env_name=env_name,
+                phase=phase,
+                database_param=props.database,
+            )
+
 
 #
 #        #########################